@@ -0,0 +1,65 @@
+"""
+Throughput benchmark: Planner.build_plan in a loop vs. Planner.iter_plans
+(Decimal engine and numpy engine).
+
+Run from the repository root:
+    python -m benchmarks.bench_build_plans              # 1k, 100k, 1M inputs
+    python -m benchmarks.bench_build_plans 1000 20000   # custom sizes
+"""
+import random
+import sys
+import time
+
+from src.budget_app.core.models import PlanningInput
+from src.budget_app.core.planner import Planner
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+
+def make_inputs(n: int, seed: int = 42):
+    """Yield n raw (dict) inputs, like records loaded from JSON."""
+    rng = random.Random(seed)
+    names = ["Groceries", "Transportation", "Entertainment", "Dining", "Health", "Gifts"]
+    for _ in range(n):
+        yield {
+            "incomes": [{"name": "Job", "amount": str(rng.randint(1500, 9000))}],
+            "fixed": [
+                {"name": "Rent", "amount": str(rng.randint(500, 2500))},
+                {"name": "Utilities", "amount": f"{rng.randint(50, 300)}.{rng.randint(0, 99):02d}"},
+            ],
+            "variables": [
+                {"name": name, "min_amount": str(rng.randint(0, 300)), "max_amount": str(rng.randint(300, 900)), "priority": rng.choice([10, 100])}
+                for name in names
+            ],
+            "preferences": {"savings_rate_min": 0.1, "round_to": "1.00"},
+        }
+
+
+def bench_single(n: int) -> float:
+    planner = Planner()
+    start = time.perf_counter()
+    for raw in make_inputs(n):
+        planner.build_plan(PlanningInput.model_validate(raw))
+    return n / (time.perf_counter() - start)
+
+
+def bench_batch(n: int, engine: str = "decimal") -> float:
+    planner = Planner()
+    start = time.perf_counter()
+    for _ in planner.iter_plans(make_inputs(n), engine = engine):
+        pass
+    return n / (time.perf_counter() - start)
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or DEFAULT_SIZES
+    print(f"{'inputs':>10} {'build_plan/s':>14} {'iter_plans/s':>14} {'numpy/s':>10} {'speedup':>8}")
+    for n in sizes:
+        single = bench_single(n)
+        batch = bench_batch(n)
+        vector = bench_batch(n, engine = "numpy")
+        print(f"{n:>10} {single:>14.0f} {batch:>14.0f} {vector:>10.0f} {max(batch, vector) / single:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,51 @@
+"""
+merge_with_defaults: rebuilding the default input per call vs. the cached template.
+
+Run from the repository root:
+    python -m benchmarks.bench_defaults            # 100k partial inputs
+    python -m benchmarks.bench_defaults 20000
+"""
+import random
+import sys
+import time
+
+from src.budget_app.core.defaults import merge_with_defaults, starter_input
+from src.budget_app.core.models import PlanningInput
+
+
+def make_partials(n: int, seed: int = 7):
+    """Partial inputs as the UI/JSON loaders send them: a few sections, the rest defaulted."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        partial = {"incomes": [{"name": "Job", "amount": str(rng.randint(1500, 9000))}]}
+        if rng.random() < 0.3:
+            partial["fixed"] = [{"name": "Rent", "amount": str(rng.randint(500, 2500))}]
+        if rng.random() < 0.2:
+            partial["preferences"] = {"savings_rate_min": rng.choice([0.05, 0.1, 0.2]), "round_to": "1.00"}
+        out.append(partial)
+    return out
+
+
+def merge_before(partial: dict) -> PlanningInput:
+    """The previous implementation: build and dump the starter input on every call."""
+    base = starter_input().model_dump()
+    return PlanningInput.model_validate({**base, **partial})
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 100_000
+    partials = make_partials(n)
+    merge_with_defaults({})  # build the template outside the timing
+
+    print(f"{'merge x' + str(n):>16} {'seconds':>8} {'us/merge':>9}")
+    for label, merge in [("before", merge_before), ("cached template", merge_with_defaults)]:
+        start = time.perf_counter()
+        for p in partials:
+            merge(p)
+        elapsed = time.perf_counter() - start
+        print(f"{label:>16} {elapsed:>8.2f} {elapsed / n * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,55 @@
+"""
+Plan export formats: write speed, file size and read-back time.
+
+Run from the repository root:
+    python -m benchmarks.bench_export            # 20k plans
+    python -m benchmarks.bench_export 100000
+"""
+import csv
+import gzip
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_build_plans import make_inputs
+from src.budget_app.core.planner import Planner
+from src.budget_app.utils.export import read_plans_table, write_plans_columnar, write_plans_csv
+
+
+def _read_csv(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding = "utf-8", newline = "") as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+
+def _read_columnar(path):
+    table = read_plans_table(path)
+    table.column("allocated_cents").to_numpy().sum()  # touch the data
+    return table.num_rows
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 20_000
+    results = Planner().build_plans(make_inputs(n))
+
+    print(f"{str(n) + ' plans':>14} {'write s':>8} {'MB':>7} {'read s':>7} {'rows':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, write, read in [
+            ("plans.csv", write_plans_csv, _read_csv),
+            ("plans.csv.gz", write_plans_csv, _read_csv),
+            ("plans.parquet", write_plans_columnar, _read_columnar),
+            ("plans.arrow", write_plans_columnar, _read_columnar),
+        ]:
+            path = os.path.join(tmp, name)
+            start = time.perf_counter()
+            write(path, iter(results))
+            written = time.perf_counter() - start
+            start = time.perf_counter()
+            rows = read(path)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>14} {written:>8.2f} {os.path.getsize(path) / 1e6:>7.2f} {elapsed:>7.2f} {rows:>9}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,42 @@
+"""
+Streaming import benchmark: write N JSON Lines records, then import them with
+utils.importer.iter_inputs and report rows/second and peak memory.
+
+Run from the repository root:
+    python -m benchmarks.bench_import              # 1M records
+    python -m benchmarks.bench_import 100000
+"""
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_build_plans import make_inputs
+from src.budget_app.utils.importer import ImportReport, iter_inputs
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "inputs.jsonl")
+        with open(path, "w", encoding = "utf-8") as f:
+            for i, raw in enumerate(make_inputs(n)):
+                raw["id"] = i
+                f.write(json.dumps(raw) + "\n")
+        before_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        report = ImportReport()
+        start = time.perf_counter()
+        for _ in iter_inputs(path, report = report, compact = True):
+            pass
+        elapsed = time.perf_counter() - start
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{report.imported:,} records in {elapsed:.1f}s ({report.imported / elapsed:,.0f}/s), "
+          f"{report.failed} failed, peak RSS {peak_mb:.0f} MB (before import {before_mb:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,49 @@
+"""
+Micro-benchmarks: Money vs. FastMoney for the operations Planner uses,
+plus a full build_plan run on each type.
+
+Run from the repository root:
+    python -m benchmarks.bench_money
+"""
+import timeit
+
+from benchmarks.bench_build_plans import make_inputs
+from src.budget_app.core.models import PlanningInput
+from src.budget_app.core.planner import Planner
+from src.budget_app.utils.money import FastMoney, Money, step_rounding
+
+NUMBER = 200_000
+
+
+def _cases(cls):
+    a, b, step = cls("1234.56"), cls("78.90"), cls("1.00")
+    rounding = step_rounding(cls("5.00"), cls)
+    return {
+        "construct(str)": lambda: cls("1234.56"),
+        "add": lambda: a + b,
+        "sub": lambda: a - b,
+        "compare": lambda: a > b,
+        "quantize_to_step": lambda: a.quantize_to_step(step),
+        "round2": lambda: a.round2(),
+        "StepRounding(5)": lambda: rounding.round(a),
+    }
+
+
+def main():
+    print(f"{'operation':>18} {'Money ns/op':>12} {'FastMoney ns/op':>16} {'speedup':>8}")
+    slow, fast = _cases(Money), _cases(FastMoney)
+    for name in slow:
+        t_slow = timeit.timeit(slow[name], number = NUMBER) / NUMBER * 1e9
+        t_fast = timeit.timeit(fast[name], number = NUMBER) / NUMBER * 1e9
+        print(f"{name:>18} {t_slow:>12.0f} {t_fast:>16.0f} {t_slow / t_fast:>7.2f}x")
+
+    inputs = [PlanningInput.model_validate(raw) for raw in make_inputs(2_000)]
+    for cls in (Money, FastMoney):
+        planner = Planner(money = cls)
+        elapsed = timeit.timeit(lambda: [planner.build_plan(d) for d in inputs], number = 1)
+        print(f"build_plan on {cls.__name__:>9}: {len(inputs) / elapsed:>8.0f} plans/s, "
+              f"{planner.total_roundings / planner.plans_built:.1f} roundings/plan")
+
+
+if __name__ == "__main__":
+    main()
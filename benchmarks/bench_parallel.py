@@ -0,0 +1,36 @@
+"""
+Scaling benchmark for ParallelPlanner: plans/second by worker count.
+
+Run from the repository root:
+    python -m benchmarks.bench_parallel                 # 200k inputs, 1..cpu_count workers
+    python -m benchmarks.bench_parallel 50000 1000      # inputs, chunk size
+"""
+import os
+import sys
+import time
+
+from benchmarks.bench_build_plans import make_inputs
+from src.budget_app.core.parallel import ParallelPlanner
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 200_000
+    chunk_size = int(argv[1]) if len(argv) > 1 else 1_000
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, 32, cpus} & set(range(1, cpus + 1)))
+
+    base = None
+    print(f"{'workers':>8} {'plans/s':>10} {'scaling':>8}  per-worker plans/s")
+    for workers in counts:
+        runner = ParallelPlanner(workers = workers, chunk_size = chunk_size, engine = "numpy")
+        start = time.perf_counter()
+        for _ in runner.run(make_inputs(n)):
+            pass
+        rate = n / (time.perf_counter() - start)
+        base = base or rate
+        per_worker = ", ".join(f"{s.plans_per_second:.0f}" for s in runner.stats.values())
+        print(f"{workers:>8} {rate:>10.0f} {rate / base:>7.2f}x  {per_worker}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+"""
+Bulk PDF statements: per-plan document setup (as the export dialog did) vs. the
+shared-style exporters, in pages per second.
+
+Run from the repository root:
+    python -m benchmarks.bench_pdf            # 500 plans
+    python -m benchmarks.bench_pdf 2000 4     # 2000 plans, 4 worker processes
+"""
+import os
+import sys
+import tempfile
+import time
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from benchmarks.bench_build_plans import make_inputs
+from src.budget_app.core.planner import Planner
+from src.budget_app.utils.export import write_plans_pdf, write_plans_pdfs
+
+
+def pdf_before(path, result):
+    """One plan, with a fresh stylesheet and table style, as _export_plan_to_pdf used to."""
+    doc = SimpleDocTemplate(path, pagesize = LETTER)
+    styles = getSampleStyleSheet()
+    story = [Paragraph("FinanceFlow Budget Plan", styles['Title'])]
+    s = result.summary
+    for label, amount in [("Total income", s.total_income), ("Total expenses", s.total_expenses),
+                          ("Savings", s.savings), ("Remaining", s.remaining)]:
+        story.append(Paragraph(f"{label}: ${float(amount):.2f}", styles['Normal']))
+    story.append(Spacer(1, 12))
+    table = Table([["Category", "Kind", "Amount"]] + [[i.category, i.kind, f"${float(i.allocated):.2f}"] for i in result.items], hAlign = 'LEFT')
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#eaeaea")),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+        ('ALIGN', (-1,1), (-1,-1), 'RIGHT'),
+        ('BOTTOMPADDING', (0,0), (-1,0), 8),
+    ]))
+    story.append(table)
+    doc.build(story)
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 500
+    workers = int(argv[1]) if len(argv) > 1 else os.cpu_count() or 1
+    results = Planner().build_plans(make_inputs(n))
+
+    print(f"{str(n) + ' plans':>26} {'seconds':>8} {'pages/s':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        for k, r in enumerate(results):
+            pdf_before(os.path.join(tmp, f"before-{k}.pdf"), r)
+        elapsed = time.perf_counter() - start
+        print(f"{'per-plan setup':>26} {elapsed:>8.2f} {n / elapsed:>8.0f}")
+
+        for label, run in [
+            ("one document", lambda: write_plans_pdf(os.path.join(tmp, "all.pdf"), results)),
+            ("files, 1 process", lambda: write_plans_pdfs(os.path.join(tmp, "one"), results, workers = 1)),
+            (f"files, {workers} workers", lambda: write_plans_pdfs(os.path.join(tmp, "many"), results, workers = workers)),
+        ]:
+            report = run()
+            print(f"{label:>26} {report.seconds:>8.2f} {report.pages_per_second:>8.0f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,35 @@
+"""
+Projection benchmark: 360-month horizons over 10k profiles, streamed.
+
+Run from the repository root:
+    python -m benchmarks.bench_projection                # 10k profiles x 360 months
+    python -m benchmarks.bench_projection 1000 120       # profiles, months
+"""
+import resource
+import sys
+import time
+
+from benchmarks.bench_build_plans import make_inputs
+from src.budget_app.core.models import PlanningInput
+from src.budget_app.core.projection import Projector
+
+
+def main(argv):
+    profiles = int(argv[0]) if argv else 10_000
+    months = int(argv[1]) if len(argv) > 1 else 360
+
+    inputs = (PlanningInput.model_validate(raw) for raw in make_inputs(profiles))
+    start = time.perf_counter()
+    count = 0
+    for _, month in Projector().project_many(inputs, months):
+        count += 1
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is KiB on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{profiles} profiles x {months} months: {count} month-plans in {elapsed:.1f}s "
+          f"({count / elapsed:,.0f}/s), peak RSS {peak_mb:.0f} MB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,59 @@
+"""
+Compact records vs. pydantic models: construction time and memory per plan.
+
+Run from the repository root:
+    python -m benchmarks.bench_records            # 20k plans
+    python -m benchmarks.bench_records 100000
+"""
+import sys
+import time
+import tracemalloc
+
+from benchmarks.bench_build_plans import make_inputs
+from src.budget_app.core.models import PlanningInput
+from src.budget_app.core.planner import Planner
+from src.budget_app.core.records import PlanningInputRecord, PlanResultRecord
+from src.budget_app.utils.money import FastMoney
+
+
+def _measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, elapsed, size
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 20_000
+    models = [PlanningInput.model_validate(raw) for raw in make_inputs(n)]
+    records = [PlanningInputRecord.from_model(d) for d in models]
+    results = Planner().build_plans(models)
+    compact = [PlanResultRecord.from_model(r) for r in results]
+
+    # construction only (fields shared, as at the API boundary)
+    print(f"{'construct x' + str(n):>24} {'seconds':>8}")
+    for label, build in [
+        ("PlanResult (validated)", lambda: [type(r).model_validate(r.model_dump()) for r in results]),
+        ("PlanResult (construct)", lambda: [r.to_model() for r in compact]),
+        ("PlanResultRecord", lambda: [PlanResultRecord.from_model(r) for r in results]),
+    ]:
+        start = time.perf_counter()
+        build()
+        print(f"{label:>24} {time.perf_counter() - start:>8.2f}")
+
+    # full plans: time and memory retained per plan (tracemalloc slows both runs alike)
+    print(f"\n{'planner':>24} {'plans/s':>8} {'bytes/plan':>11}")
+    for label, planner, data in [
+        ("pydantic", Planner(), models),
+        ("compact", Planner(compact = True), records),
+        ("compact + FastMoney", Planner(money = FastMoney, compact = True), records),
+    ]:
+        _, elapsed, size = _measure(lambda: planner.build_plans(data))
+        print(f"{label:>24} {n / elapsed:>8.0f} {size / n:>11.0f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
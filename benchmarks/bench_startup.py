@@ -0,0 +1,43 @@
+"""
+Desktop startup: time from process launch to the first drawn frame.
+
+Each run starts `python -m src.budget_app.app --startup-time`, which
+prints the time and exits after the first frame. The first run uses an empty icon
+cache (SVGs are rasterized), the others a warm one. Needs a display (e.g. run
+under xvfb-run on a headless machine).
+
+Run from the repository root:
+    python -m benchmarks.bench_startup            # 5 runs
+    python -m benchmarks.bench_startup 10
+"""
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+
+def launch(env):
+    proc = subprocess.run(
+        [sys.executable, "-m", "src.budget_app.app", "--startup-time"],
+        env = env, capture_output = True, text = True, timeout = 60,
+    )
+    match = re.search(r"first frame after (\d+) ms", proc.stderr)
+    if match is None:
+        raise RuntimeError(f"the app did not report a first frame:\n{proc.stderr[-2000:]}")
+    return int(match.group(1))
+
+
+def main(argv):
+    runs = int(argv[0]) if argv else 5
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, XDG_CACHE_HOME = cache)
+        print(f"{'run':>10} {'ms':>6}")
+        print(f"{'cold':>10} {launch(env):>6}")
+        warm = sorted(launch(env) for _ in range(runs))
+        print(f"{'warm best':>10} {warm[0]:>6}")
+        print(f"{'warm median':>10} {warm[len(warm) // 2]:>6}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+"""
+Scenario sweeps: one build_plan per grid point vs. ScenarioSweep (decimal and
+numpy engines, and run_many on a process pool).
+
+The grid is savings_rate_min 5%..30% x round_to 1/5/10 x emergency_fund_months 3/6
+(36 scenarios per household).
+
+Run from the repository root:
+    python -m benchmarks.bench_sweep                 # 200 households
+    python -m benchmarks.bench_sweep 1000 large      # size, corpus profile
+"""
+import os
+import sys
+import time
+from itertools import product
+
+from benchmarks.corpus import household_corpus
+from src.budget_app.core.models import PlanningInput
+from src.budget_app.core.planner import Planner
+from src.budget_app.core.sweep import CONSTRAINT_FIELDS, PREFERENCE_FIELDS, ScenarioSweep
+
+GRID = {
+    "savings_rate_min": [0.05, 0.1, 0.15, 0.2, 0.25, 0.3],
+    "round_to": ["1", "5", "10"],
+    "emergency_fund_months": [3, 6],
+}
+
+
+def naive(planner: Planner, sweep: ScenarioSweep, data: PlanningInput) -> None:
+    """The loop a sweep replaces: copy the input per grid point and plan it."""
+    for point in product(*(sweep.values[name] for name in sweep.params)):
+        values = dict(zip(sweep.params, point))
+        prefs = data.preferences.model_copy(update = {k: v for k, v in values.items() if k in PREFERENCE_FIELDS})
+        constraints = data.constraints.model_copy(update = {k: v for k, v in values.items() if k in CONSTRAINT_FIELDS})
+        planner.build_plan(data.model_copy(update = {"preferences": prefs, "constraints": constraints}))
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 200
+    profile = argv[1] if len(argv) > 1 else "mixed"
+    inputs = [PlanningInput.model_validate(raw) for raw in household_corpus(n, profile = profile)]
+    sweep = ScenarioSweep(GRID)
+    vectorized = ScenarioSweep(GRID, engine = "numpy")
+    planner = Planner()
+
+    start = time.perf_counter()
+    for data in inputs:
+        naive(planner, sweep, data)
+    base = time.perf_counter() - start
+
+    print(f"{n} households x {sweep.size} scenarios ({profile})")
+    print(f"{'':>22} {'ms/household':>13} {'speedup':>8}")
+    print(f"{'build_plan per point':>22} {base / n * 1e3:>13.2f} {1:>7.1f}x")
+    runs = [
+        ("sweep (decimal)", lambda: [sweep.run(d) for d in inputs]),
+        ("sweep (numpy)", lambda: [vectorized.run(d) for d in inputs]),
+    ]
+    workers = os.cpu_count() or 1
+    if workers > 1:
+        runs.append((f"run_many ({workers} proc)", lambda: list(sweep.run_many(inputs, workers = workers))))
+    for label, run in runs:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{label:>22} {elapsed / n * 1e3:>13.2f} {base / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,91 @@
+"""
+VariableIndex vs. sorting data.variables on every call, for large category sets.
+
+For each size: the order itself (sort vs. cached index), one edit followed by
+re-ordering (append/remove + sort vs. insert/remove), and a full build_plan
+where the income funds a few hundred categories (so the planner's loops stop
+early and ordering is a large part of the cost).
+
+Run from the repository root:
+    python -m benchmarks.bench_variable_index              # 100, 10k, 100k variables
+    python -m benchmarks.bench_variable_index 1000 50000
+"""
+import random
+import sys
+import time
+
+from src.budget_app.core.models import PlanningInput, VariableExpense
+from src.budget_app.core.planner import Planner
+from src.budget_app.core.variable_index import VariableIndex
+from src.budget_app.utils.money import Money
+
+DEFAULT_SIZES = [100, 10_000, 100_000]
+
+
+def make_input(n: int, seed: int = 3) -> PlanningInput:
+    rng = random.Random(seed)
+    variables = [
+        VariableExpense(
+            name = f"{rng.choice(['Dept', 'team', 'Project', 'ops'])} {i:06d}",
+            min_amount = Money(rng.randint(0, 50)) if rng.random() < 0.5 else None,
+            max_amount = Money(rng.randint(50, 500)),
+            priority = rng.choice([10, 20, 50, 100, 200]),
+        )
+        for i in range(n)
+    ]
+    return PlanningInput.model_construct(
+        incomes = PlanningInput.model_validate({"incomes": [{"name": "Budget", "amount": "50000"}], "fixed": [], "variables": []}).incomes,
+        fixed = [],
+        variables = variables,
+        preferences = PlanningInput.model_fields["preferences"].default,
+        constraints = PlanningInput.model_fields["constraints"].default,
+    )
+
+
+def _per_call(fn, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or DEFAULT_SIZES
+    key = lambda v: (v.priority, v.name.lower())
+    print(f"{'variables':>10} {'':>14} {'sort ms':>9} {'index ms':>9} {'speedup':>8}")
+    for n in sizes:
+        data = make_input(n)
+        number = max(3, 200_000 // n)
+        start = time.perf_counter()
+        index = VariableIndex(data.variables)
+        build = time.perf_counter() - start
+
+        rows = [("order", _per_call(lambda: sorted(data.variables, key = key), number),
+                 _per_call(index.ordered, number))]
+
+        extra = VariableExpense(name = "Dept new", max_amount = Money("100"), priority = 50)
+        as_list = list(data.variables)
+
+        def edit_list():
+            as_list.append(extra)
+            sorted(as_list, key = key)
+            as_list.pop()
+
+        def edit_index():
+            index.insert(extra)
+            index.ordered()
+            index.remove(extra.name)
+        rows.append(("edit + order", _per_call(edit_list, number), _per_call(edit_index, number)))
+
+        planner = Planner()
+        rows.append(("build_plan", _per_call(lambda: planner.build_plan(data), max(3, number // 4)),
+                     _per_call(lambda: planner.build_plan(data, index = index), max(3, number // 4))))
+        assert planner.build_plan(data) == planner.build_plan(data, index = index)
+
+        for label, slow, fast in rows:
+            print(f"{n:>10} {label:>14} {slow * 1e3:>9.3f} {fast * 1e3:>9.3f} {slow / fast:>7.1f}x")
+        print(f"{n:>10} {'(index build)':>14} {'':>9} {build * 1e3:>9.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
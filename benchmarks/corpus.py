@@ -0,0 +1,90 @@
+"""
+Seeded synthetic household corpus for the benchmark suite (benchmarks/suite.py).
+
+The same (n, seed, profile) always gives the same inputs, on any machine and
+Python version (only random.Random's integer/choice API is used), so results
+of different commits are measured on identical data.
+
+Usage:
+    from benchmarks.corpus import household_corpus
+    raw = household_corpus(1000, seed = 1, profile = "family")   # list of dicts
+"""
+import random
+from typing import Dict, List, Tuple
+
+# profile -> (incomes, fixed expenses, variables), each an inclusive (min, max) range
+PROFILES: Dict[str, Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]] = {
+    "single": ((1, 1), (0, 3), (2, 6)),
+    "family": ((1, 3), (3, 8), (6, 15)),
+    "large": ((2, 5), (5, 20), (30, 200)),
+}
+# "mixed" draws each household from the profiles above with these weights
+MIXED_WEIGHTS = {"single": 5, "family": 4, "large": 1}
+
+ROUND_TO = ("0", "0.01", "1.00", "5", "10")
+SAVINGS_RATES = (0, 0.05, 0.1, 0.15, 0.2, 0.3)
+PRIORITIES = (10, 20, 50, 100, 200)
+
+_INCOMES = ("Salary", "Side job", "Rental", "Pension", "Benefits")
+_FIXED = ("Rent", "Mortgage", "Utilities", "Internet", "Phone", "Insurance", "Car loan", "Daycare", "Tuition", "Subscriptions")
+_VARIABLES = ("Groceries", "Transportation", "Entertainment", "Dining", "Health", "Gifts", "Clothing", "Travel", "Hobbies", "Pets", "Books", "Gym")
+
+
+def household(rng: random.Random, profile: str = "mixed") -> dict:
+    """One raw PlanningInput dict (as loaded from JSON)."""
+    if profile == "mixed":
+        names = list(MIXED_WEIGHTS)
+        profile = rng.choices(names, weights = [MIXED_WEIGHTS[p] for p in names])[0]
+    (i_lo, i_hi), (f_lo, f_hi), (v_lo, v_hi) = PROFILES[profile]
+
+    incomes = [
+        {"name": _name(_INCOMES, i), "amount": _amount(rng, 800, 9000)}
+        for i in range(rng.randint(i_lo, i_hi))
+    ]
+    fixed = [
+        {"name": _name(_FIXED, i), "amount": _amount(rng, 10, 2500), "essential": rng.random() < 0.8}
+        for i in range(rng.randint(f_lo, f_hi))
+    ]
+    variables = []
+    for i in range(rng.randint(v_lo, v_hi)):
+        low = rng.choice([None, _amount(rng, 0, 400)])
+        high = rng.choice([None, _amount(rng, 50, 1500), _amount(rng, 50, 1500)])
+        variables.append({
+            "name": _name(_VARIABLES, i),
+            "min_amount": low,
+            "max_amount": high,  # may be below min_amount: the planner caps the floor
+            "priority": rng.choice(PRIORITIES),
+        })
+    return {
+        "incomes": incomes,
+        "fixed": fixed,
+        "variables": variables,
+        "preferences": {"savings_rate_min": rng.choice(SAVINGS_RATES), "round_to": rng.choice(ROUND_TO)},
+    }
+
+
+def household_corpus(n: int, seed: int = 2024, profile: str = "mixed") -> List[dict]:
+    if profile != "mixed" and profile not in PROFILES:
+        raise ValueError(f"Unknown corpus profile {profile!r}; expected 'mixed' or one of {tuple(PROFILES)}")
+    rng = random.Random(seed)
+    return [household(rng, profile) for _ in range(n)]
+
+
+def partial_inputs(n: int, seed: int = 2024) -> List[dict]:
+    """Partial inputs for merge_with_defaults: some sections of a household, the rest defaulted."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        full = household(rng, "single")
+        keys = [k for k in ("fixed", "variables", "preferences") if rng.random() < 0.3]
+        out.append({"incomes": full["incomes"], **{k: full[k] for k in keys}})
+    return out
+
+
+def _name(names: Tuple[str, ...], i: int) -> str:
+    # repeats get a number, so names stay unique within one household
+    return names[i % len(names)] + (f" {i // len(names) + 1}" if i >= len(names) else "")
+
+
+def _amount(rng: random.Random, low: int, high: int) -> str:
+    return f"{rng.randint(low, high)}.{rng.randint(0, 99):02d}"
@@ -0,0 +1,247 @@
+"""
+Benchmark suite: Planner.build_plan / iter_plans, merge_with_defaults, Money
+arithmetic and CSV/PDF export, on the seeded household corpus (benchmarks/corpus.py).
+
+Each case is looped until a sample takes at least MIN_TIME (which also warms
+it up), then sampled 'repeat' times. The median and best time per operation
+are reported and can be saved as JSON and compared with a run of another
+commit. A case is a regression when its best time is slower than the
+baseline's by more than the threshold (the best sample is the one least
+disturbed by other load, as timeit's docs advise); --compare then exits
+with status 1. Compare runs made on the same, otherwise idle machine.
+
+Run from the repository root:
+    python -m benchmarks.suite                                  # full sizes
+    python -m benchmarks.suite --quick --json base.json         # e.g. on the main branch
+    python -m benchmarks.suite --quick --compare base.json      # on the change, 10% threshold
+    python -m benchmarks.suite --only build_plan --threshold 0.05
+"""
+import argparse
+import datetime
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.corpus import household_corpus, partial_inputs
+from src.budget_app.core.defaults import merge_with_defaults
+from src.budget_app.core.models import PlanningInput
+from src.budget_app.core.planner import Planner
+from src.budget_app.utils.export import write_plans_csv, write_plans_pdf
+from src.budget_app.utils.money import FastMoney, Money, step_rounding
+
+SCHEMA = 1
+DEFAULT_THRESHOLD = 0.10
+MIN_TIME = 0.05  # seconds per timed sample
+
+# A case setup returns (operations per run, run) or None when it cannot run here
+Case = Callable[[int, int], Optional[Tuple[int, Callable[[], object]]]]
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str):
+    def register(setup: Case) -> Case:
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# ---------- cases (size = corpus size, seed = corpus seed) ----------
+
+def _inputs(size: int, seed: int, profile: str) -> List[PlanningInput]:
+    return [PlanningInput.model_validate(raw) for raw in household_corpus(size, seed, profile)]
+
+
+def _build_plan_case(profile: str, money = Money, scale: float = 1.0):
+    def setup(size, seed):
+        inputs = _inputs(max(1, int(size * scale)), seed, profile)
+        planner = Planner(money = money)
+        return len(inputs), lambda: [planner.build_plan(d) for d in inputs]
+    return setup
+
+
+for _profile, _scale in (("single", 1.0), ("family", 0.5), ("large", 0.05)):
+    case(f"build_plan/{_profile}")(_build_plan_case(_profile, scale = _scale))
+case("build_plan/mixed/fastmoney")(_build_plan_case("mixed", FastMoney))
+
+
+@case("iter_plans/mixed")
+def _iter_plans(size, seed):
+    raw = household_corpus(size, seed)
+    planner = Planner()
+    return len(raw), lambda: sum(1 for _ in planner.iter_plans(raw))
+
+
+@case("iter_plans/mixed/numpy")
+def _iter_plans_numpy(size, seed):
+    if importlib.util.find_spec("numpy") is None:
+        return None
+    raw = household_corpus(size, seed)
+    planner = Planner()
+    return len(raw), lambda: sum(1 for _ in planner.iter_plans(raw, engine = "numpy"))
+
+
+@case("merge_with_defaults")
+def _merge(size, seed):
+    partials = partial_inputs(size, seed)
+    return len(partials), lambda: [merge_with_defaults(p) for p in partials]
+
+
+def _money_case(money, op: str):
+    def setup(size, seed):
+        values = [money(raw["incomes"][0]["amount"]) for raw in household_corpus(size, seed, "single")]
+        other, rate = money("12.34"), money.from_decimal(0.15)
+        rounding = step_rounding(money("5"), money)
+        run = {
+            "construct": lambda: [money(str(v)) for v in values],
+            "add": lambda: [v + other for v in values],
+            "sub": lambda: [v - other for v in values],
+            "mul": lambda: [v * rate for v in values],
+            "round_step": lambda: [rounding.round(v) for v in values],
+        }[op]
+        return len(values), run
+    return setup
+
+
+for _money in (Money, FastMoney):
+    for _op in ("construct", "add", "sub", "mul", "round_step"):
+        case(f"money/{_money.__name__}/{_op}")(_money_case(_money, _op))
+
+
+# Exports write to os.devnull: the suite measures formatting, not the disk
+
+def _plans(size: int, seed: int):
+    raw = household_corpus(size, seed)
+    return list(range(len(raw))), Planner().build_plans(raw)
+
+
+@case("export/csv")
+def _export_csv(size, seed):
+    ids, results = _plans(size, seed)
+    return len(results), lambda: write_plans_csv(os.devnull, results, ids = ids)
+
+
+@case("export/pdf")
+def _export_pdf(size, seed):
+    if importlib.util.find_spec("reportlab") is None:
+        return None
+    ids, results = _plans(max(1, size // 20), seed)  # ~100x slower per plan than CSV
+    return len(results), lambda: write_plans_pdf(os.devnull, results, ids = ids)
+
+
+# ---------- running ----------
+
+def measure(run: Callable[[], object], ops: int, repeat: int, min_time: float = MIN_TIME) -> Dict[str, float]:
+    """Seconds per operation: 'run' is looped until one sample takes min_time (like timeit's autorange)."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        if time.perf_counter() - start >= min_time:
+            break
+        loops *= 2
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        times.append((time.perf_counter() - start) / (ops * loops))
+    median = statistics.median(times)
+    return {"ops": ops * loops, "median_s": median, "best_s": min(times), "ops_per_s": 1 / median if median else 0.0}
+
+
+def run_suite(size: int = 2000, seed: int = 2024, repeat: int = 5, only: Optional[str] = None, out = sys.stdout) -> dict:
+    results = {}
+    for name, setup in CASES.items():
+        if only and only not in name:
+            continue
+        prepared = setup(size, seed)
+        if prepared is None:
+            print(f"{name:<32} skipped (optional dependency missing)", file = out)
+            continue
+        ops, run = prepared
+        results[name] = r = measure(run, ops, repeat)
+        print(f"{name:<32} {r['median_s'] * 1e6:>11.2f} us/op {r['ops_per_s']:>12.0f} op/s  (best {r['best_s'] * 1e6:.2f})", file = out)
+    return {"schema": SCHEMA, "meta": _meta(size, seed, repeat), "results": results}
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float, float, float, str]]:
+    """
+    (case, baseline best, current best, current/baseline, status) for every
+    case in both runs; status is "regression", "faster" or "ok".
+    """
+    rows = []
+    for name, new in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        ratio = new["best_s"] / old["best_s"] if old["best_s"] else 1.0
+        status = "regression" if ratio > 1 + threshold else "faster" if ratio < 1 / (1 + threshold) else "ok"
+        rows.append((name, old["best_s"], new["best_s"], ratio, status))
+    return rows
+
+
+def _meta(size: int, seed: int, repeat: int) -> dict:
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec = "seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "size": size, "seed": seed, "repeat": repeat,
+    }
+
+
+def _git(*args) -> Optional[str]:
+    try:
+        out = subprocess.run(["git", *args], capture_output = True, text = True, timeout = 10,
+                             cwd = os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() if out.returncode == 0 else None
+
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks.suite", description = __doc__.split("\n\n")[0])
+    parser.add_argument("--size", type = int, default = 2000, help = "households per case (default 2000)")
+    parser.add_argument("--quick", action = "store_true", help = "size 200 (for CI)")
+    parser.add_argument("--seed", type = int, default = 2024)
+    parser.add_argument("--repeat", type = int, default = 5)
+    parser.add_argument("--only", help = "run the cases whose name contains this")
+    parser.add_argument("--json", help = "write the results to this file")
+    parser.add_argument("--compare", metavar = "BASELINE", help = "results JSON of another commit")
+    parser.add_argument("--threshold", type = float, default = DEFAULT_THRESHOLD, help = "allowed slowdown (default 0.10 = 10%%)")
+    args = parser.parse_args(argv)
+    size, repeat = (200 if args.quick else args.size), args.repeat
+
+    current = run_suite(size, args.seed, repeat, args.only)
+    if args.json:
+        with open(args.json, "w", encoding = "utf-8") as f:
+            json.dump(current, f, indent = 2)
+    if not args.compare:
+        return 0
+
+    with open(args.compare, encoding = "utf-8") as f:
+        baseline = json.load(f)
+    if (baseline["meta"]["size"], baseline["meta"]["seed"]) != (size, args.seed):
+        print("warning: baseline was run with a different corpus (size/seed)", file = sys.stderr)
+    rows = compare(baseline, current, args.threshold)
+    print(f"\nvs {(baseline['meta'].get('commit') or 'baseline')[:12]} (threshold {args.threshold:.0%})")
+    for name, old, new, ratio, status in rows:
+        print(f"{name:<32} {old * 1e6:>11.2f} -> {new * 1e6:>11.2f} us/op {ratio - 1:>+8.1%}  {status}")
+    regressions = [r for r in rows if r[4] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
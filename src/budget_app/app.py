@@ -0,0 +1,42 @@
+import argparse
+import sys
+from src.budget_app.ui.startup import PROFILE, report_first_frame
+
+
+def main(argv = None) -> None:
+    """
+    Desktop entry point:
+        python -m src.budget_app.app [--startup-time] [--profile-startup [LOG]]
+
+    --startup-time prints the time from process launch to the first frame, then
+    exits. --profile-startup records import and widget-construction timings from
+    here on (before the UI modules are imported) and writes them at the first
+    frame, to LOG or stderr.
+    """
+    parser = argparse.ArgumentParser(prog = "financeflow")
+    parser.add_argument("--startup-time", action = "store_true", help = "print the time to the first frame and exit")
+    parser.add_argument("--profile-startup", nargs = "?", const = "-", metavar = "LOG",
+                        help = "log import and widget timings at the first frame (default: stderr)")
+    args = parser.parse_args(argv)
+
+    if args.profile_startup:
+        PROFILE.enable()
+    with PROFILE.section("import ui.main_window"):
+        from src.budget_app.ui.main_window import MainWindow
+    with PROFILE.section("MainWindow()"):
+        app = MainWindow()
+
+    log = None
+    if args.profile_startup not in (None, "-"):
+        log = open(args.profile_startup, "w", encoding = "utf-8")
+    if args.startup_time or args.profile_startup:
+        report_first_frame(app, exit_after = args.startup_time, stream = log)
+    try:
+        app.mainloop()
+    finally:
+        if log is not None:
+            log.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
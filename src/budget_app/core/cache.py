@@ -0,0 +1,163 @@
+from __future__ import annotations
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+from src.budget_app.core.models import PlanningInput, PlanResult
+from src.budget_app.core.planner import Planner
+from src.budget_app.utils.money import Money
+
+
+def canonical_digest(data: PlanningInput) -> str:
+    """
+    Stable digest of everything Planner.build_plan reads, and nothing else.
+
+    - variables are taken in the planner's (priority, name) order, so reordering
+      them does not change the digest (ties keep their input order, as in the planner)
+    - incomes only contribute their amounts; they are summed, so their order is
+      ignored when all of them are whole cents
+    - fixed expenses keep their order (it is the order of the fixed PlanItems)
+    - amounts are compared by value ("100" == "100.00")
+    - constraints, income names and FixedExpense.essential are not read by the planner
+    """
+    return hashlib.blake2b(repr(_canonical_form(data)).encode("utf-8"), digest_size = 16).hexdigest()
+
+
+def _canonical_form(data: PlanningInput) -> Tuple:
+    incomes = [_amount(i.amount) for i in data.incomes]
+    if all(not i.amount % Decimal("0.01") for i in data.incomes):
+        incomes.sort()
+    variables = sorted(data.variables, key = lambda v: (v.priority, v.name.lower()))
+    return (
+        _amount(data.preferences.round_to),
+        repr(float(data.preferences.savings_rate_min)),
+        tuple(incomes),
+        tuple((f.name, _amount(f.amount)) for f in data.fixed),
+        tuple((v.name, _amount(v.min_amount), _amount(v.max_amount), v.priority) for v in variables),
+    )
+
+
+def _amount(m: Optional[Decimal]) -> Optional[str]:
+    if m is None:
+        return None
+    return format(Decimal(m).normalize(), "f")
+
+
+class CacheStats:
+    __slots__ = ("hits", "misses", "evictions", "expirations")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self):
+        return (f"CacheStats(hits={self.hits}, misses={self.misses}, "
+                f"evictions={self.evictions}, expirations={self.expirations})")
+
+
+class PlanCache:
+    """
+    Thread-safe LRU of PlanResults keyed by canonical_digest.
+
+    maxsize bounds the number of entries (least recently used go first); ttl, in
+    seconds, bounds how long an entry is served (None = forever).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[float, PlanResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[PlanResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, result = entry
+            if expires_at < self.clock():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return result
+
+    def put(self, key: str, result: PlanResult) -> None:
+        expires_at = self.clock() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last = False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CachingPlanner:
+    """
+    Planner front-end that memoizes results by canonical_digest.
+
+    Lookups go to the in-memory PlanCache, then to the optional persistent cache
+    ('disk', e.g. DiskPlanCache), and only then to the planner. warm_start()
+    preloads the memory cache from disk after a restart.
+
+    Cached PlanResults are shared between callers; treat them as read-only.
+    The persistent cache stores plain PlanResults of Money, so with 'disk' the
+    planner must produce those too (not compact, indexed or FastMoney results),
+    or a result's type would depend on where it was found.
+    """
+
+    def __init__(self, planner: Optional[Planner] = None, cache: Optional[PlanCache] = None, disk = None):
+        planner = planner or Planner()
+        if disk is not None and (planner.compact or planner.indexed or planner.money is not Money):
+            raise ValueError(
+                "A persistent plan cache stores plain PlanResults of Money; "
+                "use Planner() without compact/indexed/breakdown and with the default money class."
+            )
+        self.planner = planner
+        self.cache = cache if cache is not None else PlanCache()
+        self.disk = disk
+
+    def warm_start(self, limit: Optional[int] = None) -> int:
+        return self.disk.warm(self.cache, limit) if self.disk is not None else 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def build_plan(self, data: PlanningInput) -> PlanResult:
+        key = canonical_digest(data)
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+        if self.disk is not None:
+            result = self.disk.get(key)
+        if result is None:
+            result = self.planner.build_plan(data)
+            if self.disk is not None:
+                self.disk.put(key, result)
+        self.cache.put(key, result)
+        return result
+
+    def build_plans(self, inputs: Iterable[Union[PlanningInput, dict]]) -> List[PlanResult]:
+        return [self.build_plan(d if isinstance(d, PlanningInput) else PlanningInput.model_validate(d)) for d in inputs]
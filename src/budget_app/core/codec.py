@@ -0,0 +1,76 @@
+from __future__ import annotations
+from decimal import Decimal
+from typing import Optional, Tuple, Union
+from src.budget_app.core.models import (
+    PlanningInput, Income, FixedExpense, VariableExpense, Preferences, Constraints,
+    PlanItem, PlanSummary, PlanResult,
+)
+from src.budget_app.core.records import PlanItemRecord, PlanSummaryRecord, PlanResultRecord
+from src.budget_app.utils.money import Money
+
+# Inputs and results as plain tuples of str/int/float/bool: cheap to pickle
+# (ParallelPlanner, ScenarioSweep.run_many) and to store as JSON (DiskPlanCache).
+# Amounts are exact Decimal text.
+
+
+def encode_input(data: PlanningInput) -> Tuple:
+    p, c = data.preferences, data.constraints
+    return (
+        tuple((i.name, _s(i.amount)) for i in data.incomes),
+        tuple((f.name, _s(f.amount), f.essential) for f in data.fixed),
+        tuple((v.name, _s(v.min_amount), _s(v.max_amount), v.priority) for v in data.variables),
+        (p.savings_rate_min, _s(p.round_to)),
+        (c.max_housing_ratio, c.emergency_fund_months),
+    )
+
+
+def decode_input(row: Tuple) -> PlanningInput:
+    """Rebuild a PlanningInput from encode_input."""
+    incomes, fixed, variables, prefs, constraints = row
+    return PlanningInput(
+        incomes = [Income(name = n, amount = Money(a)) for n, a in incomes],
+        fixed = [FixedExpense(name = n, amount = Money(a), essential = e) for n, a, e in fixed],
+        variables = [
+            VariableExpense(name = n, min_amount = _m(lo), max_amount = _m(hi), priority = pr)
+            for n, lo, hi, pr in variables
+        ],
+        preferences = Preferences(savings_rate_min = prefs[0], round_to = Money(prefs[1])),
+        constraints = Constraints(max_housing_ratio = constraints[0], emergency_fund_months = constraints[1]),
+    )
+
+
+def encode_result(result: PlanResult) -> Tuple:
+    s = result.summary
+    return (
+        tuple((i.category, i.kind, _s(i.allocated)) for i in result.items),
+        (_s(s.total_income), _s(s.total_expenses), _s(s.savings), _s(s.remaining)),
+    )
+
+
+def decode_result(row: Tuple, money = Money, compact: bool = False) -> Union[PlanResult, PlanResultRecord]:
+    """Rebuild a result from encode_result, as a PlanResult or (compact) a PlanResultRecord."""
+    items, (total_income, total_expenses, savings, remaining) = row
+    if compact:
+        return PlanResultRecord(
+            items = [PlanItemRecord(c, k, money(a)) for c, k, a in items],
+            summary = PlanSummaryRecord(money(total_income), money(total_expenses), money(savings), money(remaining)),
+        )
+    # the validating constructors: cheaper than model_construct for these flat models
+    return PlanResult(
+        items = [PlanItem(category = c, kind = k, allocated = money(a)) for c, k, a in items],
+        summary = PlanSummary(
+            total_income = money(total_income),
+            total_expenses = money(total_expenses),
+            savings = money(savings),
+            remaining = money(remaining),
+        ),
+    )
+
+
+def _s(m: Optional[Decimal]) -> Optional[str]:
+    # Decimal.__str__, not Money.__str__ (which rounds to cents)
+    return None if m is None else Decimal.__str__(m)
+
+
+def _m(s: Optional[str]) -> Optional[Money]:
+    return None if s is None else Money(s)
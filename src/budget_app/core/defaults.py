@@ -1,4 +1,7 @@
 from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 from src.budget_app.core.models import PlanningInput, Income, FixedExpense, VariableExpense, Preferences, Constraints
 from src.budget_app.utils.money import Money
 
@@ -38,11 +41,34 @@ def starter_input() -> PlanningInput:
         constraints = default_constraints(),
     )
 
+@lru_cache(maxsize = 1)
+def default_template() -> Mapping:
+    """
+    Read-only snapshot of starter_input() as plain data (dicts are mappingproxies,
+    lists are tuples), built on first use and shared by every merge.
+    """
+    return _freeze(starter_input().model_dump())
+
+@lru_cache(maxsize = 1)
+def default_input() -> PlanningInput:
+    """Shared PlanningInput built from default_template(); do not modify it (use starter_input() for that)."""
+    return PlanningInput.model_validate(default_template())
+
 def merge_with_defaults(partial: dict) -> PlanningInput:
     """
     Merge user-provided data (from JSON or UI) with defaults,
     so missing sections are filled in automatically.
+
+    Untouched sections are read straight from the frozen template (nothing is
+    dumped or copied); validation builds fresh models, so results never share
+    state with the template or with each other.
     """
-    base = starter_input().model_dump()
-    merged = {**base, **partial}
+    merged = {**default_template(), **partial}
     return PlanningInput.model_validate(merged)
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
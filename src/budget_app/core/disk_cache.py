@@ -0,0 +1,117 @@
+from __future__ import annotations
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from src.budget_app.core.cache import CacheStats, PlanCache
+from src.budget_app.core.models import PlanResult
+from src.budget_app.core.codec import decode_result, encode_result
+from src.budget_app.core.planner import PLANNER_VERSION
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    digest    TEXT NOT NULL,
+    version   TEXT NOT NULL,
+    payload   TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (digest, version)
+);
+CREATE INDEX IF NOT EXISTS plans_last_used ON plans (last_used);
+"""
+
+
+class DiskPlanCache:
+    """
+    PlanResults persisted in a SQLite file, keyed by canonical_digest plus the
+    planner version stamp (entries of other versions are never served).
+
+    Safe for many processes at once: the database runs in WAL mode (readers do not
+    block the writer) and waits up to 'timeout' seconds for locks. Once more than
+    max_entries are stored, the least recently used ones and all entries of other
+    planner versions are deleted (checked every 'evict_every' writes).
+
+    A hit only refreshes the entry's last_used time once it is 'touch_interval'
+    seconds old, so hot entries are read without taking the write lock; the
+    LRU order is exact to within that interval.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 100_000, version: str = PLANNER_VERSION, timeout: float = 10.0, evict_every: int = 256, touch_interval: float = 60.0):
+        os.makedirs(directory, exist_ok = True)
+        self.path = os.path.join(directory, "plans.sqlite3")
+        self.max_entries = max_entries
+        self.version = version
+        self.evict_every = evict_every
+        self.touch_interval = touch_interval
+        self.stats = CacheStats()
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout = timeout, isolation_level = None, check_same_thread = False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM plans WHERE version = ?", (self.version,)).fetchone()[0]
+
+    def get(self, key: str) -> Optional[PlanResult]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload, last_used FROM plans WHERE digest = ? AND version = ?", (key, self.version)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            now = time.time()
+            if now - row[1] >= self.touch_interval:
+                self._db.execute(
+                    "UPDATE plans SET last_used = ? WHERE digest = ? AND version = ?", (now, key, self.version)
+                )
+            self.stats.hits += 1
+        return decode_result(json.loads(row[0]))
+
+    def put(self, key: str, result: PlanResult) -> None:
+        payload = json.dumps(encode_result(result), separators = (",", ":"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO plans (digest, version, payload, last_used) VALUES (?, ?, ?, ?)",
+                (key, self.version, payload, time.time()),
+            )
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                self._evict()
+
+    def evict(self) -> None:
+        with self._lock:
+            self._evict()
+
+    def warm(self, cache: PlanCache, limit: Optional[int] = None) -> int:
+        """Load the most recently used plans into an in-memory cache; returns how many."""
+        limit = min(limit or cache.maxsize, cache.maxsize)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT digest, payload FROM plans WHERE version = ? ORDER BY last_used DESC LIMIT ?",
+                (self.version, limit),
+            ).fetchall()
+        # oldest first, so the most recent end up most recently used in the LRU
+        for key, payload in reversed(rows):
+            cache.put(key, decode_result(json.loads(payload)))
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _evict(self) -> None:
+        with self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            self._db.execute("DELETE FROM plans WHERE version != ?", (self.version,))
+            deleted = self._db.execute(
+                "DELETE FROM plans WHERE rowid IN ("
+                "  SELECT rowid FROM plans ORDER BY last_used DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_entries,),
+            ).rowcount
+        self.stats.evictions += max(deleted, 0)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+from src.budget_app.core.models import PlanningInput, PlanItem, PlanResult, PlanChanges
+from src.budget_app.core.planner import STAGES, Planner, PlanState
+from src.budget_app.core.variable_index import VariableIndex
+
+class IncrementalPlanner:
+    """
+    Re-plans after small edits by resuming Planner's pipeline from the first
+    stage the edit can affect, using the state saved after each earlier stage.
+
+    What each stage reads:
+      totals / fixed  -> incomes, fixed expenses, round_to
+      savings         -> savings_rate_min
+      floors / caps   -> variables
+    Constraints (and income names) are not used by the planner, so editing
+    them reuses the previous plan as-is.
+
+    Usage:
+        inc = IncrementalPlanner()
+        changes = inc.replan(data)      # first call runs the full pipeline
+        changes = inc.replan(edited)    # later calls resume where needed
+        changes.result, changes.changed, changes.removed
+    """
+
+    def __init__(self, planner: Optional[Planner] = None):
+        self.planner = planner or Planner()
+        self._keys: Optional[Tuple] = None
+        self._checkpoints: List[Optional[PlanState]] = [None] * len(STAGES)
+        self._index = VariableIndex()
+        self._result: Optional[PlanResult] = None
+
+    # ---------- public API ----------
+
+    @property
+    def result(self) -> Optional[PlanResult]:
+        return self._result
+
+    def reset(self) -> None:
+        self._keys = None
+        self._result = None
+
+    def replan(self, data: PlanningInput) -> PlanChanges:
+        keys = self._stage_keys(data)
+        start = self._first_changed_stage(keys)
+        previous = self._result
+
+        if start is None:
+            return PlanChanges.model_construct(result = previous, changed = [], removed = [], restarted_at = None)
+
+        if start <= STAGES.index("floors"):
+            self._index = VariableIndex(data.variables)
+        after = STAGES[start - 1] if start > 0 else None
+        state = self._checkpoints[start - 1] if start > 0 else None
+        result = self.planner.resume(data, state, after, index = self._index, checkpoints = self._checkpoints)
+
+        self._keys = keys
+        self._result = result
+        changed, removed = diff_items(previous.items if previous else [], result.items)
+        return PlanChanges.model_construct(result = result, changed = changed, removed = removed, restarted_at = STAGES[start])
+
+    # ---------- helpers ----------
+
+    def _stage_keys(self, data: PlanningInput) -> Tuple:
+        """Immutable snapshot of the inputs each stage group reads."""
+        totals = (
+            data.preferences.round_to,
+            tuple(i.amount for i in data.incomes),
+            tuple((f.name, f.amount) for f in data.fixed),
+        )
+        savings = data.preferences.savings_rate_min
+        variables = tuple((v.name, v.min_amount, v.max_amount, v.priority) for v in data.variables)
+        return totals, savings, variables
+
+    def _first_changed_stage(self, keys: Tuple) -> Optional[int]:
+        if self._keys is None:
+            return 0
+        totals, savings, variables = keys
+        if totals != self._keys[0]:
+            return STAGES.index("totals")
+        if savings != self._keys[1]:
+            return STAGES.index("savings")
+        if variables != self._keys[2]:
+            return STAGES.index("floors")
+        return None
+
+
+def diff_items(old: List[PlanItem], new: List[PlanItem]) -> Tuple[List[PlanItem], List[PlanItem]]:
+    """
+    Compare two item lists by (category, kind, n-th occurrence), since a variable
+    can get one item from the floor pass and one from the cap pass.
+    Returns (new or changed items, removed items).
+    """
+    before = _keyed(old)
+    after = _keyed(new)
+    changed = [item for key, item in after.items() if key not in before or before[key].allocated != item.allocated]
+    removed = [item for key, item in before.items() if key not in after]
+    return changed, removed
+
+
+def _keyed(items: List[PlanItem]) -> Dict[Tuple[str, str, int], PlanItem]:
+    seen: Dict[Tuple[str, str], int] = {}
+    out: Dict[Tuple[str, str, int], PlanItem] = {}
+    for item in items:
+        n = seen.get((item.category, item.kind), 0)
+        seen[(item.category, item.kind)] = n + 1
+        out[(item.category, item.kind, n)] = item
+    return out
@@ -0,0 +1,324 @@
+from __future__ import annotations
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence
+from src.budget_app.core.planner import STAGES as PIPELINE_STAGES
+from src.budget_app.utils.money import money_allocations, start_counting_allocations, stop_counting_allocations
+
+# Planner's pipeline (see Planner's docstring); "summary" builds the PlanResult
+STAGES = PIPELINE_STAGES + ("summary",)
+METRICS = ("seconds", "money_allocations", "roundings", "items")
+
+# 5 buckets per decade from 1 µs to 10 s; counts in powers of two up to ~1M
+SECONDS_BUCKETS = tuple(10 ** (k / 5 - 6) for k in range(36))
+COUNT_BUCKETS = tuple(float(2 ** k) for k in range(21))
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram (Prometheus style: a bucket counts values <= its bound).
+
+    Quantiles are estimated by linear interpolation inside the bucket that holds
+    them, clamped to the observed min/max, so their error is at most one bucket
+    width; count, sum, min and max are exact.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # the last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                low = self.bounds[i - 1] if i > 0 else self.min
+                high = self.bounds[i] if i < len(self.bounds) else self.max
+                low, high = max(low, self.min), min(high, self.max)
+                return low + (high - low) * (rank - seen) / n
+            seen += n
+        return self.max
+
+    def cumulative(self) -> List[int]:
+        """Counts of values <= each bound, then the total (the +Inf bucket)."""
+        out, running = [], 0
+        for n in self.counts:
+            running += n
+            out.append(running)
+        return out
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count, "sum": self.sum, "mean": self.mean,
+            "p50": self.quantile(0.5), "p99": self.quantile(0.99),
+            "max": self.max if self.count else 0.0,
+        }
+
+
+class StageStats:
+    """Histograms of one stage's wall time, Money allocations, roundings and items emitted."""
+
+    __slots__ = ("seconds", "money_allocations", "roundings", "items")
+
+    def __init__(self):
+        self.seconds = Histogram(SECONDS_BUCKETS)
+        self.money_allocations = Histogram(COUNT_BUCKETS)
+        self.roundings = Histogram(COUNT_BUCKETS)
+        self.items = Histogram(COUNT_BUCKETS)
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        return {name: getattr(self, name).as_dict() for name in METRICS}
+
+
+class PlanMetrics:
+    """
+    Opt-in per-stage instrumentation for Planner (decimal engine).
+
+    Attach it to a planner and every plan built records, for each stage it runs,
+    the wall time, the Money objects created (with count_allocations=True), the
+    rounding steps and the items emitted; PlanMetrics aggregates these across
+    calls into histograms (p50/p99 via stats()/snapshot()). A planner without
+    metrics (the default) only pays one attribute check per plan.
+
+    Sinks receive the metrics on flush(), or every flush_every plans: MemorySink,
+    LogSink and PrometheusFileSink below, or any object with emit(metrics).
+
+    Notes:
+      - Money allocations are only counted with count_allocations=True: counting
+        patches Money creation for the whole process while a plan is built, so
+        it is slower in every thread (each thread counts its own objects). Use
+        it for allocation profiling, not alongside timings.
+      - One PlanMetrics can be shared by planners on several threads.
+      - IncrementalPlanner only records the stages it re-runs.
+      - Plans of the numpy engine are built as a batch: they are counted and
+        timed (record_batch), without per-stage stats.
+
+    Usage:
+        metrics = PlanMetrics(sinks = [LogSink()], flush_every = 10_000)
+        planner = Planner(metrics = metrics)
+        ...
+        metrics.stats()["floors"]["seconds"]["p99"]
+    """
+
+    def __init__(self, sinks: Iterable = (), flush_every: int = 0, count_allocations: bool = False):
+        self.sinks = list(sinks)
+        self.flush_every = flush_every
+        self.count_allocations = count_allocations
+        self.plans = 0
+        self.plan_seconds = Histogram(SECONDS_BUCKETS)
+        self.stages: Dict[str, StageStats] = {name: StageStats() for name in STAGES}
+        self._lock = threading.Lock()
+
+    # ---------- public API ----------
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """{stage: {metric: {count, sum, mean, p50, p99, max}}} for the stages seen so far."""
+        with self._lock:
+            return {name: s.as_dict() for name, s in self.stages.items() if s.seconds.count}
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "plans": self.plans,
+                "plan_seconds": self.plan_seconds.as_dict(),
+                "stages": {name: s.as_dict() for name, s in self.stages.items() if s.seconds.count},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.plans = 0
+            self.plan_seconds = Histogram(SECONDS_BUCKETS)
+            self.stages = {name: StageStats() for name in STAGES}
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.emit(self)
+
+    # ---------- Planner hooks ----------
+
+    def begin(self, planner) -> "_PlanProbe":
+        """Called by Planner._run; returns the timed stages for this plan."""
+        probe = planner._probe
+        if probe is None or probe.metrics is not self:
+            probe = planner._probe = _PlanProbe(self, planner)
+        if self.count_allocations:
+            start_counting_allocations()
+        probe.started = time.perf_counter()
+        return probe
+
+    def end(self, probe: "_PlanProbe") -> None:
+        seconds = time.perf_counter() - probe.started
+        if self.count_allocations:
+            stop_counting_allocations()
+        with self._lock:
+            for index, values in probe.laps:
+                stats = self.stages[STAGES[index]]
+                for name, value in zip(METRICS, values):
+                    getattr(stats, name).observe(value)
+            self.plan_seconds.observe(seconds)
+            self.plans += 1
+            flush = self.flush_every and self.plans % self.flush_every == 0
+        probe.laps = []
+        if flush:
+            self.flush()
+
+    def record_batch(self, plans: int, seconds: float) -> None:
+        """
+        Called by Planner for plans built together by the numpy engine: they are
+        counted, and each is observed at seconds / plans; they have no stages.
+        """
+        with self._lock:
+            before = self.plans
+            for _ in range(plans):
+                self.plan_seconds.observe(seconds / plans)
+            self.plans += plans
+            flush = self.flush_every and self.plans // self.flush_every != before // self.flush_every
+        if flush:
+            self.flush()
+
+    def abort(self, probe: "_PlanProbe") -> None:
+        """Called instead of end() when a stage raised: the partial plan is not recorded."""
+        if self.count_allocations:
+            stop_counting_allocations()
+        probe.laps = []
+
+
+class _PlanProbe:
+    """Timed wrappers around one planner's stage methods (kept on the planner, reused)."""
+
+    def __init__(self, metrics: PlanMetrics, planner):
+        self.metrics = metrics
+        self.started = 0.0
+        self.laps: List = []
+        stages = [_TimedStage(self, i, fn) for i, fn in enumerate(planner._stages)]
+        self.stages = tuple(stages)
+        self.summary = _TimedStage(self, len(stages), planner._summary)
+        self.planner = planner
+
+
+class _TimedStage:
+    __slots__ = ("probe", "index", "fn")
+
+    def __init__(self, probe: _PlanProbe, index: int, fn):
+        self.probe = probe
+        self.index = index
+        self.fn = fn
+
+    def __call__(self, state, *args):
+        probe = self.probe
+        items, roundings, allocations = len(state.items), probe.planner._roundings, money_allocations()
+        start = time.perf_counter()
+        out = self.fn(state, *args)
+        seconds = time.perf_counter() - start
+        probe.laps.append((self.index, (
+            seconds, money_allocations() - allocations, probe.planner._roundings - roundings, len(state.items) - items)))
+        return out
+
+
+# ---------- sinks ----------
+
+class MemorySink:
+    """Keeps a snapshot() per flush (the newest is .latest)."""
+
+    def __init__(self, keep: int = 100):
+        self.keep = keep
+        self.snapshots: List[dict] = []
+
+    @property
+    def latest(self) -> Optional[dict]:
+        return self.snapshots[-1] if self.snapshots else None
+
+    def emit(self, metrics: PlanMetrics) -> None:
+        self.snapshots.append(metrics.snapshot())
+        del self.snapshots[:-self.keep]
+
+
+class LogSink:
+    """One log line per flush: plans so far and, per stage, p50/p99 time and mean counts."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger("budget_app.planner")
+        self.level = level
+
+    def emit(self, metrics: PlanMetrics) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, format_line(metrics.snapshot()))
+
+
+class PrometheusFileSink:
+    """
+    Writes the metrics in the Prometheus text format to 'path' (e.g. for the
+    node_exporter textfile collector); the file is replaced atomically.
+    """
+
+    def __init__(self, path: str, prefix: str = "financeflow_planner"):
+        self.path = path
+        self.prefix = prefix
+
+    def emit(self, metrics: PlanMetrics) -> None:
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding = "utf-8") as f:
+            f.write(prometheus_text(metrics, self.prefix))
+        os.replace(tmp, self.path)
+
+
+# ---------- formatting ----------
+
+def format_line(snapshot: dict) -> str:
+    parts = [f"plans={snapshot['plans']}"]
+    for name, s in snapshot["stages"].items():
+        seconds = s["seconds"]
+        parts.append(
+            f"{name}: p50={seconds['p50'] * 1e6:.1f}us p99={seconds['p99'] * 1e6:.1f}us"
+            f" alloc={s['money_allocations']['mean']:.1f} round={s['roundings']['mean']:.1f} items={s['items']['mean']:.1f}"
+        )
+    return " | ".join(parts)
+
+
+def prometheus_text(metrics: PlanMetrics, prefix: str = "financeflow_planner") -> str:
+    with metrics._lock:
+        lines = [
+            f"# HELP {prefix}_plans_total Plans built with instrumentation on.",
+            f"# TYPE {prefix}_plans_total counter",
+            f"{prefix}_plans_total {metrics.plans}",
+            f"# HELP {prefix}_stage_seconds Wall time per pipeline stage.",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        stages = [(name, s) for name, s in metrics.stages.items() if s.seconds.count]
+        for name, s in stages:
+            h = s.seconds
+            for bound, n in zip(h.bounds + (float("inf"),), h.cumulative()):
+                le = "+Inf" if bound == float("inf") else f"{bound:.6g}"
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{le}"}} {n}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {h.sum:.9f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {h.count}')
+        for metric, text in (("money_allocations", "Money objects created"), ("roundings", "Rounding steps"), ("items", "Plan items emitted")):
+            lines.append(f"# HELP {prefix}_stage_{metric}_total {text} per pipeline stage.")
+            lines.append(f"# TYPE {prefix}_stage_{metric}_total counter")
+            for name, s in stages:
+                lines.append(f'{prefix}_stage_{metric}_total{{stage="{name}"}} {int(getattr(s, metric).sum)}')
+    return "\n".join(lines) + "\n"
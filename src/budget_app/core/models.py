@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.budget_app.utils.money import Money
 
 class Income(BaseModel):
@@ -46,3 +46,29 @@ class PlanSummary(BaseModel):
 class PlanResult(BaseModel):
     items: List[PlanItem]
     summary: PlanSummary
+
+class CategoryAllocation(BaseModel):
+    category: str
+    kind: str  # kind of the category's first item
+    allocated: Money  # all items of the category
+    floor: Optional[Money] = None  # variables, with breakdown: from the floor (min_amount) pass
+    top_up: Optional[Money] = None  # variables, with breakdown: from the pass up to the cap
+
+class IndexedPlanResult(PlanResult):
+    # items/summary as in PlanResult, plus:
+    categories: Dict[str, CategoryAllocation]  # one entry per category name, in item order
+    totals: Dict[str, Money]  # allocated per kind: "fixed", "savings", "variable"
+
+class PlanChanges(BaseModel):
+    result: PlanResult
+    changed: List[PlanItem]  # items that are new or whose amount changed
+    removed: List[PlanItem]  # items of the previous plan that no longer exist
+    restarted_at: Optional[str] = None  # first recomputed stage, None if the plan was reused
+
+class ProjectedMonth(BaseModel):
+    month: int  # 1-based
+    plan: PlanResult
+    carryover: Money  # previous month's unallocated remainder, added as income
+    savings_balance: Money  # cumulative savings including this month
+    emergency_fund_target: Money  # emergency_fund_months x essential fixed expenses
+    emergency_fund_met: bool
@@ -0,0 +1,105 @@
+from __future__ import annotations
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from src.budget_app.core.codec import decode_input, decode_result, encode_input, encode_result
+from src.budget_app.core.models import PlanningInput, PlanResult
+from src.budget_app.core.planner import Planner
+from src.budget_app.utils.money import FastMoney, Money
+
+_MONEY_TYPES = {"Money": Money, "FastMoney": FastMoney}
+
+
+class WorkerStats:
+    """Plans built and busy time of one worker process."""
+
+    __slots__ = ("pid", "plans", "seconds")
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.plans = 0
+        self.seconds = 0.0
+
+    @property
+    def plans_per_second(self) -> float:
+        return self.plans / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return f"WorkerStats(pid={self.pid}, plans={self.plans}, plans_per_second={self.plans_per_second:.0f})"
+
+
+class ParallelPlanner:
+    """
+    Runs Planner over a list or stream of inputs on a process pool.
+
+    Planner is pure and deterministic, so inputs are simply sharded into chunks of
+    'chunk_size'. Inputs and results cross the process boundary as plain tuples of
+    str/int/float (see core/codec.py) rather than pickled pydantic
+    models, at most 2 x workers chunks are in flight (bounded memory for streams),
+    and results are yielded in input order.
+
+    Decoding the results is the serial part, in this process: with compact=True
+    they are PlanResultRecords (core/records.py), about twice as cheap to build
+    as validated PlanResults. money is Money or FastMoney.
+
+    Usage:
+        runner = ParallelPlanner(workers = 32, chunk_size = 1000)
+        for result in runner.run(inputs):
+            ...
+        runner.stats  # {pid: WorkerStats}
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 512, engine: str = "decimal", money = Money, compact: bool = False):
+        if _MONEY_TYPES.get(getattr(money, "__name__", None)) is not money:
+            raise ValueError(f"Unsupported money type {money!r}; expected one of {tuple(_MONEY_TYPES)}")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.engine = engine
+        self.money = money.__name__
+        self.compact = compact
+        self.stats: Dict[int, WorkerStats] = {}
+
+    # ---------- public API ----------
+
+    def build_plans(self, inputs: Iterable[Union[PlanningInput, dict]]) -> List[PlanResult]:
+        return list(self.run(inputs))
+
+    def run(self, inputs: Iterable[Union[PlanningInput, dict]]) -> Iterator[PlanResult]:
+        self.stats = {}
+        it = iter(inputs)
+        with ProcessPoolExecutor(max_workers = self.workers) as pool:
+            pending = deque()
+            while True:
+                while len(pending) < 2 * self.workers:
+                    chunk = list(islice(it, self.chunk_size))
+                    if not chunk:
+                        break
+                    payload = [x if isinstance(x, dict) else encode_input(x) for x in chunk]
+                    pending.append(pool.submit(_plan_chunk, payload, self.engine, self.money))
+                if not pending:
+                    return
+                pid, seconds, encoded = pending.popleft().result()
+                stats = self.stats.setdefault(pid, WorkerStats(pid))
+                stats.plans += len(encoded)
+                stats.seconds += seconds
+                money = _MONEY_TYPES[self.money]
+                for row in encoded:
+                    yield decode_result(row, money, self.compact)
+
+
+# ---------- worker side ----------
+
+_WORKER_PLANNERS: Dict[str, Planner] = {}
+
+
+def _plan_chunk(payload: List[Union[Tuple, dict]], engine: str, money: str) -> Tuple[int, float, List[Tuple]]:
+    planner = _WORKER_PLANNERS.get(money)
+    if planner is None:
+        planner = _WORKER_PLANNERS[money] = Planner(money = _MONEY_TYPES[money])
+    start = time.perf_counter()
+    inputs = [x if isinstance(x, dict) else decode_input(x) for x in payload]
+    encoded = [encode_result(r) for r in planner.iter_plans(inputs, chunk_size = len(inputs), engine = engine)]
+    return os.getpid(), time.perf_counter() - start, encoded
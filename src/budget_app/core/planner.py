@@ -1,7 +1,65 @@
 from __future__ import annotations
-from typing import List, Dict, Optional, Tuple
-from src.budget_app.core.models import PlanningInput, PlanItem, PlanSummary, PlanResult, VariableExpense
-from src.budget_app.utils.money import Money
+import time
+from decimal import Decimal
+from itertools import islice
+from typing import TYPE_CHECKING, List, Dict, Iterable, Iterator, Optional, Tuple, Type, Union
+from pydantic import TypeAdapter
+from src.budget_app.core.models import PlanningInput, PlanItem, PlanSummary, PlanResult, VariableExpense, CategoryAllocation, IndexedPlanResult
+from src.budget_app.core.records import (
+    PlanningInputRecord, PlanItemRecord, PlanSummaryRecord, PlanResultRecord, CategoryAllocationRecord, IndexedPlanResultRecord,
+)
+from src.budget_app.utils.money import Money, step_rounding
+
+if TYPE_CHECKING:
+    from src.budget_app.core.instrumentation import PlanMetrics
+    from src.budget_app.core.variable_index import VariableIndex
+
+ENGINES = ("decimal", "numpy")
+
+# Pipeline stages, in order (see Planner); checkpoint()/resume() take these names
+STAGES = ("totals", "fixed", "savings", "floors", "caps")
+
+# Bump whenever build_plan can return different results for the same input;
+# persisted caches (core/disk_cache.py) only serve entries of this version.
+PLANNER_VERSION = "1"
+
+_NO_CAP = Money("999999999999.99")
+
+# Validates a whole chunk of raw dicts in one pydantic call (see Planner.iter_plans)
+_INPUT_LIST = TypeAdapter(List[PlanningInput])
+
+class PlanState:
+    """Values carried between pipeline stages (kept per stage by IncrementalPlanner)."""
+
+    __slots__ = (
+        "total_income", "fixed_total", "remaining", "items", "allocated_by_cat",
+        "fixed_allocated", "savings_total", "variable_total", "caps_from",
+    )
+
+    def __init__(self):
+        self.total_income = None
+        self.fixed_total = None
+        self.remaining = None
+        self.items: List[PlanItem] = []
+        self.allocated_by_cat: Dict[str, Money] = {}
+        # running per-kind totals of the items (fixed_allocated only for indexed results)
+        self.fixed_allocated = None
+        self.savings_total = None
+        self.variable_total = None
+        self.caps_from = 0  # index of the first item of the caps stage
+
+    def copy(self) -> "PlanState":
+        other = PlanState()
+        other.total_income = self.total_income
+        other.fixed_total = self.fixed_total
+        other.remaining = self.remaining
+        other.items = list(self.items)
+        other.allocated_by_cat = dict(self.allocated_by_cat)
+        other.fixed_allocated = self.fixed_allocated
+        other.savings_total = self.savings_total
+        other.variable_total = self.variable_total
+        other.caps_from = self.caps_from
+        return other
 
 class Planner:
     """
@@ -13,116 +71,415 @@ class Planner:
       3) Allocate SAVINGS (based on total income * savings_rate_min)
       4) Apply variable FLOORS (min_amount) by priority
       5) Distribute remainder to VARIABLES up to their CAPS (max_amount), by priority
-      6) Build PlanResult (items + summary)
+      6) Build PlanResult (items + summary); per-kind totals are kept while
+         allocating, so the summary does not rescan the items
 
     Notes:
       - All arithmetic uses Money.
-      - Rounding is centralized via user preference round_to.
+      - Rounding is centralized via user preference round_to (one shared
+        StepRounding per step); last_roundings/total_roundings count them.
+      - An instance keeps per-plan counters, so use one Planner per thread.
+      - Per-stage timings/counts are opt-in: Planner(metrics = PlanMetrics())
+        (core/instrumentation.py); without metrics nothing is measured.
       - Deterministic ordering: (priority, name).
       - This version does not emit warnings (your models don't include them).
     """
 
+    def __init__(self, money: Type[Money] = Money, compact: bool = False, metrics: Optional[PlanMetrics] = None, indexed: bool = False, breakdown: bool = False):
+        """
+        money: the Money class used for all arithmetic. FastMoney gives the same
+        results without Money's str() round-trips.
+        compact: emit PlanResultRecords (core/records.py) instead of pydantic models.
+        metrics: a PlanMetrics that records every stage of every plan (numpy-engine
+        plans are counted and timed per batch, without stages).
+        indexed: emit IndexedPlanResults: the items plus one CategoryAllocation per
+        category name (a variable's floor and top-up items merged) and per-kind totals.
+        breakdown: indexed, and variables also carry their floor / top_up parts.
+        """
+        self.money = money
+        self.compact = compact
+        self.indexed = indexed or breakdown
+        self.breakdown = breakdown
+        self.metrics = metrics
+        self._probe = None
+        self._stages = (self._totals, self._fixed, self._savings, self._floors, self._caps)
+        if compact:
+            self._make_item, self._make_summary, self._make_result = PlanItemRecord, PlanSummaryRecord, PlanResultRecord
+        else:
+            # validating constructors, deliberately not model_construct: for these flat
+            # models pydantic-core validation of values that are already Money runs
+            # faster than model_construct's pure-Python field loop (PlanItem ~2.1 vs
+            # ~3.5 us, PlanSummary ~1.9 vs ~3.8 us with pydantic 2.14)
+            self._make_item, self._make_summary, self._make_result = PlanItem, PlanSummary, PlanResult
+        if compact:
+            self._make_entry, self._make_indexed = CategoryAllocationRecord, IndexedPlanResultRecord
+        else:
+            self._make_entry, self._make_indexed = CategoryAllocation, IndexedPlanResult
+        self._zero = money("0")
+        self._no_cap = money(_NO_CAP)
+        self._convert = money is not Money
+        self._rounding = None
+        self._roundings = 0
+        # Rounding counters: last plan built, and cumulative over this instance
+        self.last_roundings = 0
+        self.total_roundings = 0
+        self.plans_built = 0
+
     # ---------- public API ----------
 
-    def build_plan(self, data: PlanningInput) -> PlanResult:
+    def build_plan(self, data: PlanningInput, engine: str = "decimal", index: Optional[VariableIndex] = None) -> PlanResult:
+        """
+        engine="decimal" runs the Money pipeline below; engine="numpy" runs the
+        integer-cent array engine (see core/vectorized.py), which gives the same result.
+        index: a VariableIndex (core/variable_index.py) holding the variables in
+        planner order; it replaces data.variables and skips the per-call sort.
+        """
+        variables = self._variables(data, index)
+        if engine == "numpy":
+            return self._vector_plans([data], [variables])[0]
+        self._check_engine(engine)
+        return self._build(data, variables)
+
+    def build_plans(self, inputs: Iterable[Union[PlanningInput, PlanningInputRecord, dict]], chunk_size: int = 1024, engine: str = "decimal") -> List[PlanResult]:
+        """
+        Batch version of build_plan: one PlanResult per input, in input order.
+        Results are identical to calling build_plan on each input.
+        """
+        return list(self.iter_plans(inputs, chunk_size = chunk_size, engine = engine))
+
+    def iter_plans(self, inputs: Iterable[Union[PlanningInput, PlanningInputRecord, dict]], chunk_size: int = 1024, engine: str = "decimal") -> Iterator[PlanResult]:
+        """
+        Lazy form of build_plans for very large batches.
+
+        Inputs are consumed in chunks: raw dicts in a chunk are validated with a
+        single pydantic call, and the (priority, name) ordering of variables is
+        computed once per distinct variable layout and reused across the batch.
+        With engine="numpy" each chunk is allocated as one set of cent matrices.
+        """
+        vector = engine == "numpy"
+        if vector:
+            self._vector_engine()  # fails early without numpy
+        else:
+            self._check_engine(engine)
+        orders: Dict[Tuple[Tuple[int, str], ...], Tuple[int, ...]] = {}
+        it = iter(inputs)
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                return
+            validated = self._validate_chunk(chunk)
+            ordered = [self._ordered_variables(data.variables, orders) for data in validated]
+            if vector:
+                yield from self._vector_plans(validated, ordered)
+            else:
+                for data, variables in zip(validated, ordered):
+                    yield self._build(data, variables)
+
+    def checkpoint(self, data: PlanningInput, through: str, index: Optional[VariableIndex] = None) -> PlanState:
+        """
+        Run the stages up to and including 'through' (a STAGES name) and return
+        the state they leave, to finish one or more plans from with resume().
+        These stages are not recorded by metrics, nor counted in plans_built.
+        """
+        stop = self._stage_index(through) + 1
+        variables = self._variables(data, index)
+        self._rounding = step_rounding(data.preferences.round_to, self.money)
+        state = PlanState()
+        for stage in self._stages[:stop]:
+            stage(state, data, variables)
+        return state
+
+    def resume(
+        self, data: PlanningInput, state: Optional[PlanState], after: Optional[str],
+        index: Optional[VariableIndex] = None, checkpoints: Optional[List[Optional[PlanState]]] = None,
+    ) -> PlanResult:
+        """
+        Finish a plan from a checkpoint() taken through stage 'after': runs the
+        later stages on a copy of 'state' (so it can be resumed again). 'data'
+        may differ from the checkpointed input only in what the later stages
+        read, e.g. savings_rate_min or the variables after "fixed" (see
+        core/incremental.py for what each stage reads). after=None runs every
+        stage from a fresh state ('state' is ignored).
+        checkpoints: a list of len(STAGES); checkpoints[i] receives a copy of the
+        state after each stage i run here.
+        """
+        if after is None:
+            start, state = 0, PlanState()
+        else:
+            start, state = self._stage_index(after) + 1, state.copy()
+        return self._run(data, self._variables(data, index), state, start = start, checkpoints = checkpoints)
+
+    # ---------- pipeline ----------
+
+    def _build(self, data: PlanningInput, variables: List[VariableExpense]) -> PlanResult:
+        return self._run(data, variables, PlanState())
+
+    def _run(self, data: PlanningInput, variables: List[VariableExpense], state: PlanState, start: int = 0, checkpoints: Optional[List[PlanState]] = None) -> PlanResult:
+        """
+        Run stages [start, ...) on 'state' (the values left by stage start-1).
+        If given, checkpoints[i] receives a copy of the state after stage i.
+        """
+        self._rounding = step_rounding(data.preferences.round_to, self.money)
+        self._roundings = 0
+
+        metrics = self.metrics
+        if metrics is None:
+            stages, summary = self._stages, self._summary
+        else:
+            probe = metrics.begin(self)
+            stages, summary = probe.stages, probe.summary
+        try:
+            for i in range(start, len(stages)):
+                stages[i](state, data, variables)
+                if checkpoints is not None:
+                    checkpoints[i] = state.copy()
+            result = summary(state, data)
+        except BaseException:
+            if metrics is not None:
+                metrics.abort(probe)
+            raise
+        if metrics is not None:
+            metrics.end(probe)
+
+        self.last_roundings = self._roundings
+        self.total_roundings += self._roundings
+        self.plans_built += 1
+        return result
+
+    def _totals(self, state: PlanState, data: PlanningInput, variables: List[VariableExpense]) -> None:
         # 1) Totals
-        total_income = self._sum(i.amount for i in data.incomes)
-        fixed_total = self._sum(f.amount for f in data.fixed)
+        total_income = self._sum(self._m(i.amount) for i in data.incomes)
+        fixed_total = self._sum(self._m(f.amount) for f in data.fixed)
 
-        total_income = self._round(total_income, data)
-        fixed_total = self._round(fixed_total, data)
+        state.total_income = self._round(total_income, data)
+        state.fixed_total = self._round(fixed_total, data)
 
+    def _fixed(self, state: PlanState, data: PlanningInput, variables: List[VariableExpense]) -> None:
         # 2) Fixed first
         items: List[PlanItem] = []
-        remaining = total_income
+        remaining = state.total_income
+        fixed_allocated = self._zero if self.indexed else None
         for f in data.fixed:
-            amt = self._round(f.amount, data)
-            if amt > Money("0"):
+            amt = self._round(self._m(f.amount), data)
+            if amt > self._zero:
                 items.append(self._item(f.name, "fixed", amt))
+                if fixed_allocated is not None:
+                    fixed_allocated = fixed_allocated + amt
             remaining -= amt
-        remaining = self._floor_zero(self._round(remaining, data))
+        state.items = items
+        state.fixed_allocated = fixed_allocated
+        state.savings_total = state.variable_total = self._zero
+        state.remaining = self._floor_zero(self._round(remaining, data))
 
+    def _savings(self, state: PlanState, data: PlanningInput, variables: List[VariableExpense]) -> None:
         # 3) Savings (target = total_income * savings_rate_min)
         savings_target = self._round(
-            total_income * Money.from_decimal(data.preferences.savings_rate_min), data) if data.preferences.savings_rate_min > 0 else Money("0")
+            state.total_income * self.money.from_decimal(data.preferences.savings_rate_min), data) if data.preferences.savings_rate_min > 0 else self._zero
 
-        savings_alloc = Money("0")
-        if savings_target > Money("0"):
+        savings_alloc = self._zero
+        if savings_target > self._zero:
+            remaining = state.remaining
             if remaining >= savings_target:
                 savings_alloc = savings_target
             else:
                 # allocate whatever remains (can't meet target)
                 savings_alloc = self._floor_zero(remaining)
-            if savings_alloc > Money("0"):
-                items.append(self._item("Savings", "savings", self._round(savings_alloc, data)))
-                remaining = self._floor_zero(self._round(remaining - savings_alloc, data))
+            if savings_alloc > self._zero:
+                amount = self._round(savings_alloc, data)
+                state.items.append(self._item("Savings", "savings", amount))
+                state.savings_total = state.savings_total + amount
+                state.remaining = self._floor_zero(self._round(remaining - savings_alloc, data))
 
+    def _floors(self, state: PlanState, data: PlanningInput, variables: List[VariableExpense]) -> None:
         # 4) Variable floors (min_amount), in priority order
-        variables = sorted(data.variables, key = lambda v: (v.priority, v.name.lower()))
-        allocated_by_cat: Dict[str, Money] = {}
+        allocated_by_cat, remaining = state.allocated_by_cat, state.remaining
 
         for v in variables:
-            if remaining <= Money("0"):
+            if remaining <= self._zero:
                 break
-            floor_amt = v.min_amount or Money("0")
-            if floor_amt > Money("0"):
-                alloc = self._bounded_allocation(floor_amt, v.max_amount, allocated_by_cat.get(v.name, Money("0")), remaining, data)
-                if alloc > Money("0"):
-                    self._add_var(items, allocated_by_cat, v.name, alloc, data)
+            floor_amt = self._m(v.min_amount) or self._zero
+            if floor_amt > self._zero:
+                alloc = self._bounded_allocation(floor_amt, self._m(v.max_amount), allocated_by_cat.get(v.name, self._zero), remaining, data)
+                if alloc > self._zero:
+                    self._add_var(state, v.name, alloc)
                     remaining = self._floor_zero(self._round(remaining - alloc, data))
+        state.remaining = remaining
 
+    def _caps(self, state: PlanState, data: PlanningInput, variables: List[VariableExpense]) -> None:
         # 5) Distribute remainder up to variable caps, still by priority
+        allocated_by_cat, remaining = state.allocated_by_cat, state.remaining
+        state.caps_from = len(state.items)
+
         for v in variables:
-            if remaining <= Money("0"):
+            if remaining <= self._zero:
                 break
-            cap = v.max_amount
-            current = allocated_by_cat.get(v.name, Money("0"))
+            cap = self._m(v.max_amount)
+            current = allocated_by_cat.get(v.name, self._zero)
             room = self._room_left(cap, current)
-            if room <= Money("0"):
+            if room <= self._zero:
                 continue
             add = self._round(min(room, remaining), data)
-            if add > Money("0"):
-                self._add_var(items, allocated_by_cat, v.name, add, data)
+            if add > self._zero:
+                self._add_var(state, v.name, add)
                 remaining = self._floor_zero(self._round(remaining - add, data))
+        state.remaining = remaining
 
+    def _summary(self, state: PlanState, data: PlanningInput) -> PlanResult:
         # 6) Summary
-        variable_total = self._sum(i.allocated for i in items if i.kind == "variable")
-        savings_total = self._sum(i.allocated for i in items if i.kind == "savings")
-        total_expenses = self._round(fixed_total + variable_total, data)
-        remaining = self._floor_zero(self._round(total_income - total_expenses - savings_total, data))
+        variable_total, savings_total = state.variable_total, state.savings_total
+        total_expenses = self._round(state.fixed_total + variable_total, data)
+        remaining = self._floor_zero(self._round(state.total_income - total_expenses - savings_total, data))
 
-        summary = PlanSummary(
-            total_income = total_income,
+        summary = self._make_summary(
+            total_income = state.total_income,
             total_expenses = total_expenses,
             savings = self._round(savings_total, data),
             remaining = remaining,
         )
+        # the result owns a copy, so a checkpointed state can be resumed later
+        items = list(state.items)
+        if self.indexed:
+            totals = {"fixed": state.fixed_allocated, "savings": savings_total, "variable": variable_total}
+            return self._indexed_result(items, summary, totals, state.caps_from)
+        return self._make_result(items = items, summary = summary)
+
+    def _vector_plans(self, inputs: List[PlanningInput], orders: List[List[VariableExpense]]) -> List[PlanResult]:
+        """engine="numpy": allocate in cents (core/vectorized.py), then build the results as _summary does."""
+        metrics = self.metrics
+        started = time.perf_counter() if metrics is not None else 0.0
+        results: List[PlanResult] = []
+        vectorized = 0
+        for data, variables, cents in zip(inputs, orders, self._vector_engine().allocate(inputs, orders)):
+            if cents is None:
+                results.append(self._build(data, variables))  # counted and recorded by _run
+                continue
+            vectorized += 1
+            self.last_roundings = 0  # no Money roundings: amounts are exact multiples of the step
+            results.append(self._cents_result(data, variables, *cents))
+        self.plans_built += vectorized
+        if metrics is not None and vectorized:
+            # one batch: each plan is timed as its share (includes any Decimal fallbacks), no stages
+            metrics.record_batch(vectorized, time.perf_counter() - started)
+        return results
+
+    def _cents_result(self, data: PlanningInput, variables: List[VariableExpense], fixed, savings, floors, caps, total_income, total_expenses, remaining) -> PlanResult:
+        m = self._from_cents
+        items: List[PlanItem] = []
+        fixed_allocated = self._zero
+        for f, cents in zip(data.fixed, fixed):
+            if cents > 0:
+                amount = m(cents)
+                items.append(self._item(f.name, "fixed", amount))
+                fixed_allocated = fixed_allocated + amount
+        if savings > 0:
+            items.append(self._item("Savings", "savings", m(savings)))
+        caps_from = 0
+        variable_total = 0
+        for allocs in (floors, caps):
+            caps_from = len(items)
+            for v, cents in zip(variables, allocs):
+                if cents > 0:
+                    items.append(self._item(v.name, "variable", m(cents)))
+                    variable_total += cents
+        summary = self._make_summary(
+            total_income = m(total_income),
+            total_expenses = m(total_expenses),
+            savings = m(savings),
+            remaining = m(remaining),
+        )
+        if self.indexed:
+            totals = {"fixed": fixed_allocated, "savings": m(savings), "variable": m(variable_total)}
+            return self._indexed_result(items, summary, totals, caps_from)
+        return self._make_result(items = items, summary = summary)
 
-        return PlanResult(items = items, summary = summary)
+    def _indexed_result(self, items: List[PlanItem], summary: PlanSummary, totals: Dict[str, Money], caps_from: int) -> IndexedPlanResult:
+        """One pass over the items: category -> [kind, allocated, floor, top_up], then the entries."""
+        index: Dict[str, list] = {}
+        breakdown = self.breakdown
+        for n, item in enumerate(items):
+            entry = index.get(item.category)
+            if entry is None:
+                entry = index[item.category] = [item.kind, item.allocated, None, None]
+            else:
+                entry[1] = entry[1] + item.allocated
+            if breakdown and item.kind == "variable":
+                part = 3 if n >= caps_from else 2
+                entry[part] = item.allocated if entry[part] is None else entry[part] + item.allocated
+        make = self._make_entry
+        if breakdown:
+            zero = self._zero
+            categories = {
+                name: make(category = name, kind = kind, allocated = amount, floor = floor or zero, top_up = top_up or zero)
+                if kind == "variable" else make(category = name, kind = kind, allocated = amount)
+                for name, (kind, amount, floor, top_up) in index.items()
+            }
+        else:
+            categories = {name: make(category = name, kind = kind, allocated = amount) for name, (kind, amount, _, _) in index.items()}
+        return self._make_indexed(items = items, summary = summary, categories = categories, totals = totals)
 
     # ---------- helpers ----------
 
+    def _vector_engine(self):
+        from src.budget_app.core.vectorized import VectorPlanner
+        return VectorPlanner()
+
+    def _from_cents(self, cents: int) -> Money:
+        return self.money(Decimal(cents).scaleb(-2))
+
+    def _variables(self, data: PlanningInput, index: Optional[VariableIndex]) -> List[VariableExpense]:
+        if index is not None:
+            return index.ordered()
+        return sorted(data.variables, key = lambda v: (v.priority, v.name.lower()))
+
+    def _stage_index(self, name: str) -> int:
+        if name not in STAGES:
+            raise ValueError(f"Unknown pipeline stage {name!r}; expected one of {STAGES}")
+        return STAGES.index(name)
+
+    def _check_engine(self, engine: str) -> None:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown planning engine {engine!r}; expected one of {ENGINES}")
+
+    def _validate_chunk(self, chunk: List[Union[PlanningInput, dict]]) -> List[PlanningInput]:
+        raw = [x for x in chunk if isinstance(x, dict)]
+        if not raw:
+            return chunk
+        validated = iter(_INPUT_LIST.validate_python(raw))
+        return [next(validated) if isinstance(x, dict) else x for x in chunk]
+
+    def _ordered_variables(self, variables: List[VariableExpense], orders: Dict[Tuple[Tuple[int, str], ...], Tuple[int, ...]]) -> List[VariableExpense]:
+        layout = tuple((v.priority, v.name) for v in variables)
+        order = orders.get(layout)
+        if order is None:
+            order = tuple(sorted(range(len(variables)), key = lambda i: (layout[i][0], layout[i][1].lower())))
+            orders[layout] = order
+        return [variables[i] for i in order]
+
     def _item(self, category: str, kind: str, amount: Money) -> PlanItem:
-        return PlanItem(category = category, kind = kind, allocated = amount)
+        return self._make_item(category = category, kind = kind, allocated = amount)
+
+    def _m(self, value: Optional[Money]) -> Optional[Money]:
+        """Adopt an input amount as self.money (a no-op for plain Money)."""
+        if self._convert and value is not None and type(value) is not self.money:
+            return self.money(value)
+        return value
 
     def _sum(self, it) -> Money:
-        return sum(it, Money("0"))
+        return sum(it, self._zero)
 
     def _round(self, m: Money, data: PlanningInput) -> Money:
-        step = data.preferences.round_to
-        if step <= Money("0"):
-            return m
-        return m.quantize_to_step(step)
+        self._roundings += 1
+        return self._rounding.round(m)
 
     def _floor_zero(self, m: Money) -> Money:
-        return m if m > Money("0") else Money("0")
+        return m if m > self._zero else self._zero
 
     def _room_left(self, cap: Optional[Money], current: Money) -> Money:
         if cap is None:
             # No cap → effectively infinite room; let caller min(...) with remaining
-            return Money("999999999999.99")
+            return self._no_cap
         room = cap - current
-        return room if room > Money("0") else Money("0")
+        return room if room > self._zero else self._zero
 
     def _bounded_allocation(self, desired: Money, cap: Optional[Money], current: Money, remaining: Money, data: PlanningInput,) -> Money:
         """
@@ -132,9 +489,11 @@ class Planner:
         add = min(desired, room, remaining)
         return self._round(self._floor_zero(add), data)
 
-    def _add_var(self, items: List[PlanItem], acc: Dict[str, Money], name: str, amount: Money, data: PlanningInput,) -> None:
-        amount = self._round(amount, data)
-        if amount <= Money("0"):
+    def _add_var(self, state: PlanState, name: str, amount: Money) -> None:
+        # amount is already rounded by both callers (rounding is idempotent)
+        if amount <= self._zero:
             return
-        items.append(self._item(name, "variable", amount))
-        acc[name] = acc.get(name, Money("0")) + amount
+        state.items.append(self._item(name, "variable", amount))
+        acc = state.allocated_by_cat
+        acc[name] = acc.get(name, self._zero) + amount
+        state.variable_total = state.variable_total + amount
@@ -0,0 +1,76 @@
+from __future__ import annotations
+import dataclasses
+from typing import Iterable, Iterator, Optional, Tuple, Union
+from src.budget_app.core.models import PlanningInput, Income, ProjectedMonth
+from src.budget_app.core.planner import Planner
+from src.budget_app.core.records import IncomeRecord, PlanningInputRecord
+from src.budget_app.core.variable_index import VariableIndex
+from src.budget_app.utils.money import Money
+
+CARRYOVER = "Carryover"
+
+class Projector:
+    """
+    Rolls a PlanningInput (or PlanningInputRecord) forward month by month.
+
+    Each month is planned with Planner; the unallocated remainder is carried into
+    the next month as an extra "Carryover" income, and savings accumulate toward
+    the emergency fund (Constraints.emergency_fund_months x essential fixed costs).
+
+    Months are yielded one at a time, so long horizons over many profiles never
+    hold more than the current month in memory. Once a month's carryover equals the
+    previous one the plan cannot change any more, and it is reused instead of
+    being rebuilt.
+    """
+
+    def __init__(self, planner: Optional[Planner] = None):
+        self.planner = planner or Planner()
+
+    # ---------- public API ----------
+
+    def project(self, data: Union[PlanningInput, PlanningInputRecord], months: int) -> Iterator[ProjectedMonth]:
+        planner = self.planner
+        index = VariableIndex(data.variables)  # the carryover does not change the variables: order them once
+        target = self._emergency_fund_target(data)
+
+        balance = Money("0")
+        carryover = Money("0")
+        previous: Optional[Tuple[Money, object]] = None
+        for month in range(1, months + 1):
+            if previous is not None and previous[0] == carryover:
+                plan = previous[1]
+            else:
+                plan = planner.build_plan(self._with_carryover(data, carryover), index = index)
+                previous = (carryover, plan)
+            balance = balance + plan.summary.savings
+            yield ProjectedMonth.model_construct(
+                month = month,
+                plan = plan,
+                carryover = carryover,
+                savings_balance = balance,
+                emergency_fund_target = target,
+                emergency_fund_met = balance >= target,
+            )
+            carryover = plan.summary.remaining
+
+    def project_many(self, inputs: Iterable[Union[PlanningInput, PlanningInputRecord]], months: int) -> Iterator[Tuple[int, ProjectedMonth]]:
+        """Project each profile in turn, yielding (profile index, month)."""
+        for index, data in enumerate(inputs):
+            for month in self.project(data, months):
+                yield index, month
+
+    # ---------- helpers ----------
+
+    def _with_carryover(self, data: Union[PlanningInput, PlanningInputRecord], carryover: Money) -> Union[PlanningInput, PlanningInputRecord]:
+        if carryover <= 0:
+            return data
+        incomes = list(data.incomes)
+        if isinstance(data, PlanningInputRecord):
+            incomes.append(IncomeRecord(name = CARRYOVER, amount = carryover))
+            return dataclasses.replace(data, incomes = incomes)
+        incomes.append(Income(name = CARRYOVER, amount = carryover))
+        return data.model_copy(update = {"incomes": incomes})
+
+    def _emergency_fund_target(self, data: Union[PlanningInput, PlanningInputRecord]) -> Money:
+        essential = sum((f.amount for f in data.fixed if f.essential), Money("0"))
+        return (essential * data.constraints.emergency_fund_months).round2()
@@ -0,0 +1,144 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from src.budget_app.core.models import (
+    PlanningInput, Income, FixedExpense, VariableExpense, Preferences, Constraints,
+    PlanItem, PlanSummary, PlanResult, CategoryAllocation, IndexedPlanResult,
+)
+from src.budget_app.utils.money import Money
+
+# Compact, unvalidated counterparts of the pydantic models for bulk runs.
+# They have the same field names, so Planner reads a PlanningInputRecord exactly
+# like a PlanningInput, and Planner(compact = True) emits PlanResultRecords.
+# Conversions share the field values (no copies or re-parsing of amounts):
+# validate at the API boundary with the pydantic models, then convert. Record
+# fields are already typed, so to_model builds with model_construct and does
+# not validate them a second time.
+
+@dataclass(slots = True)
+class IncomeRecord:
+    name: str
+    amount: Money
+
+@dataclass(slots = True)
+class FixedExpenseRecord:
+    name: str
+    amount: Money
+    essential: bool = True
+
+@dataclass(slots = True)
+class VariableExpenseRecord:
+    name: str
+    min_amount: Optional[Money] = None
+    max_amount: Optional[Money] = None
+    priority: int = 100
+
+@dataclass(slots = True)
+class PreferencesRecord:
+    savings_rate_min: float = 0.1
+    round_to: Money = Money("1.00")
+
+@dataclass(slots = True)
+class ConstraintsRecord:
+    max_housing_ratio: float = 0.35
+    emergency_fund_months: float = 3
+
+@dataclass(slots = True)
+class PlanningInputRecord:
+    incomes: List[IncomeRecord]
+    fixed: List[FixedExpenseRecord]
+    variables: List[VariableExpenseRecord]
+    preferences: PreferencesRecord = field(default_factory = PreferencesRecord)
+    constraints: ConstraintsRecord = field(default_factory = ConstraintsRecord)
+
+    @classmethod
+    def from_model(cls, m: PlanningInput) -> "PlanningInputRecord":
+        p, c = m.preferences, m.constraints
+        return cls(
+            incomes = [IncomeRecord(i.name, i.amount) for i in m.incomes],
+            fixed = [FixedExpenseRecord(f.name, f.amount, f.essential) for f in m.fixed],
+            variables = [VariableExpenseRecord(v.name, v.min_amount, v.max_amount, v.priority) for v in m.variables],
+            preferences = PreferencesRecord(p.savings_rate_min, p.round_to),
+            constraints = ConstraintsRecord(c.max_housing_ratio, c.emergency_fund_months),
+        )
+
+    def to_model(self) -> PlanningInput:
+        p, c = self.preferences, self.constraints
+        return PlanningInput.model_construct(
+            incomes = [Income.model_construct(name = i.name, amount = i.amount) for i in self.incomes],
+            fixed = [FixedExpense.model_construct(name = f.name, amount = f.amount, essential = f.essential) for f in self.fixed],
+            variables = [
+                VariableExpense.model_construct(name = v.name, min_amount = v.min_amount, max_amount = v.max_amount, priority = v.priority)
+                for v in self.variables
+            ],
+            preferences = Preferences.model_construct(savings_rate_min = p.savings_rate_min, round_to = p.round_to),
+            constraints = Constraints.model_construct(max_housing_ratio = c.max_housing_ratio, emergency_fund_months = c.emergency_fund_months),
+        )
+
+@dataclass(slots = True)
+class PlanItemRecord:
+    category: str
+    kind: str
+    allocated: Money
+
+@dataclass(slots = True)
+class PlanSummaryRecord:
+    total_income: Money
+    total_expenses: Money
+    savings: Money
+    remaining: Money
+
+@dataclass(slots = True)
+class PlanResultRecord:
+    items: List[PlanItemRecord]
+    summary: PlanSummaryRecord
+
+    @classmethod
+    def from_model(cls, m: PlanResult) -> "PlanResultRecord":
+        s = m.summary
+        return cls(
+            items = [PlanItemRecord(i.category, i.kind, i.allocated) for i in m.items],
+            summary = PlanSummaryRecord(s.total_income, s.total_expenses, s.savings, s.remaining),
+        )
+
+    def to_model(self) -> PlanResult:
+        s = self.summary
+        return PlanResult.model_construct(
+            items = [PlanItem.model_construct(category = i.category, kind = i.kind, allocated = i.allocated) for i in self.items],
+            summary = PlanSummary.model_construct(
+                total_income = s.total_income,
+                total_expenses = s.total_expenses,
+                savings = s.savings,
+                remaining = s.remaining,
+            ),
+        )
+
+@dataclass(slots = True)
+class CategoryAllocationRecord:
+    category: str
+    kind: str
+    allocated: Money
+    floor: Optional[Money] = None
+    top_up: Optional[Money] = None
+
+@dataclass(slots = True)
+class IndexedPlanResultRecord(PlanResultRecord):
+    categories: Dict[str, CategoryAllocationRecord]
+    totals: Dict[str, Money]
+
+    @classmethod
+    def from_model(cls, m: IndexedPlanResult) -> "IndexedPlanResultRecord":
+        base = PlanResultRecord.from_model(m)
+        categories = {
+            name: CategoryAllocationRecord(c.category, c.kind, c.allocated, c.floor, c.top_up)
+            for name, c in m.categories.items()
+        }
+        return cls(items = base.items, summary = base.summary, categories = categories, totals = dict(m.totals))
+
+    def to_model(self) -> IndexedPlanResult:
+        base = PlanResultRecord.to_model(self)
+        categories = {
+            name: CategoryAllocation.model_construct(category = c.category, kind = c.kind, allocated = c.allocated, floor = c.floor, top_up = c.top_up)
+            for name, c in self.categories.items()
+        }
+        return IndexedPlanResult.model_construct(items = base.items, summary = base.summary, categories = categories, totals = dict(self.totals))
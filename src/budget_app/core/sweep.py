@@ -0,0 +1,190 @@
+from __future__ import annotations
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from itertools import islice, product
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union
+from src.budget_app.core.codec import decode_input, encode_input
+from src.budget_app.core.models import PlanningInput, Preferences, Constraints
+from src.budget_app.core.planner import ENGINES, Planner, PlanState
+from src.budget_app.core.variable_index import VariableIndex
+from src.budget_app.utils.money import FastMoney, Money
+
+PREFERENCE_FIELDS = tuple(Preferences.model_fields)
+CONSTRAINT_FIELDS = tuple(Constraints.model_fields)
+
+# Columns after the swept parameters, in ScenarioTable rows
+OUTCOMES = (
+    "total_income", "total_expenses", "savings", "remaining",
+    "funded_variables",          # variable categories that received money
+    "emergency_fund_target",     # emergency_fund_months x essential fixed costs (as in Projector)
+    "months_to_emergency_fund",  # at this plan's savings; None if it saves nothing
+    "housing_ok",                # housing fixed costs / income <= max_housing_ratio; None without 'housing'
+)
+
+
+class ScenarioTable:
+    """
+    Outcomes of a sweep: one row per grid point, in itertools.product order (the
+    last parameter varies fastest). Rows are plain tuples, the swept values
+    followed by OUTCOMES, so large tables stay small and pickle cheaply.
+    """
+
+    __slots__ = ("params", "columns", "rows")
+
+    def __init__(self, params: Sequence[str], rows: List[Tuple]):
+        self.params = tuple(params)
+        self.columns = self.params + OUTCOMES
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Tuple]:
+        return iter(self.rows)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ScenarioTable) and (self.params, self.rows) == (other.params, other.rows)
+
+    def column(self, name: str) -> List[Any]:
+        i = self.columns.index(name)
+        return [row[i] for row in self.rows]
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+
+class ScenarioSweep:
+    """
+    What-if grids over Preferences / Constraints fields, e.g.
+
+        sweep = ScenarioSweep({"savings_rate_min": [0.05, 0.1, 0.2, 0.3], "round_to": ["1", "5", "10"]})
+        table = sweep.run(data)                         # 12 scenarios, one ScenarioTable
+        for index, table in sweep.run_many(inputs, workers = 8):
+            ...
+
+    Compared with building one plan per grid point, a sweep shares everything that
+    does not depend on the swept values:
+      - variables are ordered once per input
+      - totals and the fixed allocation depend only on round_to: they are computed
+        once per step (Planner.checkpoint) and each scenario resumes the pipeline
+        after them (Planner.resume)
+      - constraints are not read by the planner: grid points that differ only in
+        constraints share one plan and only recompute their own columns
+      - with engine="numpy" all distinct preference points of an input are
+        planned as one batch of cent matrices
+
+    housing names the fixed expenses that count as housing for max_housing_ratio
+    (e.g. {"Rent", "Mortgage"}); without it the housing_ok column is None.
+    money=FastMoney gives the same amounts as Money, faster. run_many() spreads
+    many inputs over a process pool (workers=1 runs in this process).
+    """
+
+    def __init__(self, grid: Mapping[str, Iterable[Any]], engine: str = "decimal", money: Type[Money] = FastMoney, housing: Iterable[str] = ()):
+        unknown = [name for name in grid if name not in PREFERENCE_FIELDS + CONSTRAINT_FIELDS]
+        if unknown:
+            raise ValueError(f"Cannot sweep {unknown}; expected fields of Preferences {PREFERENCE_FIELDS} or Constraints {CONSTRAINT_FIELDS}")
+        self.params = tuple(grid)
+        # validate (and normalize, e.g. "5" -> Money) every value once, through the models
+        self.values = {
+            name: [getattr((Preferences if name in PREFERENCE_FIELDS else Constraints).model_validate({name: v}), name) for v in values]
+            for name, values in grid.items()
+        }
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown planning engine {engine!r}; expected one of {ENGINES}")
+        self.engine = engine
+        self.money = money
+        self.housing = frozenset(housing)
+        self.planner = Planner(money = money, compact = True)
+
+    @property
+    def size(self) -> int:
+        return math.prod(len(v) for v in self.values.values())
+
+    # ---------- public API ----------
+
+    def run(self, data: PlanningInput) -> ScenarioTable:
+        points = list(product(*(self.values[name] for name in self.params)))
+        pref_at = [i for i, name in enumerate(self.params) if name in PREFERENCE_FIELDS]
+
+        # one plan per distinct preference point
+        distinct: Dict[Tuple, Preferences] = {}
+        for point in points:
+            key = tuple(_key(point[i]) for i in pref_at)
+            if key not in distinct:
+                distinct[key] = data.preferences.model_copy(update = {self.params[i]: point[i] for i in pref_at})
+        summaries = dict(zip(distinct, self._plan(data, list(distinct.values()))))
+
+        essential = sum((f.amount for f in data.fixed if f.essential), Money("0"))
+        income = sum((i.amount for i in data.incomes), Decimal(0))
+        housing = sum((f.amount for f in data.fixed if f.name in self.housing), Decimal(0))
+        constraints = data.constraints
+        rows = []
+        for point in points:
+            summary, funded = summaries[tuple(_key(point[i]) for i in pref_at)]
+            c = {name: point[i] for i, name in enumerate(self.params) if name in CONSTRAINT_FIELDS}
+            months = c.get("emergency_fund_months", constraints.emergency_fund_months)
+            ratio = c.get("max_housing_ratio", constraints.max_housing_ratio)
+            target = (essential * months).round2()
+            rows.append(point + (
+                summary.total_income, summary.total_expenses, summary.savings, summary.remaining, funded,
+                target,
+                math.ceil(target / summary.savings) if summary.savings > 0 else (0 if target <= 0 else None),
+                None if not self.housing else (housing <= income * Decimal(str(ratio)) if income > 0 else housing <= 0),
+            ))
+        return ScenarioTable(self.params, rows)
+
+    def run_many(self, inputs: Iterable[Union[PlanningInput, dict]], workers: Optional[int] = None, chunk_size: int = 16) -> Iterator[Tuple[int, ScenarioTable]]:
+        """(input index, table) for every input, in input order."""
+        workers = workers or os.cpu_count() or 1
+        it = (PlanningInput.model_validate(x) if isinstance(x, dict) else x for x in inputs)
+        if workers == 1:
+            yield from enumerate(self.run(data) for data in it)
+            return
+        index = 0
+        with ProcessPoolExecutor(max_workers = workers) as pool:
+            pending = deque()
+            while True:
+                while len(pending) < 2 * workers:
+                    chunk = list(islice(it, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(pool.submit(_sweep_chunk, self.values, self.engine, self.money.__name__, self.housing, [encode_input(d) for d in chunk]))
+                if not pending:
+                    return
+                for table in pending.popleft().result():
+                    yield index, table
+                    index += 1
+
+    # ---------- helpers ----------
+
+    def _plan(self, data: PlanningInput, preferences: List[Preferences]) -> List[Tuple[Any, int]]:
+        """(summary, funded variables) per preference point."""
+        planner = self.planner
+        scenarios = [data.model_copy(update = {"preferences": p}) for p in preferences]
+        if self.engine == "numpy":
+            # one batch: the variables share one layout, so they are ordered once
+            results = planner.build_plans(scenarios, engine = "numpy")
+        else:
+            index = VariableIndex(data.variables)
+            after_fixed: Dict[str, PlanState] = {}
+            results = []
+            for scenario in scenarios:
+                step = _key(scenario.preferences.round_to)
+                state = after_fixed.get(step)
+                if state is None:
+                    state = after_fixed[step] = planner.checkpoint(scenario, "fixed", index = index)
+                results.append(planner.resume(scenario, state, "fixed", index = index))
+        return [(r.summary, len({i.category for i in r.items if i.kind == "variable"})) for r in results]
+
+
+def _key(value: Any) -> Any:
+    # exact text: round_to 5 and 5.00 give equal amounts with different exponents
+    return Decimal.__str__(value) if isinstance(value, Decimal) else value
+
+
+def _sweep_chunk(grid: Dict[str, List[Any]], engine: str, money: str, housing: frozenset, payload: List[Tuple]) -> List[ScenarioTable]:
+    sweep = ScenarioSweep(grid, engine = engine, money = {"Money": Money, "FastMoney": FastMoney}[money], housing = housing)
+    return [sweep.run(decode_input(row)) for row in payload]
@@ -0,0 +1,140 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from itertools import count, groupby
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from src.budget_app.core.models import VariableExpense
+
+class _Bucket:
+    """Variables of one priority, sorted by (name.lower(), insertion number)."""
+
+    __slots__ = ("keys", "variables")
+
+    def __init__(self):
+        self.keys: List[Tuple[str, int]] = []
+        self.variables: List[VariableExpense] = []
+
+class VariableIndex:
+    """
+    A variable set kept in Planner's (priority, name) order across edits.
+
+    Planner.build_plan sorts data.variables on every call; with thousands of
+    categories (departmental budgets) that sort, and name.lower() per variable,
+    is repeated for every plan. A VariableIndex sorts once and keeps the order:
+
+      - variables are grouped in one bucket per priority (priorities sorted),
+        each bucket sorted by name.lower(), computed once per variable
+      - insert() and remove() only touch one bucket (a bisect plus a list
+        insert/delete), not the whole set
+      - ordered() is cached until the next edit
+
+    Building an index costs a few times one sort, so it pays off once it is
+    reused for a handful of plans or edits.
+
+    Ties keep insertion order, as the planner's stable sort keeps input order,
+    so VariableIndex(data.variables).ordered() is exactly the planner's order.
+
+    Usage:
+        index = VariableIndex(data.variables)
+        planner.build_plan(data, index = index)     # data.variables is not read
+        index.insert(VariableExpense(name = "Travel", max_amount = Money("300")))
+        index.remove("Gifts")
+        planner.build_plan(data, index = index)
+    """
+
+    def __init__(self, variables: Iterable[VariableExpense] = ()):
+        self._buckets: Dict[int, _Bucket] = {}
+        self._priorities: List[int] = []
+        self._by_name: Dict[str, List[Tuple[int, str, int]]] = {}  # name -> [(priority, key, seq)]
+        self._seq = count()
+        self._ordered: Optional[List[VariableExpense]] = None
+        self._size = 0
+        self._load(variables)
+
+    # ---------- public API ----------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[VariableExpense]:
+        return iter(self.ordered())
+
+    def ordered(self) -> List[VariableExpense]:
+        """All variables in (priority, name) order; shared until the next edit, do not modify."""
+        if self._ordered is None:
+            ordered: List[VariableExpense] = []
+            for p in self._priorities:
+                ordered.extend(self._buckets[p].variables)
+            self._ordered = ordered
+        return self._ordered
+
+    def buckets(self) -> Iterator[Tuple[int, List[VariableExpense]]]:
+        """(priority, variables in name order) from the first priority to the last."""
+        for p in self._priorities:
+            yield p, self._buckets[p].variables
+
+    def get(self, name: str) -> List[VariableExpense]:
+        """The variables named 'name' (usually one)."""
+        out = []
+        for priority, key, seq in self._by_name.get(name, ()):
+            bucket = self._buckets[priority]
+            out.append(bucket.variables[bisect_left(bucket.keys, (key, seq))])
+        return out
+
+    def insert(self, variable: VariableExpense) -> None:
+        """Add a variable after any with the same (priority, name) (like appending to the input)."""
+        priority, key, seq = variable.priority, variable.name.lower(), next(self._seq)
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = _Bucket()
+            insort(self._priorities, priority)
+        i = bisect_right(bucket.keys, (key, seq))
+        bucket.keys.insert(i, (key, seq))
+        bucket.variables.insert(i, variable)
+        self._by_name.setdefault(variable.name, []).append((priority, key, seq))
+        self._size += 1
+        self._ordered = None
+
+    def remove(self, name: str) -> int:
+        """Remove every variable named 'name'; returns how many. KeyError if there is none."""
+        entries = self._by_name.pop(name)
+        for priority, key, seq in entries:
+            bucket = self._buckets[priority]
+            i = bisect_left(bucket.keys, (key, seq))
+            del bucket.keys[i]
+            del bucket.variables[i]
+            if not bucket.keys:
+                del self._buckets[priority]
+                del self._priorities[bisect_left(self._priorities, priority)]
+        self._size -= len(entries)
+        self._ordered = None
+        return len(entries)
+
+    def replace(self, variable: VariableExpense) -> None:
+        """Swap the variables named variable.name for 'variable' (e.g. after editing its priority or limits)."""
+        if variable.name in self._by_name:
+            self.remove(variable.name)
+        self.insert(variable)
+
+    # ---------- helpers ----------
+
+    def _load(self, variables: Iterable[VariableExpense]) -> None:
+        # bulk build: one sort of all entries instead of one bisect/insert per variable
+        entries = sorted((v.priority, v.name.lower(), seq, v) for seq, v in zip(self._seq, variables))
+        by_name = self._by_name
+        for priority, group in groupby(entries, key = itemgetter(0)):
+            bucket = self._buckets[priority] = _Bucket()
+            group = list(group)
+            bucket.keys = [(key, seq) for _, key, seq, _ in group]
+            bucket.variables = [v for _, _, _, v in group]
+            for _, key, seq, v in group:
+                named = by_name.get(v.name)
+                if named is None:
+                    by_name[v.name] = [(priority, key, seq)]
+                else:
+                    named.append((priority, key, seq))
+        self._priorities = sorted(self._buckets)
+        self._size = len(entries)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+from decimal import Decimal
+from typing import List, Optional, Tuple
+from src.budget_app.core.models import PlanningInput, VariableExpense
+from src.budget_app.utils.money import Money
+
+# numpy is optional: only the "numpy" engine needs it.
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except Exception:
+    _HAS_NUMPY = False
+
+# Same sentinel as Planner._room_left, in cents
+_NO_CAP_CENTS = 99999999999999
+
+
+class VectorPlanner:
+    """
+    Array form of Planner.build_plan for many profiles at once.
+
+    Every amount is an int64 number of cents laid out as a (profiles x categories)
+    matrix; variables are placed in (priority, name) order and padded with zeros.
+    Because all intermediate values are multiples of the rounding step, the
+    sequential "allocate while something remains" loops reduce to
+
+        alloc_k = clip(remaining - (cumsum(want)_k - want_k), 0, want_k)
+
+    Profiles that cannot be represented exactly in cents (sub-cent amounts or
+    round_to steps, duplicate variable names) get None, and Planner builds them
+    with the Decimal pipeline, so results always match it to the cent.
+    """
+
+    def __init__(self):
+        if not _HAS_NUMPY:
+            raise RuntimeError(
+                "The 'numpy' planning engine requires the 'numpy' module.\n\n"
+                "Install it with:\n    pip install numpy"
+            )
+
+    # ---------- public API ----------
+
+    def allocate(self, inputs: List[PlanningInput], orders: List[List[VariableExpense]]) -> List[Optional[Tuple]]:
+        """
+        Per input, None or the plan in cents:
+            (fixed, savings, floors, caps, total_income, total_expenses, remaining)
+        where fixed lists data.fixed's allocations and floors/caps the variables'
+        (in the given order); Planner turns them into items and a summary.
+        """
+        allocations: List[Optional[Tuple]] = [None] * len(inputs)
+        rows: List[int] = []
+        packed = []
+        for i, (data, variables) in enumerate(zip(inputs, orders)):
+            row = _pack(data, variables)
+            if row is not None:
+                rows.append(i)
+                packed.append(row)
+        if packed:
+            for i, cents in zip(rows, self._allocate(packed)):
+                allocations[i] = cents
+        return allocations
+
+    # ---------- pipeline ----------
+
+    def _allocate(self, packed) -> List[Tuple]:
+        step = np.array([p[0] for p in packed], dtype = np.int64)
+        savings_target = np.array([p[1] for p in packed], dtype = np.int64)
+        incomes = _matrix([p[2] for p in packed])
+        fixed = _matrix([p[3] for p in packed])
+        floors = _matrix([p[4] for p in packed])
+        caps = _matrix([p[5] for p in packed])  # padding has no room at all
+
+        # 1) Totals
+        total_income = _round(incomes.sum(axis = 1), step)
+        fixed_total = _round(fixed.sum(axis = 1), step)
+
+        # 2) Fixed first
+        fixed_alloc = _round(fixed, step[:, None])
+        remaining = np.maximum(_round(total_income - fixed_alloc.sum(axis = 1), step), 0)
+
+        # 3) Savings (target computed with Money, see _pack)
+        savings = np.where(savings_target > 0, np.where(remaining >= savings_target, savings_target, remaining), 0)
+        remaining = np.maximum(remaining - savings, 0)
+
+        # 4) Variable floors (min_amount), in priority order
+        room = np.maximum(caps, 0)
+        want = np.where(floors > 0, _round(np.maximum(np.minimum(floors, room), 0), step[:, None]), 0)
+        floor_alloc = _prefix_alloc(want, remaining)
+        remaining = remaining - floor_alloc.sum(axis = 1)
+
+        # 5) Distribute remainder up to variable caps, still by priority
+        room = np.where(caps == _NO_CAP_CENTS, _NO_CAP_CENTS, caps - floor_alloc)
+        want = np.where(room > 0, _round(room, step[:, None]), 0)
+        cap_alloc = _prefix_alloc(np.minimum(want, remaining[:, None]), remaining)
+
+        # 6) Summary
+        variable_total = floor_alloc.sum(axis = 1) + cap_alloc.sum(axis = 1)
+        total_expenses = _round(fixed_total + variable_total, step)
+        left = np.maximum(_round(total_income - total_expenses - savings, step), 0)
+
+        return list(zip(
+            fixed_alloc.tolist(), savings.tolist(), floor_alloc.tolist(), cap_alloc.tolist(),
+            total_income.tolist(), total_expenses.tolist(), left.tolist(),
+        ))
+
+
+# ---------- helpers ----------
+
+def _cents(value: Decimal) -> Optional[int]:
+    """Exact number of cents in value, or None if it has a sub-cent part."""
+    scaled = value.scaleb(2)
+    if scaled != scaled.to_integral_value():
+        return None
+    return int(scaled)
+
+
+def _money(cents) -> Money:
+    return Money(Decimal(int(cents)).scaleb(-2))
+
+
+def _pack(data: PlanningInput, variables: List[VariableExpense]) -> Optional[Tuple]:
+    """Convert one input to cents, or None if it must go through the Decimal planner."""
+    step = data.preferences.round_to
+    step_cents = _cents(step) if step > 0 else 0
+    if step_cents is None:
+        return None
+    if len({v.name for v in variables}) != len(variables):
+        return None
+    amounts = [i.amount for i in data.incomes] + [f.amount for f in data.fixed]
+    amounts += [v.min_amount for v in variables if v.min_amount is not None]
+    amounts += [v.max_amount for v in variables if v.max_amount is not None]
+    cents = [_cents(a) for a in amounts]
+    if None in cents:
+        return None
+
+    n_inc, n_fix = len(data.incomes), len(data.fixed)
+    it = iter(cents[n_inc + n_fix:])
+    floors = [next(it) if v.min_amount is not None else 0 for v in variables]
+    caps = [next(it) if v.max_amount is not None else _NO_CAP_CENTS for v in variables]
+
+    # The savings target multiplies by a float rate, so it is computed with the
+    # same Money operations as the Decimal planner (once per profile).
+    rate = data.preferences.savings_rate_min
+    target = 0
+    if rate > 0:
+        total = _round_scalar(sum(cents[:n_inc]), step_cents)
+        product = _money(total) * Money.from_decimal(rate)
+        if step_cents > 0:
+            product = product.quantize_to_step(step)
+        target = _cents(product)
+        if target is None:
+            return None
+    return step_cents, target, cents[:n_inc], cents[n_inc:n_inc + n_fix], floors, caps
+
+
+def _matrix(rows: List[List[int]]):
+    width = max((len(r) for r in rows), default = 0)
+    out = np.zeros((len(rows), max(width, 1)), dtype = np.int64)
+    for i, r in enumerate(rows):
+        out[i, :len(r)] = r
+    return out
+
+
+def _round(x, step):
+    """Money.quantize_to_step (ROUND_HALF_UP) on cents; a step of 0 means no rounding."""
+    safe = np.where(step > 0, step, 1)
+    q = (2 * np.abs(x) + safe) // (2 * safe) * safe
+    return np.where(step > 0, np.sign(x) * q, x)
+
+
+def _round_scalar(x: int, step: int) -> int:
+    if step <= 0:
+        return x
+    q = (2 * abs(x) + step) // (2 * step) * step
+    return q if x >= 0 else -q
+
+
+def _prefix_alloc(want, remaining):
+    """Allocate each column's 'want' in order until 'remaining' runs out."""
+    before = np.cumsum(want, axis = 1) - want
+    return np.minimum(want, np.maximum(remaining[:, None] - before, 0))
@@ -0,0 +1,93 @@
+# src/budget_app/ui/bridge.py
+from decimal import Decimal
+
+from ..core.models import PlanningInput, Income, FixedExpense, VariableExpense, Preferences
+from ..utils.money import Money
+
+# The form's budget category for savings (it becomes Preferences.savings_rate_min)
+SAVINGS_LABELS = ("Savings", "储蓄")
+WEEK_LABELS = ("Week", "周")
+
+
+def form_to_input(data: dict) -> PlanningInput:
+    """
+    Turn InputsView's form data into a PlanningInput.
+
+    - incomes are monthly; weekly ones are scaled by 52/12
+    - fixed costs with an amount become FixedExpenses
+    - the budget percentages split what is left after fixed costs: the savings
+      share becomes the savings rate, every other category a VariableExpense
+      capped at its share (and at the constraint's max %), with the constraint's
+      min % as its floor; earlier categories come first
+    """
+    incomes = []
+    for row in data.get("income", []):
+        amount = Decimal(str(row["amount"]))
+        if row.get("period") in WEEK_LABELS:
+            amount = amount * 52 / 12
+        incomes.append(Income(name=row["name"], amount=Money(amount).round2()))
+    fixed = [
+        FixedExpense(name=label, amount=Money(amount))
+        for label, amount in data.get("fixed", {}).items() if amount > 0
+    ]
+    income_total = sum((i.amount for i in incomes), Decimal(0))
+    pool = max(income_total - sum((f.amount for f in fixed), Decimal(0)), Decimal(0))
+
+    savings_rate = 0.0
+    variables = []
+    constraints = data.get("constraints", {})
+    for position, (label, percent) in enumerate(data.get("prefs", {}).items()):
+        if label in SAVINGS_LABELS:
+            if income_total > 0:
+                savings_rate = float(pool * percent / 100 / income_total)
+            continue
+        limits = constraints.get(label, {"min": 0, "max": 100})
+        share = min(percent, limits["max"])
+        floor = min(limits["min"], share)
+        variables.append(VariableExpense(
+            name=label,
+            min_amount=Money(pool * floor / 100).round2() if floor > 0 else None,
+            max_amount=Money(pool * share / 100).round2(),
+            priority=(position + 1) * 10,
+        ))
+    return PlanningInput(
+        incomes=incomes,
+        fixed=fixed,
+        variables=variables,
+        preferences=Preferences(savings_rate_min=savings_rate),
+    )
+
+
+def plan_rows(result):
+    """
+    PlanView rows ({category, amount, percent of income}) and a notes line for a
+    PlanResult; a variable's floor and top-up items are shown as one row (already
+    merged in an IndexedPlanResult).
+    """
+    total = result.summary.total_income
+    categories = getattr(result, "categories", None)
+    if categories is not None:
+        amounts = {name: entry.allocated for name, entry in categories.items()}
+    else:
+        amounts = {}
+        for item in result.items:
+            amounts[item.category] = amounts.get(item.category, Money("0")) + item.allocated
+    rows = []
+    for category, amount in amounts.items():
+        percent = amount / total * 100 if total > 0 else Decimal(0)
+        rows.append({"category": category, "amount": str(amount), "percent": f"{percent:.1f}%"})
+    remaining = result.summary.remaining
+    notes = f"Unallocated: {remaining}" if remaining > 0 else ""
+    return rows, notes
+
+
+def build_plan_rows(job, planner, data: dict):
+    """BackgroundRunner job: form data -> (rows, notes), off the Tk thread."""
+    job.report(0, 2)
+    plan_input = form_to_input(data)
+    if job.cancelled:
+        return None
+    job.report(1, 2)
+    rows = plan_rows(planner.build_plan(plan_input))
+    job.report(2, 2)
+    return rows
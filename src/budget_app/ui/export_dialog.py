@@ -1,23 +1,28 @@
 # src/budget_app/ui/export_dialog.py
 import csv
+import importlib.util
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-# Try to import reportlab for PDF. If missing, we still allow CSV and
-# we show a friendly prompt when the user chooses PDF.
-try:
-    from reportlab.lib.pagesizes import LETTER
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet
-    _HAS_REPORTLAB = True
-except Exception:
-    _HAS_REPORTLAB = False
+from ..utils.export import open_text_output, pdf_styles, write_plans_csv
+
+# reportlab is needed for PDF only. If missing, we still allow CSV and
+# we show a friendly prompt when the user chooses PDF. It is slow to import,
+# so it is only looked up here and imported when a PDF is written.
+_HAS_REPORTLAB = importlib.util.find_spec("reportlab") is not None
 
 
 def _export_plan_to_csv(plan: dict, path: str) -> None:
-    """Write a simple CSV: metadata at top, then a Category/Amount table."""
-    with open(path, "w", newline="", encoding="utf-8") as f:
+    """
+    Write a simple CSV: metadata at top, then a Category/Amount table.
+    If the plan carries PlanResults under "results" (batch runs, optional "ids"),
+    they are streamed in long format by utils.export.write_plans_csv instead.
+    A path ending in ".gz" is compressed either way.
+    """
+    if plan.get("results") is not None:
+        write_plans_csv(path, plan["results"], ids=plan.get("ids"))
+        return
+    with open_text_output(path, compress=path.endswith(".gz")) as f:
         w = csv.writer(f)
         w.writerow(["Period", plan.get("period", "")])
         w.writerow(["Total income", plan.get("total_income", "")])
@@ -37,9 +42,11 @@ def _export_plan_to_pdf(plan: dict, path: str) -> None:
             "PDF export requires the 'reportlab' module.\n\n"
             "Install it with:\n    pip install reportlab"
         )
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
 
     doc = SimpleDocTemplate(path, pagesize=LETTER)
-    styles = getSampleStyleSheet()
+    styles, table_style = pdf_styles()  # shared with the bulk exporters
     story = []
 
     story.append(Paragraph("FinanceFlow Budget Plan", styles['Title']))
@@ -54,30 +61,35 @@ def _export_plan_to_pdf(plan: dict, path: str) -> None:
         rows.append([cat, f"${float(amt):.2f}"])
     rows.append(["Leftover", f"${float(plan.get('leftover',0)):.2f}"])
 
-    table = Table(rows, hAlign='LEFT')
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#eaeaea")),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-        ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-        ('ALIGN', (1,1), (-1,-1), 'RIGHT'),
-        ('BOTTOMPADDING', (0,0), (-1,0), 8),
-    ]))
-    story.append(table)
+    story.append(Table(rows, hAlign='LEFT', style=table_style))
     doc.build(story)
 
 
+def run_export(job, fmt: str, plan: dict, path: str) -> str:
+    """Background job for BackgroundRunner: write the plan in 'fmt' to 'path'."""
+    if fmt == "csv":
+        _export_plan_to_csv(plan, path)
+    else:
+        _export_plan_to_pdf(plan, path)
+    return path
+
+
 class ExportDialog(tk.Toplevel):
     """
     A modal dialog that lets the user choose CSV or PDF and save the current plan.
     Usage:
         dlg = ExportDialog(parent_window, plan_dict)
         # optional: after it closes, check dlg.result for the saved path (or None)
+
+    With export=MainWindow.export_plan the file is written in the background; the
+    dialog hides while it runs and reports success or failure when it is done.
     """
-    def __init__(self, parent, plan: dict):
+    def __init__(self, parent, plan: dict, export=None):
         super().__init__(parent)
         self.title("Export Plan")
         self.resizable(False, False)
         self.plan = plan or {}
+        self.export = export
         self.result = None  # filled with the saved file path on success
 
         # Center relative to parent
@@ -124,18 +136,9 @@ class ExportDialog(tk.Toplevel):
             path = filedialog.asksaveasfilename(
                 parent=self,
                 defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
+                filetypes=[("CSV files", "*.csv"), ("Compressed CSV", "*.csv.gz")],
                 title="Save as CSV"
             )
-            if not path:
-                return
-            try:
-                _export_plan_to_csv(self.plan, path)
-                self.result = path
-                messagebox.showinfo("Export", "Exported to CSV successfully.")
-                self.destroy()
-            except Exception as e:
-                messagebox.showerror("Export failed", str(e))
         else:
             if not _HAS_REPORTLAB:
                 messagebox.showwarning(
@@ -149,18 +152,35 @@ class ExportDialog(tk.Toplevel):
                 filetypes=[("PDF files", "*.pdf")],
                 title="Save as PDF"
             )
-            if not path:
-                return
-            try:
-                _export_plan_to_pdf(self.plan, path)
-                self.result = path
-                messagebox.showinfo("Export", "Exported to PDF successfully.")
-                self.destroy()
-            except Exception as e:
-                messagebox.showerror("Export failed", str(e))
+        if not path:
+            return
+        if self.export is not None:
+            # written on the background thread; the dialog waits hidden
+            self.grab_release()
+            self.withdraw()
+            self.export({"format": fmt, "plan": self.plan, "path": path},
+                        on_done=self._on_saved, on_error=self._on_failed)
+            return
+        try:
+            run_export(None, fmt, self.plan, path)
+        except Exception as e:
+            self._on_failed(e)
+        else:
+            self._on_saved(path)
+
+    def _on_saved(self, path):
+        self.result = path
+        label = "CSV" if self.var_fmt.get() == "csv" else "PDF"
+        messagebox.showinfo("Export", f"Exported to {label} successfully.", parent=self.master)
+        self.destroy()
+
+    def _on_failed(self, error):
+        messagebox.showerror("Export failed", str(error), parent=self.master)
+        if self.export is not None:
+            self.destroy()
 
 
 # Optional helper if you prefer a function call from MainWindow:
-def open_export_dialog(parent, plan: dict):
-    dlg = ExportDialog(parent, plan)
+def open_export_dialog(parent, plan: dict, export=None):
+    dlg = ExportDialog(parent, plan, export=export)
     return getattr(dlg, "result", None)
\ No newline at end of file
@@ -0,0 +1,111 @@
+# src/budget_app/ui/icons.py
+import glob
+import os
+import re
+import tkinter as tk
+
+ASSETS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../assets/images'))
+
+
+def default_cache_dir():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "financeflow", "icons")
+
+
+class IconCache:
+    """
+    Rasterizes SVG icons once per size and keeps the PNGs in a cache directory.
+
+    Entries are named <svg name>-<w>x<h>-<svg mtime>.png, so editing an SVG
+    invalidates its PNGs (stale ones are removed when the new one is written).
+    cairosvg is only imported on a cache miss; if it is missing or fails, the
+    pre-rendered PNG next to the SVG (e.g. add_circle_24dp_...png for
+    add_circle_26dp_...svg) is used instead. Tk loads PNGs itself, so PIL is only
+    used, when installed, to resize a fallback PNG to the requested size.
+
+    Usage:
+        icons = IconCache()
+        photo = icons.photo(svg_path, 48, 48)  # keep a reference while it is shown
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def png_path(self, svg_path, width, height):
+        """A PNG for svg_path at width x height (cached raster or fallback), or None."""
+        stem = os.path.splitext(os.path.basename(svg_path))[0]
+        try:
+            mtime = os.stat(svg_path).st_mtime_ns
+        except OSError:
+            return fallback_png(svg_path)
+        cached = os.path.join(self.cache_dir, f"{stem}-{width}x{height}-{mtime}.png")
+        if os.path.exists(cached):
+            self.hits += 1
+            return cached
+        self.misses += 1
+        if self._rasterize(svg_path, cached, width, height):
+            for stale in glob.glob(os.path.join(self.cache_dir, glob.escape(stem) + f"-{width}x{height}-*.png")):
+                if stale != cached:
+                    _remove(stale)
+            return cached
+        return fallback_png(svg_path)
+
+    def photo(self, svg_path, width, height, master=None):
+        path = self.png_path(svg_path, width, height)
+        if path is None:
+            raise FileNotFoundError(f"Button image not found: {svg_path}")
+        return _load_photo(path, width, height, master)
+
+    def _rasterize(self, svg_path, target, width, height):
+        try:
+            import cairosvg  # slow to import: only needed on a cache miss
+        except Exception:
+            return False
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{target}.{os.getpid()}.tmp"
+            cairosvg.svg2png(url=svg_path, write_to=tmp, output_width=width, output_height=height)
+            os.replace(tmp, target)  # atomic: other instances never see half a file
+            return True
+        except Exception:
+            _remove(f"{target}.{os.getpid()}.tmp")
+            return False
+
+
+def fallback_png(svg_path):
+    """The pre-rendered PNG shipped next to an SVG icon, or None."""
+    directory, name = os.path.split(svg_path)
+    stem = os.path.splitext(name)[0]
+    candidates = [os.path.join(directory, stem + ".png")]
+    # material icons: same name at another dp size, e.g. _26dp_ -> _24dp_
+    if re.search(r"_\d+dp_", stem):
+        pattern = re.sub(r"_\d+dp_", "_*dp_", glob.escape(stem), count=1)
+        candidates += sorted(glob.glob(os.path.join(glob.escape(directory), pattern + ".png")))
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _load_photo(path, width, height, master):
+    photo = tk.PhotoImage(file=path, master=master)
+    if (photo.width(), photo.height()) == (width, height):
+        return photo
+    try:
+        from PIL import Image, ImageTk
+    except Exception:
+        # integer scaling only, but no extra dependency
+        if photo.width() < width:
+            return photo.zoom(max(1, round(width / photo.width())))
+        return photo.subsample(max(1, round(photo.width() / width)))
+    img = Image.open(path).convert("RGBA").resize((width, height), Image.LANCZOS)
+    return ImageTk.PhotoImage(img, master=master)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -3,8 +3,8 @@ import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from tkinter import ttk
 import tkinter.font as tkfont
-from PIL import Image, ImageDraw, ImageTk, ImageFont
-import cairosvg
+
+from .tasks import Debouncer
 
 LANGUAGES = {
     'en': {
@@ -46,11 +46,18 @@ LANGUAGES = {
 }
 CURRENT_LANG = 'en'
 
+# 实时预览：停止输入这么久（毫秒）后才重新计算
+LIVE_PREVIEW_DELAY_MS = 300
+
 class InputsView(tb.Frame):
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
         self.lang = CURRENT_LANG
+        # 实时预览：按键只重置计时器，停顿后且数据确有变化时才在后台重新计算
+        self.live_preview = True
+        self._live = Debouncer(self, LIVE_PREVIEW_DELAY_MS, self._live_update)
+        self._last_data = None
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
         style = tb.Style()
@@ -200,6 +207,8 @@ class InputsView(tb.Frame):
         amt_entry.pack(side="left", padx=5)
         del_btn = tb.Button(frame, text=LANGUAGES[self.lang]['delete'], bootstyle=DANGER, command=lambda: self._del_income_entry(frame))
         del_btn.pack(side="left", padx=5)
+        self._watch(src_entry, amt_entry)
+        period_combo.bind("<<ComboboxSelected>>", self._on_edit, add="+")
         self.income_entries.append((frame, src_entry, period_combo, amt_entry))
 
     def _del_income_entry(self, frame):
@@ -207,6 +216,7 @@ class InputsView(tb.Frame):
             if entry[0] == frame:
                 entry[0].destroy()
                 self.income_entries.remove(entry)
+                self._on_edit()
                 break
 
     def add_fixed_entry(self, parent, label):
@@ -216,6 +226,7 @@ class InputsView(tb.Frame):
         lbl.pack(side="left", padx=5)
         amt_entry = tb.Entry(frame, width=10)
         amt_entry.pack(side="left", padx=5)
+        self._watch(amt_entry)
         self.fixed_entries.append((label, amt_entry))
 
     def add_pref_entry(self, parent, label):
@@ -225,9 +236,14 @@ class InputsView(tb.Frame):
         lbl.pack(side="left", padx=5)
         percent_spin = tb.Spinbox(frame, from_=0, to=100, width=5, command=self.update_percent_total)
         percent_spin.pack(side="left", padx=5)
+        self._watch(percent_spin)
         self.pref_entries.append((label, percent_spin))
 
     def update_percent_total(self):
+        self._refresh_percent_total()
+        self._on_edit()
+
+    def _refresh_percent_total(self):
         total = 0
         for _, spin in self.pref_entries:
             try:
@@ -245,10 +261,11 @@ class InputsView(tb.Frame):
         frame.pack(fill="x", pady=2)
         lbl = tb.Label(frame, text=label, width=10)
         lbl.pack(side="left", padx=5)
-        min_spin = tb.Spinbox(frame, from_=0, to=100, width=5)
+        min_spin = tb.Spinbox(frame, from_=0, to=100, width=5, command=self._on_edit)
         min_spin.pack(side="left", padx=5)
-        max_spin = tb.Spinbox(frame, from_=0, to=100, width=5)
+        max_spin = tb.Spinbox(frame, from_=0, to=100, width=5, command=self._on_edit)
         max_spin.pack(side="left", padx=5)
+        self._watch(min_spin, max_spin)
         del_btn = tb.Button(frame, text=LANGUAGES[self.lang]['delete'], bootstyle=DANGER, command=lambda: self._del_constraint_entry(frame))
         del_btn.pack(side="left", padx=5)
         # 悬停提示
@@ -271,10 +288,46 @@ class InputsView(tb.Frame):
             if entry[0] == frame:
                 entry[0].destroy()
                 self.constraint_entries.remove(entry)
+                self._on_edit()
                 break
 
     def submit(self):
-        # 收集所有输入数据，校验并传递给 planner
+        # 收集所有输入数据，校验并传递给 planner（在后台线程计算）
+        self._live.cancel()
+        data = self.collect_data()
+        if data is None:
+            return
+        self._last_data = repr(data)
+        self.controller.generate_plan(data)
+
+    # ---------- 实时预览 ----------
+
+    def set_live_preview(self, enabled):
+        self.live_preview = enabled
+        if not enabled:
+            self._live.cancel()
+
+    def _watch(self, *widgets):
+        for widget in widgets:
+            widget.bind("<KeyRelease>", self._on_edit, add="+")
+
+    def _on_edit(self, event=None):
+        # 每次按键都会调用：只重置计时器，不读取表单
+        if self.live_preview:
+            self._live.trigger()
+
+    def _live_update(self):
+        data = self.collect_data()
+        if data is None:
+            return
+        key = repr(data)
+        if key == self._last_data:
+            return  # e.g. a key that did not change any value, or an edit that was undone
+        self._last_data = key
+        self.controller.generate_plan(data)
+
+    def collect_data(self):
+        """Form data as a dict, or None (with the error shown) if the percentages do not add up to 100."""
         data = {
             "income": [],
             "fixed": {},
@@ -310,11 +363,10 @@ class InputsView(tb.Frame):
                 minv, maxv = 0, 100
             data["constraints"][label] = {"min": minv, "max": maxv}
         # 校验
-        self.update_percent_total()
+        self._refresh_percent_total()
         if self.error_label.cget("text") != "":
-            return
-        # TODO: 传递 data 给 planner
-        print("提交数据:", data)
+            return None
+        return data
 
     def reset(self):
         # 清空所有输入
@@ -332,5 +384,7 @@ class InputsView(tb.Frame):
             min_spin.insert(0, "0")
             max_spin.delete(0, "end")
             max_spin.insert(0, "100")
-        self.update_percent_total()
-        self.error_label.config(text="")
\ No newline at end of file
+        self._refresh_percent_total()
+        self.error_label.config(text="")
+        self._live.cancel()
+        self._last_data = None
\ No newline at end of file
@@ -3,26 +3,35 @@ import sys
 import ttkbootstrap as tb
 from tkinter import ttk
 import tkinter.font as tkfont
-from PIL import Image, ImageTk
-import cairosvg
 
 # Robust import logic for both direct and module execution
 if __package__ is None or __package__ == "":
-    # Running as a script: insert src directory at sys.path[0] and use absolute imports
-    src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
-    if src_dir not in sys.path:
-        sys.path.insert(0, src_dir)
+    # Running as a script: insert the repository root at sys.path[0] and use absolute imports
+    # (core modules import src.budget_app..., so src/ alone is not enough)
+    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../'))
+    if root_dir not in sys.path:
+        sys.path.insert(0, root_dir)
     try:
-        from budget_app.ui.export_dialog import open_export_dialog
-        from budget_app.ui.inputs_view import InputsView
-        from budget_app.ui.plan_view import PlanView
+        from src.budget_app.core.planner import Planner
+        from src.budget_app.ui.bridge import build_plan_rows
+        from src.budget_app.ui.export_dialog import open_export_dialog, run_export
+        from src.budget_app.ui.icons import ASSETS_DIR, IconCache
+        from src.budget_app.ui.inputs_view import InputsView
+        from src.budget_app.ui.plan_view import PlanView
+        from src.budget_app.ui.startup import PROFILE, report_first_frame
+        from src.budget_app.ui.tasks import BackgroundRunner
     except ModuleNotFoundError as e:
-        raise ImportError("Could not import budget_app modules. Please run with 'python -m budget_app.ui.main_window' from the src directory.") from e
+        raise ImportError("Could not import budget_app modules. Please run with 'python -m src.budget_app.app' from the repository root.") from e
 else:
     # Running as a module: use relative imports
-    from .export_dialog import open_export_dialog
+    from ..core.planner import Planner
+    from .bridge import build_plan_rows
+    from .export_dialog import open_export_dialog, run_export
+    from .icons import ASSETS_DIR, IconCache
     from .inputs_view import InputsView
     from .plan_view import PlanView
+    from .startup import PROFILE, report_first_frame
+    from .tasks import BackgroundRunner
 
 LANGUAGES = {
     'en': {
@@ -69,20 +78,44 @@ class MainWindow(tb.Window):
     def generate_plan(self, data=None):
         """
         接收 InputsView 的预算输入数据，调用后端 planner 生成预算方案，并更新 PlanView。
-        :param data: dict, 预算输入数据（由 InputsView.submit 传入）
+        计算在后台线程进行，结果通过 after() 轮询回到 Tk 线程；再次点击会取消尚未完成的旧请求。
+        :param data: dict, 预算输入数据（由 InputsView.submit 传入；为 None 时从表单读取）
         """
-        # TODO: 调用 planner 计算预算方案
-        # 例如: plan_data, notes = self.planner.generate(data)
-        # self.plan_view.update_plan(plan_data, notes)
-        print("[接口] 生成预算方案: ", data)
+        if data is None:
+            data = self.inputs_view.collect_data()
+            if data is None:
+                return
+        self.plan_view.set_busy(True)
+        self.runner.submit(
+            "plan", build_plan_rows, self.planner, data,
+            on_done=self._show_plan,
+            on_error=self._plan_failed,
+            on_progress=self.plan_view.set_progress,
+        )
 
-    def export_plan(self, export_data=None):
+    def _show_plan(self, plan):
+        self.plan_view.set_busy(False)
+        if plan is not None:
+            rows, notes = plan
+            self.plan_view.update_plan(rows, notes)
+
+    def _plan_failed(self, error):
+        self.plan_view.set_busy(False)
+        self.plan_view.notes_label.config(text=str(error))
+
+    def export_plan(self, export_data=None, on_done=None, on_error=None):
         """
-        接收导出请求，调用后端导出逻辑（如 export.py），完成文件保存。
-        :param export_data: dict, 导出相关数据（由 ExportDialog 传入）
+        接收导出请求，调用后端导出逻辑（export.py），在后台线程完成文件保存。
+        :param export_data: dict, {"format": "csv"/"pdf", "plan": dict, "path": str}（由 ExportDialog 传入）
         """
-        # TODO: 调用后端导出逻辑
-        print("[接口] 导出预算方案: ", export_data)
+        if not export_data:
+            return
+        # 每次导出使用独立的 key：新的导出不会取消仍在写文件的上一次导出
+        self._exports += 1
+        self.runner.submit(
+            f"export-{self._exports}", run_export, export_data["format"], export_data["plan"], export_data["path"],
+            on_done=on_done, on_error=on_error,
+        )
 
     def reset_all(self):
         """
@@ -92,7 +125,10 @@ class MainWindow(tb.Window):
         print("[接口] 重置所有输入和结果")
         if hasattr(self, 'inputs_view'):
             self.inputs_view.reset()
+        if hasattr(self, 'runner'):
+            self.runner.cancel("plan")
         if hasattr(self, 'plan_view'):
+            self.plan_view.set_busy(False)
             self.plan_view.update_plan([], notes="")
 
     def create_language_menu(self):
@@ -117,13 +153,18 @@ class MainWindow(tb.Window):
         self._menubar = menubar  # Save reference for language switching
 
     def __init__(self):
-        super().__init__(themename="minty")  # 更现代圆角主题
+        with PROFILE.section("tb.Window (theme)"):
+            super().__init__(themename="minty")  # 更现代圆角主题
         self.language = CURRENT_LANG
         self.title("FinanceFlow Budget Planner")
         self.geometry("900x600")
         self.resizable(True, True)
         self.configure(bg="#f7f8fa")  # 苹果风浅灰背景
         self.create_language_menu()  # 确保菜单栏在窗口初始化时创建
+        # 后台计算：Planner 只在 runner 的工作线程中使用
+        self.planner = Planner(indexed=True)
+        self.runner = BackgroundRunner(self)
+        self._exports = 0  # 导出任务计数，用于生成各自的 runner key
 
         # 字体路径
         font_dir = os.path.join(os.path.dirname(__file__), '../../assets/fonts')
@@ -133,8 +174,12 @@ class MainWindow(tb.Window):
         # 主标题（沉稳深蓝色，加粗）
         self.questrial_bold = tkfont.Font(family="Questrial", size=24, weight="bold")
 
-        self.create_widgets()
+        with PROFILE.section("create_widgets"):
+            self.create_widgets()
 
+    def destroy(self):
+        self.runner.shutdown()
+        super().destroy()
 
     def set_language(self, lang):
         global CURRENT_LANG
@@ -204,7 +249,8 @@ class MainWindow(tb.Window):
         paned.add(left_frame, weight=1)
         self.inputs_title = tb.Label(left_frame, text="Input Form Area", font=self.questrial_bold, foreground="#333", background="white")
         self.inputs_title.pack(padx=8, pady=(0, 8))
-        self.inputs_view = InputsView(left_frame, self)
+        with PROFILE.section("InputsView"):
+            self.inputs_view = InputsView(left_frame, self)
         self.inputs_view.pack(fill="both", expand=True, padx=8, pady=4)
 
         # 右侧计划展示区域
@@ -213,13 +259,15 @@ class MainWindow(tb.Window):
         paned.add(right_frame, weight=2)
         self.plan_title = tb.Label(right_frame, text="Budget Allocation Display Area", font=self.questrial_bold, foreground="#333", background="white")
         self.plan_title.pack(padx=8, pady=(0, 8))
-        self.plan_view = PlanView(right_frame, self)
+        with PROFILE.section("PlanView"):
+            self.plan_view = PlanView(right_frame, self)
         self.plan_view.pack(fill="both", expand=True, padx=8, pady=4)
 
         # 底部按钮区域（用SVG图片按钮，无文字）
         button_canvas = tb.Canvas(self, width=320, height=100, bg="#f7f8fa", highlightthickness=0)
         button_canvas.pack(pady=(10, 24))
-        self._draw_image_buttons(button_canvas)
+        with PROFILE.section("image buttons"):
+            self._draw_image_buttons(button_canvas)
         self.button_hint_label = tb.Label(self, text="", font=self.questrial_label, background="#f7f8fa")
         self.button_hint_label.pack(side="bottom", pady=(0, 8))
 
@@ -232,18 +280,11 @@ class MainWindow(tb.Window):
         self.tk_btn_imgs = []
         btn_width, btn_height = 48, 48
         y = 16
+        # SVG 只在缓存缺失时栅格化一次（缓存目录按文件修改时间区分），失败时用自带的 PNG
+        icons = IconCache()
         for btn in btns:
-            img_path = os.path.join(os.path.dirname(__file__), '../../../assets/images/' + btn["img"])
-            img_path = os.path.abspath(img_path)
-            if not os.path.exists(img_path):
-                raise FileNotFoundError(f"Button image not found: {img_path}")
-            from io import BytesIO
-            try:
-                png_bytes = cairosvg.svg2png(url=img_path, output_width=btn_width, output_height=btn_height)
-                img = Image.open(BytesIO(png_bytes)).convert("RGBA")
-            except ImportError:
-                raise ImportError("cairosvg is required for SVG support. Please install with 'pip install cairosvg'.")
-            tk_img = ImageTk.PhotoImage(img)
+            img_path = os.path.join(ASSETS_DIR, btn["img"])
+            tk_img = icons.photo(img_path, btn_width, btn_height, master=self)
             self.tk_btn_imgs.append(tk_img)
             btn_id = canvas.create_image(btn["x"], y, anchor="nw", image=tk_img)
             canvas.tag_bind(btn_id, '<Button-1>', lambda e, cb=btn["callback"]: cb())
@@ -259,21 +300,20 @@ class MainWindow(tb.Window):
             canvas.tag_bind(btn_id, '<Leave>', on_leave)
 
     def open_export_dialog(self):
-        # 获取当前计划数据
+        # 获取当前计划数据（虚拟滚动时表格只含可见行，所以从 PlanView 取全部行）
         plan_data = []
-        if hasattr(self, 'plan_view') and hasattr(self.plan_view, 'table'):
-            for row in self.plan_view.table.get_children():
-                values = self.plan_view.table.item(row)['values']
-                # values: [category, amount, percent]
-                plan_data.append({
-                    'category': values[0],
-                    'amount': values[1],
-                    'percent': values[2]
-                })
+        if hasattr(self, 'plan_view'):
+            plan_data = [
+                {'category': row['category'], 'amount': row['amount'], 'percent': row['percent']}
+                for row in self.plan_view.current_rows()
+            ]
         # 调用导出对话框，修正参数类型为 dict
         export_dict = {'plan_data': plan_data}
-        open_export_dialog(self, export_dict)
+        open_export_dialog(self, export_dict, export=self.export_plan)
 
 if __name__ == "__main__":
     app = MainWindow()
+    # --startup-time: 打印从进程启动到第一帧的时间后退出（用于测量启动速度）
+    if "--startup-time" in sys.argv:
+        report_first_frame(app, exit_after=True)
     app.mainloop()
\ No newline at end of file
@@ -2,6 +2,13 @@ import ttkbootstrap as tb
 from tkinter import ttk
 import tkinter as tk
 
+from .table_sync import TreeSync, VirtualRows
+
+COLUMNS = ("category", "amount", "percent")
+# 超过这么多行时改用虚拟滚动，只创建可见的行
+VIRTUAL_THRESHOLD = 2000
+VIRTUAL_HEIGHT = 20
+
 class PlanView(ttk.Frame):
     def __init__(self, parent, main_window):
         super().__init__(parent)
@@ -62,7 +69,7 @@ class PlanView(ttk.Frame):
         # 表格区
         table_frame = ttk.Frame(parent)
         table_frame.pack(fill="x", padx=8, pady=4)
-        self.table = ttk.Treeview(table_frame, columns=("category", "amount", "percent"), show="headings", height=6)
+        self.table = ttk.Treeview(table_frame, columns=COLUMNS, show="headings", height=6)
         self.table.heading("category", text=self._get_text('category'))
         self.table.heading("amount", text=self._get_text('amount'))
         self.table.heading("percent", text=self._get_text('percent'))
@@ -72,6 +79,15 @@ class PlanView(ttk.Frame):
         self.table.pack(side="left", fill="both", expand=True)
         self.table.bind("<MouseWheel>", self._on_table_mousewheel)
         self.table.bind("<Shift-MouseWheel>", self._on_table_shift_mousewheel)
+        # 行按类别增量更新；大结果集用虚拟滚动（自带滚动条，仅在该模式显示）
+        self._sync = TreeSync(self.table, COLUMNS)
+        self._virtual = VirtualRows(self.table, COLUMNS, height=VIRTUAL_HEIGHT)
+        self._rows = []
+        self.virtual_mode = False
+        self.table_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self._on_virtual_scroll)
+        # 进度条（后台生成计划时显示）
+        self.progress = ttk.Progressbar(parent, mode="indeterminate", length=200)
+        self._busy = False
         # 提示区
         self.notes_label = tb.Label(parent, text="", font=self.main_window.questrial_label, foreground="#C33")
         self.notes_label.pack(padx=8, pady=(4, 8), anchor="center")
@@ -83,9 +99,17 @@ class PlanView(ttk.Frame):
         delta = event.delta
         if abs(delta) < 10:
             delta *= 120
-        self.canvas.yview_scroll(int(-1*(delta/120)), "units")
+        if self.virtual_mode:
+            self._virtual.scroll(int(-3*(delta/120)))
+            self.table_scroll.set(*self._virtual.first_last())
+        else:
+            self.canvas.yview_scroll(int(-1*(delta/120)), "units")
         return "break"
 
+    def _on_virtual_scroll(self, *args):
+        self._virtual.yview(*args)
+        self.table_scroll.set(*self._virtual.first_last())
+
     def _on_table_shift_mousewheel(self, event):
         delta = event.delta
         if abs(delta) < 10:
@@ -101,13 +125,55 @@ class PlanView(ttk.Frame):
         self.table.heading("percent", text=self._get_text('percent'))
         self.chart_placeholder.config(text="(Chart Area)" if lang == "en" else "（图表区）")
 
+    def set_busy(self, busy):
+        """Show or hide the progress bar while a plan is computed in the background."""
+        if busy == self._busy:
+            return
+        self._busy = busy
+        if busy:
+            self.progress.config(mode="indeterminate", value=0)
+            self.progress.pack(padx=8, pady=(4, 0), anchor="center", after=self.table.master)
+            self.progress.start(15)
+        else:
+            self.progress.stop()
+            self.progress.pack_forget()
+
+    def set_progress(self, done, total=None):
+        """Progress reported by the background job; without a total the bar stays indeterminate."""
+        self.set_busy(True)
+        if total:
+            self.progress.stop()
+            self.progress.config(mode="determinate", maximum=total, value=done)
+
     def update_plan(self, plan_data, notes=None):
-        for row in self.table.get_children():
-            self.table.delete(row)
-        for item in plan_data:
-            self.table.insert("", "end", values=(item["category"], item["amount"], item["percent"]))
+        """
+        Show plan rows ({category, amount, percent}, optionally a "key").
+        Rows are reconciled by key, so only changed rows are touched; past
+        VIRTUAL_THRESHOLD rows only the visible window is materialized.
+        """
+        plan_data = list(plan_data)
+        self._rows = plan_data
+        if len(plan_data) > VIRTUAL_THRESHOLD:
+            if not self.virtual_mode:
+                self._sync.clear()
+                self.virtual_mode = True
+                self.table.config(height=VIRTUAL_HEIGHT)
+                self.table_scroll.pack(side="right", fill="y", before=self.table)
+            self._virtual.set_rows(plan_data)
+            self.table_scroll.set(*self._virtual.first_last())
+        else:
+            if self.virtual_mode:
+                self._virtual.clear()
+                self.virtual_mode = False
+                self.table.config(height=6)
+                self.table_scroll.pack_forget()
+            self._sync.update(plan_data)
         self.notes_label.config(text=notes or "")
 
+    def current_rows(self):
+        """All rows of the plan shown (including those not materialized in virtual mode)."""
+        return list(self._rows)
+
     def _get_text(self, key):
         texts = {
             'en': {
@@ -0,0 +1,163 @@
+# src/budget_app/ui/startup.py
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+# Fallback origin when the process start time cannot be read (non-Linux):
+# the first import of this module, i.e. early in the entry point.
+_IMPORTED_AT = time.perf_counter()
+
+
+def process_uptime():
+    """Seconds since this process was launched (interpreter start included on Linux)."""
+    try:
+        with open("/proc/self/stat") as f:
+            # field 22 (starttime) is in clock ticks since boot; comm may contain spaces
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return time.perf_counter() - _IMPORTED_AT
+
+
+class StartupProfile:
+    """
+    Opt-in startup instrumentation: import timings (what `python -X importtime`
+    prints, collected in-process) and timed sections of widget construction.
+
+    Disabled, section() hands back one shared no-op context manager and imports
+    are not wrapped, so the instrumented code costs nothing. enable() wraps
+    builtins.__import__ on the calling thread: each import statement that loads
+    new modules is recorded with its cumulative and self time and its nesting.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.imports = []   # (depth, module, self seconds, cumulative seconds)
+        self.sections = []  # (name, seconds)
+        self._original_import = None
+        self._thread = None
+        self._stack = []
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self._thread = threading.get_ident()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def disable(self):
+        if self.enabled:
+            builtins.__import__ = self._original_import
+            self.enabled = False
+
+    def section(self, name):
+        return _Section(self, name) if self.enabled else _NO_SECTION
+
+    def report(self, top=30):
+        """Import and section timings as text, slowest imports first."""
+        lines = [f"imports (top {top} by cumulative time):", "      self [ms] | cumulative [ms] | module"]
+        for depth, name, own, total in sorted(self.imports, key=lambda r: -r[3])[:top]:
+            lines.append(f"{own * 1000:>14.1f} | {total * 1000:>15.1f} | {'  ' * depth}{name}")
+        lines.append("widgets:")
+        for name, seconds in self.sections:
+            lines.append(f"{seconds * 1000:>14.1f} ms  {name}")
+        return "\n".join(lines)
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if threading.get_ident() != self._thread:
+            return self._original_import(name, globals, locals, fromlist, level)
+        before = len(sys.modules)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            if len(sys.modules) != before:
+                self.imports.append((len(self._stack), _module_name(name, globals, level), total - children, total))
+
+
+class _Section:
+    __slots__ = ("profile", "name", "start")
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profile.sections.append((self.name, time.perf_counter() - self.start))
+        return False
+
+
+class _NoSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SECTION = _NoSection()
+
+# The process-wide profile: MainWindow and the entry point time their sections here.
+PROFILE = StartupProfile()
+
+
+def _module_name(name, globals, level):
+    if not level:
+        return name
+    try:
+        return importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+    except (ImportError, ValueError):
+        return "." * level + name
+
+
+def report_first_frame(window, exit_after=False, stream=None):
+    """
+    Once 'window' has been mapped and drawn, write the time from process launch
+    to that first frame (and, if PROFILE is enabled, its report) and store it as
+    window.startup_seconds; with exit_after=True the window then closes (for
+    startup benchmarks).
+    """
+    def on_map(event):
+        if event.widget is not window:
+            return
+        window.unbind("<Map>", bind_id)
+        window.after_idle(done)  # after the pending redraws of the first frame
+
+    def done():
+        window.startup_seconds = process_uptime()
+        out = stream or sys.stderr
+        print(f"startup: first frame after {window.startup_seconds * 1000:.0f} ms", file=out)
+        if PROFILE.enabled:
+            PROFILE.disable()
+            print(PROFILE.report(), file=out)
+        out.flush()
+        if exit_after:
+            window.destroy()
+
+    bind_id = window.bind("<Map>", on_map, add="+")
+
+
+# Launch-to-first-frame budget checked in CI (tests/test_startup.py, on Linux
+# under a virtual display); override with FINANCEFLOW_STARTUP_BUDGET_MS.
+STARTUP_BUDGET_MS = 1500
+
+
+def startup_budget_ms():
+    return int(os.environ.get("FINANCEFLOW_STARTUP_BUDGET_MS", STARTUP_BUDGET_MS))
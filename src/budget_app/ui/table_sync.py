@@ -0,0 +1,121 @@
+# src/budget_app/ui/table_sync.py
+# Treeview helpers that only touch rows that changed. They use nothing but the
+# Treeview item API (insert/item/move/delete/get_children), so they also work
+# on any object that provides it.
+
+
+class TreeSync:
+    """
+    Keeps a ttk.Treeview in step with a list of row dicts, reconciled by key.
+
+    Rows whose values changed are updated in place, new keys are inserted,
+    vanished keys deleted, and rows are only moved when their position changed,
+    so an update that changes one amount touches one row (no flicker, O(changes)
+    Tk calls). The key is row["key"] if present (e.g. (month, category) for
+    projections), else row["category"]; repeated keys are told apart by their
+    occurrence.
+    """
+
+    def __init__(self, tree, columns):
+        self.tree = tree
+        self.columns = tuple(columns)
+        self._iids = {}     # key -> iid
+        self._values = {}   # key -> values shown
+        self._order = []    # iids, top to bottom
+
+    def update(self, rows):
+        """Reconcile the tree with 'rows'; returns (inserted, updated, deleted, moved)."""
+        tree = self.tree
+        inserted = updated = moved = 0
+        seen = {}
+        wanted = []
+        for row in rows:
+            key = row.get("key", row["category"])
+            n = seen.get(key, 0)
+            seen[key] = n + 1
+            if n:
+                key = (key, n)
+            values = tuple(row[c] for c in self.columns)
+            iid = self._iids.get(key)
+            if iid is None:
+                iid = tree.insert("", "end", values=values)
+                self._iids[key] = iid
+                self._order.append(iid)
+                inserted += 1
+            elif self._values[key] != values:
+                tree.item(iid, values=values)
+                updated += 1
+            self._values[key] = values
+            wanted.append((key, iid))
+
+        keep = {key for key, _ in wanted}
+        deleted = [key for key in self._iids if key not in keep]
+        if deleted:
+            gone = {self._iids.pop(key) for key in deleted}
+            for key in deleted:
+                del self._values[key]
+            tree.delete(*gone)
+            self._order = [iid for iid in self._order if iid not in gone]
+
+        order = self._order
+        for index, (_, iid) in enumerate(wanted):
+            if order[index] != iid:
+                tree.move(iid, "", index)
+                order.remove(iid)
+                order.insert(index, iid)
+                moved += 1
+        return inserted, updated, len(deleted), moved
+
+    def clear(self):
+        self.update([])
+
+
+class VirtualRows:
+    """
+    Shows a window of a long row list in a fixed number of Treeview rows.
+
+    Only 'height' rows ever exist in the tree; scrolling rewrites their values
+    in place (through TreeSync, keyed by slot), so tens of thousands of rows
+    (e.g. per-month projections) cost no more to show than one screenful.
+    yview() follows the Scrollbar command protocol and first_last() gives the
+    values for Scrollbar.set().
+    """
+
+    def __init__(self, tree, columns, height=20):
+        self.height = height
+        self.rows = []
+        self.offset = 0
+        self._sync = TreeSync(tree, columns)
+
+    def set_rows(self, rows):
+        self.rows = rows
+        self._render(self.offset)
+
+    def clear(self):
+        self.rows = []
+        self.offset = 0
+        self._sync.clear()
+
+    def scroll(self, units):
+        self._render(self.offset + units)
+
+    def yview(self, *args):
+        if not args:
+            return self.first_last()
+        if args[0] == "moveto":
+            self._render(int(float(args[1]) * len(self.rows)))
+        elif args[0] == "scroll":
+            step = self.height if args[2] == "pages" else 1
+            self._render(self.offset + int(args[1]) * step)
+        return None
+
+    def first_last(self):
+        n = len(self.rows)
+        if not n:
+            return 0.0, 1.0
+        return self.offset / n, min(self.offset + self.height, n) / n
+
+    def _render(self, offset):
+        self.offset = max(0, min(offset, len(self.rows) - self.height))
+        window = self.rows[self.offset:self.offset + self.height]
+        self._sync.update([dict(row, key=slot) for slot, row in enumerate(window)])
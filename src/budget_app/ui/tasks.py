@@ -0,0 +1,166 @@
+# src/budget_app/ui/tasks.py
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Job:
+    """
+    One background request. The worker function receives it as its first
+    argument and may call job.report(done, total) for progress, and check
+    job.cancelled to stop early once a newer request has superseded it.
+    """
+
+    def __init__(self, runner, key, generation):
+        self.key = key
+        self.generation = generation
+        self.future = None
+        self._runner = runner
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()  # only succeeds if it has not started yet
+
+    def report(self, done, total=None):
+        """Thread-safe; delivered to on_progress on the Tk thread."""
+        if not self.cancelled:
+            self._runner._progress.put((self, done, total))
+
+
+class BackgroundRunner:
+    """
+    Runs slow work (planning, exports) off the Tk event loop.
+
+    Work goes to a single worker thread, so a Planner owned by the caller is only
+    ever used from that thread. Results come back through widget.after() polling:
+    callbacks (on_done, on_error, on_progress) always run on the Tk thread, and
+    widgets are never touched from the worker.
+
+    Requests are keyed ("plan", "export", ...). Submitting a new request for a key
+    cancels the previous one: it is dropped if it has not started, asked to stop
+    via job.cancelled if it has, and its result is discarded either way. Work that
+    must not be superseded (each export writes its own file, and its dialog waits
+    for on_done/on_error) is submitted under a key of its own, e.g. "export-3".
+
+    Usage:
+        runner = BackgroundRunner(root)
+        runner.submit("plan", build, data, on_done=show_plan, on_progress=plan_view.set_progress)
+    """
+
+    def __init__(self, widget, poll_ms=30, workers=1):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="budget-ui")
+        self._progress = queue.Queue()
+        self._latest = {}    # key -> newest Job
+        self._pending = []   # (job, on_done, on_error, on_progress)
+        self._generation = 0
+        self._polling = False
+
+    # ---------- public API ----------
+
+    def submit(self, key, fn, *args, on_done=None, on_error=None, on_progress=None):
+        previous = self._latest.get(key)
+        if previous is not None:
+            previous.cancel()
+        self._generation += 1
+        job = Job(self, key, self._generation)
+        self._latest[key] = job
+        job.future = self._executor.submit(fn, job, *args)
+        self._pending.append((job, on_done, on_error, on_progress))
+        self._schedule()
+        return job
+
+    def cancel(self, key=None):
+        """Cancel the newest request for 'key', or every request."""
+        for k, job in list(self._latest.items()):
+            if key is None or k == key:
+                job.cancel()
+                del self._latest[k]
+
+    def busy(self, key=None):
+        return any(not job.cancelled and (key is None or job.key == key) for job, *_ in self._pending)
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ---------- polling (Tk thread) ----------
+
+    def _schedule(self):
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        self._polling = False
+        callbacks = {id(job): on_progress for job, _, _, on_progress in self._pending}
+        while True:
+            try:
+                job, done, total = self._progress.get_nowait()
+            except queue.Empty:
+                break
+            on_progress = callbacks.get(id(job))
+            if on_progress is not None and self._is_current(job):
+                on_progress(done, total)
+
+        still_pending = []
+        for entry in self._pending:
+            job, on_done, on_error, _ = entry
+            if not job.future.done():
+                still_pending.append(entry)
+                continue
+            if not self._is_current(job):
+                continue  # superseded: drop the result silently
+            del self._latest[job.key]
+            error = None if job.future.cancelled() else job.future.exception()
+            if error is not None:
+                if on_error is not None:
+                    on_error(error)
+            elif on_done is not None:
+                on_done(job.future.result())
+        self._pending = still_pending
+        if self._pending:
+            self._schedule()
+
+    def _is_current(self, job):
+        return not job.cancelled and self._latest.get(job.key) is job
+
+
+class Debouncer:
+    """
+    Coalesces bursts of events: trigger() (re)starts a delay_ms timer with
+    widget.after(), and 'callback' runs once, on the Tk thread, when the events stop.
+    trigger() itself only cancels and re-arms a timer, so it is cheap enough to
+    call from every keystroke handler.
+    """
+
+    def __init__(self, widget, delay_ms, callback):
+        self.widget = widget
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self._after_id = None
+
+    def trigger(self, *_):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+        self._after_id = self.widget.after(self.delay_ms, self._fire)
+
+    def cancel(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    @property
+    def pending(self):
+        return self._after_id is not None
+
+    def _fire(self):
+        self._after_id = None
+        self.callback()
@@ -0,0 +1,468 @@
+import csv
+import gzip
+import importlib.util
+import io
+import os
+import re
+import time
+from collections import deque
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# pyarrow and reportlab are optional, and each takes ~0.1 s to import: only
+# their presence is checked here, they are imported on first use.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+_HAS_REPORTLAB = importlib.util.find_spec("reportlab") is not None
+
+# Long format: one row per PlanItem, so any number of plans streams through with
+# constant memory (nothing is held beyond the current plan and the write buffer).
+#   profile_id,category,kind,allocated
+#   42,Rent,fixed,1200.00
+#   42,Savings,savings,420.00
+CSV_HEADER = ("profile_id", "category", "kind", "allocated")
+
+# Written after the items of a plan when summary=True
+SUMMARY_FIELDS = ("total_income", "total_expenses", "savings", "remaining")
+
+# Columnar layout: the same long format, with category/kind dictionary-encoded
+# and amounts as int64 cents (ROUND_HALF_UP, like the CSV text). Summaries go to
+# a second file with one row per plan.
+#   items:   profile_id, category, kind, allocated_cents
+#   summary: profile_id, total_income_cents, total_expenses_cents, savings_cents, remaining_cents
+_ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+
+def write_plans_csv(
+    path: str,
+    results: Iterable[Any],
+    ids: Optional[Iterable[Any]] = None,
+    compress: Optional[bool] = None,
+    summary: bool = False,
+    buffer_size: int = 1 << 20,
+) -> int:
+    """
+    Stream PlanResults (or PlanResultRecords) to a long-format CSV; returns the
+    number of data rows written.
+
+    'results' may be any iterator, e.g. Planner.iter_plans(...). Each element is a
+    result or an (id, result) pair (as produced with importer.iter_inputs(with_ids = True));
+    otherwise ids come from 'ids', or are the 1-based position of the result.
+    The file is gzip-compressed when compress=True, or when compress is None and
+    the path ends with ".gz". With summary=True, each plan is followed by its
+    summary totals as rows of kind "summary".
+    """
+    if compress is None:
+        compress = path.endswith(".gz")
+    with open_text_output(path, compress, buffer_size) as f:
+        w = csv.writer(f)
+        w.writerow(CSV_HEADER)
+        count = 0
+        for profile_id, result in _with_ids(results, ids):
+            rows = [(profile_id, i.category, i.kind, str(i.allocated)) for i in result.items]
+            if summary:
+                s = result.summary
+                rows.extend((profile_id, name, "summary", str(getattr(s, name))) for name in SUMMARY_FIELDS)
+            w.writerows(rows)
+            count += len(rows)
+    return count
+
+
+def open_text_output(path: str, compress: bool = False, buffer_size: int = 1 << 20):
+    """UTF-8 text file for csv.writer with a large write buffer, optionally gzip-compressed."""
+    if compress:
+        # level 6 instead of gzip's default 9: files barely grow, writing is several times faster
+        raw = gzip.open(path, "wb", compresslevel = 6)
+        return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size), encoding = "utf-8", newline = "")
+    return open(path, "w", encoding = "utf-8", newline = "", buffering = buffer_size)
+
+
+def write_plans_columnar(
+    path: str,
+    results: Iterable[Any],
+    ids: Optional[Iterable[Any]] = None,
+    summary_path: Optional[str] = None,
+    fmt: Optional[str] = None,
+    row_group_size: int = 131072,
+) -> int:
+    """
+    Stream PlanResults to a Parquet or Arrow IPC file (see the layout above);
+    returns the number of item rows written.
+
+    'results' and 'ids' work as in write_plans_csv. Rows are buffered and written
+    as one row group (Parquet) or record batch (Arrow) every 'row_group_size' item
+    rows, so memory stays bounded by one group. fmt is "parquet" or "arrow"; by
+    default it follows the extension (.arrow/.feather/.ipc are Arrow, anything
+    else Parquet). With summary_path, per-plan summaries are written there in the
+    same format.
+    """
+    _require_pyarrow()
+    fmt = fmt or _columnar_format(path)
+    items = _ColumnarWriter(path, _item_schema(), fmt)
+    totals = _ColumnarWriter(summary_path, _summary_schema(), fmt) if summary_path else None
+    categories = _Dictionary()
+    kinds = _Dictionary()
+    buf: Tuple[List, ...] = ([], [], [], [])
+    sums: Tuple[List, ...] = tuple([] for _ in range(1 + len(SUMMARY_FIELDS)))
+    count = 0
+    try:
+        for profile_id, result in _with_ids(results, ids):
+            profile_id = str(profile_id)
+            pids, cats, kds, cents = buf
+            for i in result.items:
+                pids.append(profile_id)
+                cats.append(categories.code(i.category))
+                kds.append(kinds.code(i.kind))
+                cents.append(_to_cents(i.allocated))
+            if totals is not None:
+                s = result.summary
+                sums[0].append(profile_id)
+                for column, name in zip(sums[1:], SUMMARY_FIELDS):
+                    column.append(_to_cents(getattr(s, name)))
+            if len(pids) >= row_group_size:
+                count += items.write(_item_batch(buf, categories, kinds))
+                buf = ([], [], [], [])
+            if totals is not None and len(sums[0]) >= row_group_size:
+                totals.write(_summary_batch(sums))
+                sums = tuple([] for _ in sums)
+        if buf[0]:
+            count += items.write(_item_batch(buf, categories, kinds))
+        if totals is not None and sums[0]:
+            totals.write(_summary_batch(sums))
+    finally:
+        items.close()
+        if totals is not None:
+            totals.close()
+    return count
+
+
+def read_plans_table(path: str, columns: Optional[Sequence[str]] = None, fmt: Optional[str] = None):
+    """
+    Load a file written by write_plans_columnar as a pyarrow.Table, memory-mapped.
+
+    Arrow IPC files are mapped without copying (columns are views of the file);
+    Parquet is decoded from a mapped file. Use .to_pandas() for analysis in pandas.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    fmt = fmt or _columnar_format(path)
+    if fmt == "arrow":
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        return table.select(list(columns)) if columns is not None else table
+    import pyarrow.parquet as pq
+    return pq.read_table(path, columns = columns, memory_map = True)
+
+
+class PdfExportReport:
+    """What a PDF export produced; format is "csv" when it fell back to CSV."""
+
+    __slots__ = ("format", "paths", "plans", "pages", "seconds")
+
+    def __init__(self, fmt: str):
+        self.format = fmt
+        self.paths: List[str] = []
+        self.plans = 0
+        self.pages = 0
+        self.seconds = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return (f"PdfExportReport(format={self.format!r}, files={len(self.paths)}, plans={self.plans}, "
+                f"pages={self.pages}, pages_per_second={self.pages_per_second:.1f})")
+
+
+def write_plans_pdf(
+    path: str,
+    results: Iterable[Any],
+    ids: Optional[Iterable[Any]] = None,
+    title: str = "FinanceFlow Budget Plan",
+) -> PdfExportReport:
+    """
+    Render many plans into one PDF, one section per plan (each on a new page).
+
+    Styles and the table template are built once per process and shared by every
+    section. reportlab lays out the whole story at the end, so the sections of
+    all plans are held in memory; use write_plans_pdfs for very large batches.
+    Without reportlab, a long-format CSV (with summaries) is written next to
+    'path' instead.
+    """
+    start = time.perf_counter()
+    if not _HAS_REPORTLAB:
+        return _pdf_fallback(os.path.splitext(path)[0] + ".csv", results, ids, start)
+    _require_reportlab()
+    report = PdfExportReport("pdf")
+    rows = [_pdf_row(profile_id, result) for profile_id, result in _with_ids(results, ids)]
+    report.pages = _render_pdf(path, rows, title)
+    report.paths.append(path)
+    report.plans = len(rows)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def write_plans_pdfs(
+    directory: str,
+    results: Iterable[Any],
+    ids: Optional[Iterable[Any]] = None,
+    title: str = "FinanceFlow Budget Plan",
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+) -> PdfExportReport:
+    """
+    Render one PDF per plan into 'directory' (named after the profile id) on a
+    pool of worker processes; workers=1 renders in this process.
+
+    Plans are sent to the workers as plain strings, 'chunk_size' at a time, with at
+    most 2 x workers chunks in flight, so 'results' may be a long stream.
+    Without reportlab, a single plans.csv is written to 'directory' instead.
+    """
+    start = time.perf_counter()
+    os.makedirs(directory, exist_ok = True)
+    if not _HAS_REPORTLAB:
+        return _pdf_fallback(os.path.join(directory, "plans.csv"), results, ids, start)
+    _require_reportlab()
+    report = PdfExportReport("pdf")
+    rows = (_pdf_row(profile_id, result) for profile_id, result in _with_ids(results, ids))
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            _add_rendered(report, _render_pdf_chunk(directory, chunk, title))
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # ~40 ms to import, so only when used
+        with ProcessPoolExecutor(max_workers = workers) as pool:
+            pending = deque()
+            while True:
+                while len(pending) < 2 * workers:
+                    chunk = list(islice(rows, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(pool.submit(_render_pdf_chunk, directory, chunk, title))
+                if not pending:
+                    break
+                _add_rendered(report, pending.popleft().result())
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def pdf_styles():
+    """(stylesheet, plan TableStyle), built once per process and shared by every PDF."""
+    _require_reportlab()
+    return _pdf_styles()
+
+
+# ---------- helpers ----------
+
+def _with_ids(results: Iterable[Any], ids: Optional[Iterable[Any]]) -> Iterator[Tuple[Any, Any]]:
+    if ids is not None:
+        yield from zip(ids, results)
+        return
+    for n, entry in enumerate(results, start = 1):
+        if isinstance(entry, tuple):
+            yield entry
+        else:
+            yield n, entry
+
+
+def _require_pyarrow() -> None:
+    # public entry points check first, for a helpful error; helpers import pyarrow themselves
+    if not _HAS_PYARROW:
+        raise RuntimeError(
+            "Parquet/Arrow export requires the 'pyarrow' module.\n\n"
+            "Install it with:\n    pip install pyarrow"
+        )
+
+
+def _columnar_format(path: str) -> str:
+    return "arrow" if path.endswith(_ARROW_SUFFIXES) else "parquet"
+
+
+def _to_cents(m: Decimal) -> int:
+    return int(Decimal.scaleb(m, 2).to_integral_value(rounding = ROUND_HALF_UP))
+
+
+class _Dictionary:
+    """Stable value -> code mapping; codes only grow, so Arrow writes dictionary deltas."""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def encode(self, codes: List[int]):
+        import pyarrow as pa
+        return pa.DictionaryArray.from_arrays(pa.array(codes, pa.int32()), pa.array(self.values, pa.string()))
+
+
+class _ColumnarWriter:
+    """Parquet row groups or Arrow IPC record batches, appended one at a time."""
+
+    def __init__(self, path: str, schema, fmt: str):
+        import pyarrow as pa
+        self.rows = 0
+        if fmt == "arrow":
+            self._sink = pa.OSFile(path, "wb")
+            options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas = True)
+            self._writer = pa.ipc.new_file(self._sink, schema, options = options)
+        elif fmt == "parquet":
+            import pyarrow.parquet as pq
+            self._sink = None
+            self._writer = pq.ParquetWriter(path, schema)
+        else:
+            raise ValueError(f"Unknown columnar format {fmt!r}; expected 'parquet' or 'arrow'.")
+
+    def write(self, batch) -> int:
+        if self._sink is None:
+            import pyarrow as pa
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+        self.rows += batch.num_rows
+        return batch.num_rows
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+
+def _item_schema():
+    import pyarrow as pa
+    dict_string = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("profile_id", pa.string()),
+        ("category", dict_string),
+        ("kind", dict_string),
+        ("allocated_cents", pa.int64()),
+    ])
+
+
+def _summary_schema():
+    import pyarrow as pa
+    return pa.schema([("profile_id", pa.string())] + [(f"{name}_cents", pa.int64()) for name in SUMMARY_FIELDS])
+
+
+def _item_batch(buf, categories: _Dictionary, kinds: _Dictionary):
+    import pyarrow as pa
+    pids, cats, kds, cents = buf
+    return pa.record_batch(
+        [pa.array(pids, pa.string()), categories.encode(cats), kinds.encode(kds), pa.array(cents, pa.int64())],
+        schema = _item_schema(),
+    )
+
+
+def _summary_batch(sums):
+    import pyarrow as pa
+    columns = [pa.array(sums[0], pa.string())] + [pa.array(c, pa.int64()) for c in sums[1:]]
+    return pa.record_batch(columns, schema = _summary_schema())
+
+
+def _require_reportlab() -> None:
+    # as _require_pyarrow: the PDF helpers import what they use
+    if not _HAS_REPORTLAB:
+        raise RuntimeError(
+            "PDF export requires the 'reportlab' module.\n\n"
+            "Install it with:\n    pip install reportlab"
+        )
+
+
+@lru_cache(maxsize = 1)
+def _pdf_styles():
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import TableStyle
+    table_style = TableStyle([
+        ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#eaeaea")),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+        ('ALIGN', (-1,1), (-1,-1), 'RIGHT'),
+        ('BOTTOMPADDING', (0,0), (-1,0), 8),
+    ])
+    return getSampleStyleSheet(), table_style
+
+
+def _pdf_row(profile_id, result) -> Tuple[str, List[Tuple[str, str, str]], List[str]]:
+    """A plan as the strings a PDF section shows (cheap to send to a worker)."""
+    s = result.summary
+    items = [(i.category, i.kind, str(i.allocated)) for i in result.items]
+    return str(profile_id), items, [str(getattr(s, name)) for name in SUMMARY_FIELDS]
+
+
+_SUMMARY_LABELS = ("Total income", "Total expenses", "Savings", "Remaining")
+
+
+def _pdf_section(row, title: str) -> list:
+    from reportlab.platypus import Paragraph, Spacer, Table
+    styles, table_style = _pdf_styles()
+    profile_id, items, totals = row
+    story = [Paragraph(f"{title} \u2014 {profile_id}", styles['Title'])]
+    for label, amount in zip(_SUMMARY_LABELS, totals):
+        story.append(Paragraph(f"{label}: ${amount}", styles['Normal']))
+    story.append(Spacer(1, 12))
+    rows = [["Category", "Kind", "Amount"]] + [[c, k, f"${a}"] for c, k, a in items]
+    story.append(Table(rows, hAlign = 'LEFT', style = table_style))
+    return story
+
+
+def _render_pdf(path: str, rows, title: str) -> int:
+    """Build one document from the sections of 'rows'; returns its page count."""
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.platypus import PageBreak, SimpleDocTemplate
+    doc = SimpleDocTemplate(path, pagesize = LETTER, title = title)
+    story = []
+    for row in rows:
+        if story:
+            story.append(PageBreak())
+        story.extend(_pdf_section(row, title))
+    doc.build(story)
+    return doc.page
+
+
+def _render_pdf_chunk(directory: str, rows, title: str) -> Tuple[List[str], int]:
+    paths, pages = [], 0
+    for row in rows:
+        path = os.path.join(directory, _safe_filename(row[0]) + ".pdf")
+        pages += _render_pdf(path, [row], title)
+        paths.append(path)
+    return paths, pages
+
+
+def _add_rendered(report: PdfExportReport, rendered: Tuple[List[str], int]) -> None:
+    paths, pages = rendered
+    report.paths.extend(paths)
+    report.plans += len(paths)
+    report.pages += pages
+
+
+def _safe_filename(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name).strip(".") or "plan"
+
+
+def _pdf_fallback(path: str, results, ids, start: float) -> PdfExportReport:
+    report = PdfExportReport("csv")
+    plans = 0
+
+    def counted():
+        nonlocal plans
+        for entry in _with_ids(results, ids):
+            plans += 1
+            yield entry
+
+    write_plans_csv(path, counted(), summary = True)
+    report.paths.append(path)
+    report.plans = plans
+    report.seconds = time.perf_counter() - start
+    return report
@@ -0,0 +1,204 @@
+import csv
+import gzip
+import io
+import json
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+from pydantic import TypeAdapter, ValidationError
+from src.budget_app.core.defaults import default_template
+from src.budget_app.core.models import PlanningInput
+from src.budget_app.core.records import PlanningInputRecord
+
+_INPUT_LIST = TypeAdapter(List[PlanningInput])
+
+# CSV layout: list/object sections are JSON cells, scalar settings can also be
+# given as dotted columns. Empty cells fall back to the defaults.
+#   id,incomes,fixed,variables,preferences.savings_rate_min,preferences.round_to
+#   42,"[{""name"":""Job"",""amount"":""4200""}]",,,0.15,5
+_JSON_COLUMNS = ("incomes", "fixed", "variables", "preferences", "constraints")
+
+
+class RowError:
+    """A record that could not be imported (line is 1-based, header excluded)."""
+
+    __slots__ = ("line", "message")
+
+    def __init__(self, line: int, message: str):
+        self.line = line
+        self.message = message
+
+    def __repr__(self):
+        return f"RowError(line={self.line}, message={self.message!r})"
+
+
+class ImportReport:
+    """Counts for one import; keeps the first max_errors RowErrors."""
+
+    def __init__(self, max_errors: int = 1000):
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[RowError] = []
+        self.max_errors = max_errors
+
+    def add_error(self, error: RowError) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(error)
+
+
+def iter_inputs(
+    source: Union[str, Iterable[str]],
+    fmt: Optional[str] = None,
+    chunk_size: int = 1000,
+    report: Optional[ImportReport] = None,
+    on_error: Optional[Callable[[RowError], None]] = None,
+    compact: bool = False,
+    with_ids: bool = False,
+) -> Iterator[Union[PlanningInput, PlanningInputRecord, Tuple[str, Union[PlanningInput, PlanningInputRecord]]]]:
+    """
+    Stream PlanningInputs from a CSV or JSON Lines source (a path, optionally
+    .gz, or an iterable of lines).
+
+    Records are merged with the shared default template and validated chunk_size at a time. Bad records do not stop the import: each one
+    is reported as a RowError to 'report' and/or 'on_error', and skipped.
+    With compact=True, PlanningInputRecords are yielded instead of models; with
+    with_ids=True, (id, input) pairs, where id is the record's "id" field or its line.
+    Memory stays bounded by one chunk, whatever the file size.
+    """
+    report = report if report is not None else ImportReport()
+    if fmt is None:
+        fmt = _guess_format(source)
+    base = default_template()
+
+    lines = _open_lines(source)
+    try:
+        records = _csv_records(lines) if fmt == "csv" else _jsonl_records(lines)
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return
+            yield from _validate_chunk(chunk, base, report, on_error, compact, with_ids)
+    finally:
+        close = getattr(lines, "close", None)
+        if close is not None:
+            close()
+
+
+def load_inputs(
+    source: Union[str, Iterable[str]], fmt: Optional[str] = None, **kwargs,
+) -> Tuple[List[Union[PlanningInput, PlanningInputRecord, Tuple[str, Union[PlanningInput, PlanningInputRecord]]]], ImportReport]:
+    """Eager form of iter_inputs: (inputs, report); the items are as iter_inputs yields them."""
+    report = ImportReport()
+    return list(iter_inputs(source, fmt = fmt, report = report, **kwargs)), report
+
+
+# ---------- helpers ----------
+
+def _guess_format(source) -> str:
+    if isinstance(source, str):
+        name = source[:-3] if source.endswith(".gz") else source
+        if name.endswith(".csv"):
+            return "csv"
+        if name.endswith((".jsonl", ".ndjson", ".json")):
+            return "jsonl"
+    raise ValueError("Cannot tell the input format; pass fmt='csv' or fmt='jsonl'.")
+
+
+def _open_lines(source):
+    if not isinstance(source, str):
+        return iter(source)
+    if source.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(source, "rb"), encoding = "utf-8", newline = "")
+    return open(source, "r", encoding = "utf-8", newline = "")
+
+
+def _jsonl_records(lines) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """(line, partial dict or None, error message or None); blank lines are skipped."""
+    for n, line in enumerate(lines, start = 1):
+        if not line.strip():
+            continue
+        try:
+            obj = json.loads(line)
+        except ValueError as e:
+            yield n, None, f"invalid JSON: {e}"
+            continue
+        if not isinstance(obj, dict):
+            yield n, None, "expected a JSON object"
+            continue
+        yield n, obj, None
+
+
+def _csv_records(lines) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    reader = csv.DictReader(lines)
+    for n, row in enumerate(reader, start = 1):
+        partial: dict = {}
+        error = None
+        try:
+            for key, cell in row.items():
+                if key is None or cell is None or cell == "":
+                    continue
+                if key in _JSON_COLUMNS:
+                    partial[key] = json.loads(cell)
+                elif "." in key:
+                    section, field = key.split(".", 1)
+                    target = partial.setdefault(section, {})
+                    if not isinstance(target, dict):
+                        error = f"column {key!r} sets a field of {section!r}, which is not an object"
+                        break
+                    target[field] = cell
+                else:
+                    partial[key] = cell
+        except ValueError as e:
+            error = f"invalid JSON in CSV cell: {e}"
+        if error is not None:
+            yield n, None, error
+            continue
+        yield n, partial, None
+
+
+def _merge(base: dict, partial: dict) -> dict:
+    merged = {**base, **partial}
+    # dotted CSV columns give only some settings of a section
+    for section in ("preferences", "constraints"):
+        value = partial.get(section)
+        if isinstance(value, dict):
+            merged[section] = {**base[section], **value}
+    return merged
+
+
+def _validate_chunk(chunk, base, report, on_error, compact, with_ids):
+    good: List[Tuple[int, dict]] = []
+    for line, partial, error in chunk:
+        report.rows += 1
+        if error is not None:
+            _fail(report, on_error, RowError(line, error))
+        else:
+            good.append((line, partial))
+
+    inputs: List[Optional[PlanningInput]]
+    try:
+        inputs = _INPUT_LIST.validate_python([_merge(base, p) for _, p in good])
+    except ValidationError as e:
+        # one bulk call reports every failing record by index; validate the rest again
+        bad = {}
+        for err in e.errors():
+            bad.setdefault(err["loc"][0], f"{'.'.join(str(x) for x in err['loc'][1:])}: {err['msg']}")
+        for index in sorted(bad):
+            _fail(report, on_error, RowError(good[index][0], bad[index]))
+        good = [g for i, g in enumerate(good) if i not in bad]
+        inputs = _INPUT_LIST.validate_python([_merge(base, p) for _, p in good])
+
+    for (line, partial), data in zip(good, inputs):
+        report.imported += 1
+        value = PlanningInputRecord.from_model(data) if compact else data
+        if with_ids:
+            yield str(partial.get("id", line)), value
+        else:
+            yield value
+
+
+def _fail(report: ImportReport, on_error, error: RowError) -> None:
+    report.add_error(error)
+    if on_error is not None:
+        on_error(error)
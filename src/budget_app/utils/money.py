@@ -1,4 +1,6 @@
-from decimal import Decimal, ROUND_HALF_UP, getcontext
+import threading
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP, getcontext
+from functools import lru_cache
 
 # Configure global decimal precision
 getcontext().prec = 28  # 28 digits precision is plenty for finance
@@ -10,6 +12,29 @@ class Money(Decimal):
         # Convert anything (int, float, str) to Decimal safely
         return super().__new__(cls, str(value))
 
+    @classmethod
+    def from_decimal(cls, value) -> "Money":
+        """Build Money from a Decimal, float or int (e.g. a savings rate)."""
+        return cls(value)
+
+    # Let pydantic v2 validate/serialize Money fields
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        from pydantic_core import core_schema
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization = core_schema.plain_serializer_function_ser_schema(str, when_used = "json"),
+        )
+
+    @classmethod
+    def _validate(cls, value) -> "Money":
+        if isinstance(value, Money):
+            return value
+        try:
+            return cls(value)
+        except (InvalidOperation, TypeError, ValueError):
+            raise ValueError(f"invalid money amount: {value!r}")
+
     # Standard rounding to 2 decimal places (cents)
     def round2(self) -> "Money":
         return Money(self.quantize(Decimal("0.01"), rounding = ROUND_HALF_UP))
@@ -31,9 +56,198 @@ class Money(Decimal):
     def __sub__(self, other):
         return Money(super().__sub__(Money(other)))
 
+    # Rates (e.g. savings_rate_min) keep their full precision
+    def __mul__(self, other):
+        if not isinstance(other, Decimal):
+            other = Decimal(str(other))
+        return Money(super().__mul__(other))
+
     # Optional helpers
     def is_positive(self) -> bool:
         return self > 0
 
     def is_zero(self) -> bool:
         return self == 0
+
+
+_CENT = Decimal("0.01")
+_ONE = Decimal("1")
+_new = Decimal.__new__
+
+
+class FastMoney(Money):
+    """
+    Money without the str() round-trips.
+
+    Decimal and int values are adopted directly instead of being formatted and
+    re-parsed, and arithmetic wraps the raw Decimal result. Arithmetic follows
+    Money exactly (the right-hand operand of + and - is rounded to cents, as
+    Money(other) does), so a Planner can run on either type with identical results.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value = "0.00"):
+        if isinstance(value, (Decimal, int)):
+            return _new(cls, value)
+        return _new(cls, str(value))
+
+    def round2(self) -> "FastMoney":
+        return _new(FastMoney, self.quantize(_CENT, rounding = ROUND_HALF_UP))
+
+    def quantize_to_step(self, step) -> "FastMoney":
+        quantized = Decimal.__truediv__(self, step).quantize(_ONE, rounding = ROUND_HALF_UP) * step
+        return _new(FastMoney, quantized)
+
+    def __add__(self, other):
+        return _new(FastMoney, Decimal.__add__(self, _operand(other)))
+
+    # Reflected (other + self): a Money on the left keeps its value and rounds
+    # self to cents, as Money.__add__ does; ints and plain Decimals add exactly,
+    # as Decimal's own reflected operators do for Money.
+    def __radd__(self, other):
+        if not isinstance(other, (Decimal, int)):
+            return NotImplemented
+        right = _operand(self) if isinstance(other, Money) else self
+        return _new(FastMoney, Decimal.__add__(Decimal(other), right))
+
+    def __sub__(self, other):
+        return _new(FastMoney, Decimal.__sub__(self, _operand(other)))
+
+    def __rsub__(self, other):
+        if not isinstance(other, (Decimal, int)):
+            return NotImplemented
+        right = _operand(self) if isinstance(other, Money) else self
+        return _new(FastMoney, Decimal.__sub__(Decimal(other), right))
+
+    def __mul__(self, other):
+        if not isinstance(other, Decimal):
+            other = Decimal(str(other))
+        return _new(FastMoney, Decimal.__mul__(self, other))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Decimal):
+            other = Decimal(str(other))
+        return _new(FastMoney, Decimal.__truediv__(self, other))
+
+    def __neg__(self):
+        return _new(FastMoney, Decimal.__neg__(self))
+
+    def __abs__(self):
+        return _new(FastMoney, Decimal.__abs__(self))
+
+
+def _operand(value) -> Decimal:
+    """The Decimal that Money(value) would produce, without formatting when possible."""
+    if isinstance(value, Money):
+        # str(Money) rounds to cents; values already in whole cents are unchanged
+        if not value % _CENT:
+            return value
+        return value.quantize(_CENT, rounding = ROUND_HALF_UP)
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+class StepRounding:
+    """
+    Money.quantize_to_step for one fixed step, set up once.
+
+    Steps of 0.01 and 1.00 use a single quantize instead of divide/quantize/multiply;
+    a step <= 0 leaves values unchanged (Planner's "no rounding"). Results carry the
+    given Money class without a str() round-trip. Use step_rounding() to share
+    instances per step.
+    """
+
+    __slots__ = ("step", "money", "round", "_step")
+
+    def __init__(self, step, money = Money):
+        self.step = step
+        self.money = money
+        self._step = Decimal(step)
+        if step <= 0:
+            self.round = self._unchanged
+        elif step == _CENT:
+            self.round = self._to_cents
+        elif step == _ONE:
+            self.round = self._to_whole
+        else:
+            self.round = self._to_step
+
+    def _unchanged(self, m):
+        return m
+
+    def _to_cents(self, m):
+        return _new(self.money, m.quantize(_CENT, rounding = ROUND_HALF_UP))
+
+    def _to_whole(self, m):
+        return _new(self.money, m.quantize(_ONE, rounding = ROUND_HALF_UP))
+
+    def _to_step(self, m):
+        step = self._step
+        return _new(self.money, Decimal.__truediv__(m, step).quantize(_ONE, rounding = ROUND_HALF_UP) * step)
+
+
+@lru_cache(maxsize = 32)
+def step_rounding(step, money = Money) -> StepRounding:
+    """Shared StepRounding per (round_to, Money class)."""
+    return StepRounding(step, money)
+
+
+# ---------- allocation counting (opt-in, see core/instrumentation.py) ----------
+
+class _Allocations(threading.local):
+    count = 0  # per thread: a plan's stages run on one thread, other threads' Money is not counted
+
+
+_allocations = _Allocations()
+_counting = 0
+_counting_lock = threading.Lock()
+_decimal_new = _new
+_money_new = Money.__dict__["__new__"]
+
+
+def _counted_new(cls, value = "0"):
+    _allocations.count += 1
+    return _decimal_new(cls, value)
+
+
+def _counted_money_new(cls, value = "0.00"):
+    _allocations.count += 1
+    return _money_new.__func__(cls, value)
+
+
+def start_counting_allocations() -> None:
+    """
+    Count every Money/FastMoney object created from now on until the matching
+    stop_counting_allocations(); calls nest, also across threads (counting stays
+    on until the last one stops). Each thread counts its own objects. While
+    counting, object creation in every thread goes through a Python-level
+    counter, so it is slower.
+    """
+    global _counting, _new
+    with _counting_lock:
+        _counting += 1
+        if _counting == 1:
+            _new = _counted_new
+            Money.__new__ = staticmethod(_counted_money_new)
+
+
+def stop_counting_allocations() -> None:
+    global _counting, _new
+    with _counting_lock:
+        if _counting == 0:
+            return
+        _counting -= 1
+        if _counting == 0:
+            _new = _decimal_new
+            Money.__new__ = _money_new
+
+
+def money_allocations() -> int:
+    """Money objects this thread created while counting was on (a running total; take differences)."""
+    return _allocations.count
@@ -0,0 +1,30 @@
+import io
+
+from benchmarks.corpus import PROFILES, household_corpus, partial_inputs
+from benchmarks.suite import compare, run_suite
+from src.budget_app.core.defaults import merge_with_defaults
+from src.budget_app.core.models import PlanningInput
+
+
+def test_corpus_is_seeded_and_valid():
+    assert household_corpus(50, seed = 3) == household_corpus(50, seed = 3)
+    assert household_corpus(50, seed = 3) != household_corpus(50, seed = 4)
+    for profile in ("mixed", *PROFILES):
+        for raw in household_corpus(20, seed = 1, profile = profile):
+            data = PlanningInput.model_validate(raw)
+            names = [v.name for v in data.variables]
+            assert len(names) == len(set(names))
+    for partial in partial_inputs(20, seed = 1):
+        merge_with_defaults(partial)
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    current = run_suite(size = 5, repeat = 1, only = "merge_with_defaults", out = io.StringIO())
+    best = current["results"]["merge_with_defaults"]["best_s"]
+    assert current["meta"]["size"] == 5
+
+    faster = {"results": {"merge_with_defaults": {"best_s": best * 2}}}
+    slower = {"results": {"merge_with_defaults": {"best_s": best / 1.2}}}
+    assert compare(faster, current)[0][4] == "faster"
+    assert compare(slower, current, threshold = 0.1)[0][4] == "regression"
+    assert compare(slower, current, threshold = 0.25)[0][4] == "ok"
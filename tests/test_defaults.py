@@ -0,0 +1,27 @@
+import pytest
+
+from src.budget_app.core.defaults import default_input, default_template, merge_with_defaults, starter_input
+from src.budget_app.utils.money import Money
+
+
+def test_merge_matches_starter_template_and_never_shares_state():
+    assert default_input() == starter_input()
+    assert merge_with_defaults({}) == starter_input()
+
+    a = merge_with_defaults({"incomes": [{"name": "Job", "amount": "100"}]})
+    b = merge_with_defaults({})
+    assert a.incomes[0].amount == Money("100") and a.fixed == b.fixed
+    a.fixed[0].amount = Money("999")
+    a.preferences.round_to = Money("5")
+    assert b.fixed[0].amount == Money("0")
+    assert merge_with_defaults({}).preferences.round_to == Money("1.00")
+
+
+def test_default_template_is_read_only():
+    template = default_template()
+    assert template is default_template()
+    with pytest.raises(TypeError):
+        template["incomes"] = []
+    with pytest.raises(TypeError):
+        template["preferences"]["round_to"] = Money("5")
+    assert isinstance(template["variables"], tuple)
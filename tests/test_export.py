@@ -0,0 +1,90 @@
+import csv
+import gzip
+import os
+from decimal import Decimal
+
+import pytest
+
+from src.budget_app.core.planner import Planner
+from src.budget_app.ui.export_dialog import _export_plan_to_csv
+from src.budget_app.utils import export
+from src.budget_app.utils.export import CSV_HEADER, read_plans_table, write_plans_columnar, write_plans_csv
+from test_planner import corpus
+
+
+def test_streaming_csv_export_writes_long_format(tmp_path):
+    inputs = corpus(50, seed = 3)
+    results = Planner().build_plans(inputs)
+    path = str(tmp_path / "plans.csv.gz")
+
+    # any iterator works, including (id, result) pairs
+    count = write_plans_csv(path, ((f"p{n}", r) for n, r in enumerate(results)), summary = True)
+
+    with gzip.open(path, "rt", encoding = "utf-8", newline = "") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == CSV_HEADER and len(rows) - 1 == count
+    expected = []
+    for n, r in enumerate(results):
+        expected += [[f"p{n}", i.category, i.kind, str(i.allocated)] for i in r.items]
+        expected += [[f"p{n}", "remaining", "summary", str(r.summary.remaining)]]
+    assert [row for row in rows[1:] if row[2] != "summary" or row[1] == "remaining"] == expected
+
+    plain = str(tmp_path / "plans.csv")
+    assert write_plans_csv(plain, iter(results), ids = range(100, 150)) == count - 4 * len(results)
+    with open(plain, encoding = "utf-8") as f:
+        assert f.readlines()[1].startswith("100,")
+
+
+def test_dialog_csv_export_delegates_for_plan_results(tmp_path):
+    results = Planner().build_plans(corpus(3, seed = 5))
+    path = str(tmp_path / "batch.csv")
+    _export_plan_to_csv({"results": results, "ids": ["a", "b", "c"]}, path)
+    with open(path, encoding = "utf-8", newline = "") as f:
+        rows = list(csv.reader(f))
+    assert {row[0] for row in rows[1:]} == {"a", "b", "c"}
+
+    legacy = str(tmp_path / "one.csv")
+    _export_plan_to_csv({"period": "month", "categories": {"Food": "200.00"}, "leftover": "5.00"}, legacy)
+    with open(legacy, encoding = "utf-8") as f:
+        assert "Food,200.00" in f.read()
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_columnar_export_round_trips_in_row_groups(tmp_path, suffix):
+    pytest.importorskip("pyarrow")
+    results = Planner().build_plans(corpus(40, seed = 9))
+    path, totals = str(tmp_path / f"items{suffix}"), str(tmp_path / f"summary{suffix}")
+
+    count = write_plans_columnar(path, iter(results), summary_path = totals, row_group_size = 16)
+
+    table = read_plans_table(path)
+    assert table.num_rows == count == sum(len(r.items) for r in results)
+    assert str(table.schema.field("category").type).startswith("dictionary")
+    expected = [(str(n), i.category, i.kind, int(Decimal(str(i.allocated)) * 100))
+                for n, r in enumerate(results, start = 1) for i in r.items]
+    got = table.to_pydict()
+    assert list(zip(got["profile_id"], got["category"], got["kind"], got["allocated_cents"])) == expected
+    assert read_plans_table(totals, columns = ["remaining_cents"]).column(0).to_pylist() == [
+        int(Decimal(str(r.summary.remaining)) * 100) for r in results
+    ]
+    if suffix == ".parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+        assert pq.ParquetFile(path).num_row_groups > 1
+
+
+def test_bulk_pdf_export_and_csv_fallback(tmp_path, monkeypatch):
+    pytest.importorskip("reportlab")
+    results = Planner().build_plans(corpus(4, seed = 11))
+
+    report = export.write_plans_pdf(str(tmp_path / "all.pdf"), results)
+    assert (report.format, report.plans, report.pages) == ("pdf", 4, 4)
+    assert report.pages_per_second > 0
+
+    report = export.write_plans_pdfs(str(tmp_path / "each"), zip(["a/1", "b", "c", "d"], results), workers = 1, chunk_size = 3)
+    assert [os.path.basename(p) for p in report.paths] == ["a_1.pdf", "b.pdf", "c.pdf", "d.pdf"]
+    assert all(open(p, "rb").read(5) == b"%PDF-" for p in report.paths)
+
+    monkeypatch.setattr(export, "_HAS_REPORTLAB", False)
+    report = export.write_plans_pdf(str(tmp_path / "statements.pdf"), iter(results))
+    assert report.format == "csv" and report.plans == 4
+    assert report.paths == [str(tmp_path / "statements.csv")]
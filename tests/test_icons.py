@@ -0,0 +1,39 @@
+import os
+import sys
+import types
+
+from src.budget_app.ui.icons import ASSETS_DIR, IconCache, fallback_png
+
+SVG = os.path.join(ASSETS_DIR, "output_26dp_1F1F1F_FILL0_wght400_GRAD0_opsz24.svg")
+
+
+def test_icon_cache_rasterizes_once_per_size_and_mtime(tmp_path, monkeypatch):
+    svg = tmp_path / "icon_26dp_X.svg"
+    svg.write_bytes(open(SVG, "rb").read())
+    renders = []
+
+    def svg2png(url, write_to, output_width, output_height):
+        renders.append((output_width, output_height))
+        with open(write_to, "wb") as f:
+            f.write(b"png")
+
+    monkeypatch.setitem(sys.modules, "cairosvg", types.SimpleNamespace(svg2png = svg2png))
+    cache = IconCache(str(tmp_path / "cache"))
+
+    first = cache.png_path(str(svg), 48, 48)
+    assert cache.png_path(str(svg), 48, 48) == first and renders == [(48, 48)]
+    cache.png_path(str(svg), 24, 24)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    os.utime(svg, ns = (0, os.stat(svg).st_mtime_ns + 10 ** 9))
+    second = cache.png_path(str(svg), 48, 48)
+    assert second != first and not os.path.exists(first)
+    assert len(os.listdir(tmp_path / "cache")) == 2
+
+
+def test_icon_cache_falls_back_to_shipped_png(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "cairosvg", None)  # import fails
+    cache = IconCache(str(tmp_path / "cache"))
+    path = cache.png_path(SVG, 48, 48)
+    assert path == fallback_png(SVG) == os.path.join(ASSETS_DIR, "output_24dp_1F1F1F_FILL0_wght400_GRAD0_opsz24.png")
+    assert not os.path.exists(tmp_path / "cache")
@@ -0,0 +1,63 @@
+import gzip
+import json
+
+from src.budget_app.core.defaults import merge_with_defaults
+from src.budget_app.core.records import PlanningInputRecord
+from src.budget_app.utils.importer import ImportReport, iter_inputs, load_inputs
+from src.budget_app.utils.money import Money
+
+
+def test_jsonl_import_merges_defaults_and_reports_bad_rows(tmp_path):
+    rows = [
+        {"id": "a", "incomes": [{"name": "Job", "amount": "4000"}]},
+        "not json",
+        {"id": "c", "incomes": [{"name": "Job", "amount": "lots"}]},
+        {"id": "d", "preferences": {"round_to": "5"}},
+        [1, 2],
+    ]
+    path = tmp_path / "inputs.jsonl.gz"
+    with gzip.open(path, "wt", encoding = "utf-8") as f:
+        for row in rows:
+            f.write((row if isinstance(row, str) else json.dumps(row)) + "\n")
+
+    report = ImportReport()
+    seen = []
+    got = list(iter_inputs(str(path), chunk_size = 2, report = report, on_error = seen.append, with_ids = True))
+
+    assert [i for i, _ in got] == ["a", "d"]
+    assert got[0][1] == merge_with_defaults(rows[0])
+    assert got[1][1].preferences.round_to == Money("5")
+    assert (report.rows, report.imported, report.failed) == (5, 2, 3)
+    assert [e.line for e in report.errors] == [2, 3, 5] == [e.line for e in seen]
+    assert "incomes.0.amount" in report.errors[1].message
+
+
+def test_csv_import_with_json_cells_and_dotted_columns():
+    lines = [
+        "id,incomes,variables,preferences.savings_rate_min\n",
+        '1,"[{""name"": ""Job"", ""amount"": ""3000""}]","[{""name"": ""Food"", ""min_amount"": ""200""}]",0.2\n',
+        "2,,,\n",
+        '3,"[broken",,\n',
+    ]
+    inputs, report = load_inputs(lines, fmt = "csv", compact = True)
+
+    assert report.failed == 1 and report.errors[0].line == 3
+    assert all(isinstance(d, PlanningInputRecord) for d in inputs)
+    assert inputs[0].preferences.savings_rate_min == 0.2
+    assert inputs[0].preferences.round_to == Money("1.00")
+    assert [v.name for v in inputs[0].variables] == ["Food"]
+    assert inputs[1].to_model() == merge_with_defaults({})
+
+
+def test_csv_row_with_conflicting_section_cells_is_reported():
+    lines = [
+        "id,preferences,preferences.round_to\n",
+        "1,5,10\n",
+        '2,"{""savings_rate_min"": 0.3}",5\n',
+    ]
+    inputs, report = load_inputs(lines, fmt = "csv")
+
+    assert report.failed == 1 and report.errors[0].line == 1
+    assert "preferences" in report.errors[0].message
+    assert len(inputs) == 1
+    assert inputs[0].preferences.savings_rate_min == 0.3 and inputs[0].preferences.round_to == Money("5")
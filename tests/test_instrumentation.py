@@ -0,0 +1,71 @@
+import threading
+
+from src.budget_app.core.instrumentation import STAGES, Histogram, MemorySink, PlanMetrics, PrometheusFileSink
+from src.budget_app.core.models import PlanningInput
+from src.budget_app.core.planner import Planner
+from src.budget_app.utils.money import Money, money_allocations, start_counting_allocations, stop_counting_allocations
+
+from test_planner import corpus
+
+
+def test_instrumented_planner_records_every_stage():
+    inputs = [PlanningInput.model_validate(r) for r in corpus(100, seed = 3)]
+    memory = MemorySink()
+    metrics = PlanMetrics(sinks = [memory], flush_every = 50, count_allocations = True)
+    planner = Planner(metrics = metrics)
+
+    assert [planner.build_plan(d) for d in inputs] == [Planner().build_plan(d) for d in inputs]
+    assert len(memory.snapshots) == 2
+    snapshot = memory.latest
+    assert snapshot["plans"] == 100
+    assert list(snapshot["stages"]) == list(STAGES)
+    for stage in snapshot["stages"].values():
+        assert stage["seconds"]["count"] == 100
+        assert 0 < stage["seconds"]["p50"] <= stage["seconds"]["p99"] <= stage["seconds"]["max"]
+    items = sum(s["items"]["sum"] for s in snapshot["stages"].values())
+    assert items == sum(len(planner.build_plan(d).items) for d in inputs)
+    assert snapshot["stages"]["totals"]["roundings"]["sum"] == 200
+    assert snapshot["stages"]["totals"]["money_allocations"]["sum"] > 0
+
+    # counting is switched off between plans
+    before = money_allocations()
+    Money("1") + Money("2")
+    assert money_allocations() == before
+
+    # each thread counts its own Money objects
+    seen = []
+
+    def other_thread():
+        start = money_allocations()
+        start_counting_allocations()
+        for _ in range(50):
+            Money("1")
+        seen.append(money_allocations() - start)
+        stop_counting_allocations()
+
+    start_counting_allocations()
+    thread = threading.Thread(target = other_thread)
+    thread.start()
+    thread.join()
+    Money("1")
+    assert money_allocations() == before + 1 and seen == [50]
+    stop_counting_allocations()
+    Money("1")
+    assert money_allocations() == before + 1
+
+
+def test_histogram_quantiles_and_prometheus_file(tmp_path):
+    h = Histogram([1, 2, 4, 8])
+    for v in range(1, 101):
+        h.observe(v / 10)
+    assert h.count == 100 and h.min == 0.1 and h.max == 10
+    assert 4 <= h.quantile(0.5) <= 8 and 8 <= h.quantile(0.99) <= 10
+
+    path = tmp_path / "planner.prom"
+    metrics = PlanMetrics(sinks = [PrometheusFileSink(str(path))])
+    Planner(metrics = metrics).build_plan(PlanningInput.model_validate(corpus(1)[0]))
+    metrics.flush()
+    text = path.read_text()
+    assert "financeflow_planner_plans_total 1\n" in text
+    assert 'financeflow_planner_stage_seconds_bucket{stage="caps",le="+Inf"} 1' in text
+    assert 'financeflow_planner_stage_money_allocations_total{stage="totals"} 0' in text
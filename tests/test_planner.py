@@ -0,0 +1,380 @@
+import random
+import sqlite3
+from contextlib import closing
+from decimal import Decimal
+
+import pytest
+
+from src.budget_app.core.cache import CachingPlanner, PlanCache, canonical_digest
+from src.budget_app.core.defaults import merge_with_defaults
+from src.budget_app.core.disk_cache import DiskPlanCache
+from src.budget_app.core.incremental import IncrementalPlanner, diff_items
+from src.budget_app.core.instrumentation import PlanMetrics
+from src.budget_app.core.models import FixedExpense, Income, PlanningInput, Preferences, VariableExpense
+from src.budget_app.core.parallel import ParallelPlanner, decode_input, encode_input
+from src.budget_app.core.planner import Planner
+from src.budget_app.core.projection import Projector
+from src.budget_app.core.records import PlanningInputRecord, PlanResultRecord
+from src.budget_app.core.sweep import ScenarioSweep
+from src.budget_app.core.variable_index import VariableIndex
+from src.budget_app.utils.money import FastMoney, Money, step_rounding
+
+
+def _raw_input(rng: random.Random) -> dict:
+    """A random partial input (as it would arrive from JSON)."""
+    return {
+        "incomes": [{"name": f"Job {i}", "amount": str(rng.randint(500, 9000))} for i in range(rng.randint(1, 3))],
+        "fixed": [{"name": f"Bill {i}", "amount": f"{rng.randint(0, 2000)}.{rng.randint(0, 99):02d}"} for i in range(rng.randint(0, 4))],
+        "variables": [
+            {
+                "name": rng.choice(["Food", "fun", "Travel", "gym", "Books", "Kids"]) + str(i),
+                "min_amount": rng.choice([None, str(rng.randint(0, 400))]),
+                "max_amount": rng.choice([None, str(rng.randint(100, 1500))]),
+                "priority": rng.choice([10, 50, 100]),
+            }
+            for i in range(rng.randint(0, 6))
+        ],
+        "preferences": {"savings_rate_min": rng.choice([0, 0.05, 0.1, 0.123]), "round_to": rng.choice(["0.01", "1.00", "5", "0"])},
+    }
+
+
+def corpus(n: int = 200, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [_raw_input(rng) for _ in range(n)]
+
+
+def test_basic_plan():
+    data = merge_with_defaults({"incomes": [{"name": "Job", "amount": "5000"}], "fixed": [{"name": "Rent", "amount": "1500"}]})
+    result = Planner().build_plan(data)
+
+    assert [(i.category, i.kind, i.allocated) for i in result.items] == [
+        ("Rent", "fixed", Money("1500")),
+        ("Savings", "savings", Money("500")),
+        ("Groceries", "variable", Money("200")),
+        ("Transportation", "variable", Money("100")),
+        ("Entertainment", "variable", Money("2700")),
+    ]
+    assert result.summary.total_income == Money("5000")
+    assert result.summary.total_expenses == Money("4500")
+    assert result.summary.savings == Money("500")
+    assert result.summary.remaining == Money("0")
+
+
+def test_build_plans_matches_build_plan():
+    raw = corpus()
+    planner = Planner()
+    expected = [planner.build_plan(PlanningInput.model_validate(r)) for r in raw]
+
+    # mixed dicts and models, with a chunk size that does not divide the batch
+    mixed = [r if i % 3 else PlanningInput.model_validate(r) for i, r in enumerate(raw)]
+    assert planner.build_plans(mixed, chunk_size = 64) == expected
+    assert list(planner.iter_plans(iter(raw))) == expected
+
+
+def test_numpy_engine_matches_decimal_to_the_cent():
+    raw = corpus(500, seed = 11)
+    # sub-cent amounts and steps take the Decimal fallback path
+    raw[0]["incomes"][0]["amount"] = "1234.567"
+    raw[1]["preferences"]["round_to"] = "0.005"
+    raw[2]["variables"] = [{"name": "Food"}, {"name": "Food", "max_amount": "10"}]
+    planner = Planner()
+    expected = planner.build_plans(raw)
+    actual = planner.build_plans(raw, chunk_size = 128, engine = "numpy")
+    assert [r.model_dump(mode = "json") for r in actual] == [r.model_dump(mode = "json") for r in expected]
+    assert planner.build_plan(PlanningInput.model_validate(raw[3]), engine = "numpy") == expected[3]
+
+    # same Money class, counters and metrics as the Decimal engine
+    fast = Planner(money = FastMoney, metrics = PlanMetrics())
+    results = fast.build_plans(raw, engine = "numpy")
+    assert results == expected
+    assert {type(i.allocated) for r in results for i in r.items} == {FastMoney}
+    assert fast.plans_built == fast.metrics.plans == len(raw)
+
+
+def test_planner_runs_on_fast_money():
+    raw = corpus(300, seed = 5)
+    raw[0]["incomes"][0]["amount"] = "1234.567"
+    raw[1]["preferences"]["round_to"] = "0"
+    expected = Planner().build_plans(raw)
+    fast = Planner(money = FastMoney).build_plans(raw)
+    assert fast == expected
+    assert all(type(i.allocated) is FastMoney for r in fast for i in r.items)
+
+
+def test_fast_money_mixed_operands_match_money():
+    exact = Decimal.__str__
+    sub_cent = Decimal.__new__(Money, "10.004")
+    for left in (sub_cent, Money("2.50"), Decimal("2.001"), 3, 0):
+        for right in ("1.005", "7"):
+            slow, fast = Decimal.__new__(Money, right), FastMoney(right)
+            assert exact(left + fast) == exact(left + slow)
+            assert exact(left - fast) == exact(left - slow)
+            assert exact(fast + left) == exact(slow + left) and exact(fast - left) == exact(slow - left)
+
+
+def test_rounding_is_shared_per_step_and_counted():
+    step_rounding.cache_clear()
+    planner = Planner()
+    results = planner.build_plans(corpus(50, seed = 3))
+
+    assert planner.plans_built == len(results)
+    assert planner.last_roundings > 0
+    assert planner.total_roundings >= planner.last_roundings
+    # the corpus only uses four distinct round_to steps
+    assert step_rounding.cache_info().currsize <= 4
+
+    rounding = step_rounding(Money("5"))
+    assert rounding.round(Money("12.50")) == Money("15")
+    assert step_rounding(Money("0.01")).round(Money("2.675")) == Money("2.68")
+    assert step_rounding(Money("0")).round(Money("2.675")) == Money("2.675")
+
+
+def test_incremental_replan_matches_full_plan():
+    rng = random.Random(21)
+    planner = Planner()
+    inc = IncrementalPlanner()
+    data = PlanningInput.model_validate(_raw_input(rng))
+    first = inc.replan(data)
+    assert first.restarted_at == "totals"
+    assert first.changed == first.result.items
+
+    for _ in range(200):
+        edited = data.model_copy(deep = True)
+        what = rng.choice(["income", "fixed", "savings", "variable", "constraints"])
+        if what == "income":
+            edited.incomes[0].amount = Money(rng.randint(500, 9000))
+        elif what == "fixed" and edited.fixed:
+            edited.fixed[-1].amount = Money(rng.randint(0, 2000))
+        elif what == "savings":
+            edited.preferences.savings_rate_min = rng.choice([0, 0.05, 0.2])
+        elif what == "variable" and edited.variables:
+            edited.variables[0].max_amount = Money(rng.randint(0, 800))
+        else:
+            edited.constraints.emergency_fund_months += 1
+
+        previous = inc.result
+        changes = inc.replan(edited)
+        assert changes.result == planner.build_plan(edited)
+        changed, removed = diff_items(previous.items, changes.result.items)
+        assert (changes.changed, changes.removed) == (changed, removed)
+        if what == "constraints":
+            assert changes.restarted_at is None and changes.result is previous
+        data = edited
+
+
+def test_projection_carries_remainder_and_savings_forward():
+    data = merge_with_defaults({
+        "incomes": [{"name": "Job", "amount": "3000"}],
+        "fixed": [{"name": "Rent", "amount": "1000"}],
+        "variables": [{"name": "Food", "min_amount": "300", "max_amount": "500"}],
+    })
+    months = list(Projector().project(data, 12))
+
+    assert [m.month for m in months] == list(range(1, 13))
+    assert months[0].carryover == Money("0")
+    # 3000 - 1000 rent - 300 savings - 500 food leaves 1200 for month 2
+    assert months[1].carryover == months[0].plan.summary.remaining == Money("1200")
+    assert months[1].plan.summary.total_income == Money("4200")
+    assert months[1].plan == Planner().build_plan(data.model_copy(update = {
+        "incomes": data.incomes + [Income(name = "Carryover", amount = Money("1200"))],
+    }))
+    assert months[-1].savings_balance == sum((m.plan.summary.savings for m in months), Money("0"))
+    assert months[0].emergency_fund_target == Money("3000")
+    assert not months[0].emergency_fund_met and months[-1].emergency_fund_met
+
+    # compact inputs (load_inputs(..., compact = True)) project the same way
+    records = list(Projector().project(PlanningInputRecord.from_model(data), 12))
+    assert [(m.plan.summary, m.savings_balance) for m in records] == [(m.plan.summary, m.savings_balance) for m in months]
+
+
+def test_parallel_planner_preserves_order_and_results():
+    raw = corpus(120, seed = 17)
+    raw[0]["incomes"][0]["amount"] = "1234.567"
+    mixed = [r if i % 2 else PlanningInput.model_validate(r) for i, r in enumerate(raw)]
+    runner = ParallelPlanner(workers = 2, chunk_size = 16)
+
+    assert runner.build_plans(mixed) == Planner().build_plans(raw)
+    assert sum(s.plans for s in runner.stats.values()) == len(raw)
+    compact = ParallelPlanner(workers = 2, chunk_size = 16, money = FastMoney, compact = True).build_plans(raw[:40])
+    assert [r.to_model() for r in compact] == Planner().build_plans(raw[:40])
+    assert all(type(r) is PlanResultRecord and type(r.summary.savings) is FastMoney for r in compact)
+    with pytest.raises(ValueError):
+        ParallelPlanner(money = Decimal)
+    data = PlanningInput.model_validate(raw[0])
+    assert decode_input(encode_input(data)) == data
+
+
+def test_canonical_digest_ignores_what_the_planner_ignores():
+    raw = corpus(1, seed = 2)[0]
+    raw["variables"] = [{"name": "Food", "min_amount": "100"}, {"name": "Fun", "priority": 5}, {"name": "gym", "max_amount": "40"}]
+    raw["incomes"] = [{"name": "A", "amount": "1000"}, {"name": "B", "amount": "250.50"}]
+    data = PlanningInput.model_validate(raw)
+
+    reordered = data.model_copy(deep = True)
+    reordered.variables.reverse()
+    reordered.incomes.reverse()
+    reordered.incomes[0].name = "Renamed"
+    reordered.incomes[1].amount = Money("1000.00")
+    reordered.constraints.emergency_fund_months = 12
+    assert canonical_digest(reordered) == canonical_digest(data)
+
+    changed = data.model_copy(deep = True)
+    changed.variables[0].min_amount = Money("101")
+    assert canonical_digest(changed) != canonical_digest(data)
+
+
+def test_caching_planner_lru_and_ttl():
+    now = [0.0]
+    cached = CachingPlanner(cache = PlanCache(maxsize = 2, ttl = 10, clock = lambda: now[0]))
+    a, b, c = [PlanningInput.model_validate(r) for r in corpus(3, seed = 9)]
+
+    assert cached.build_plan(a) == Planner().build_plan(a)
+    assert cached.build_plan(a) is cached.build_plan(a)
+    cached.build_plan(b)
+    cached.build_plan(c)  # evicts a
+    cached.build_plan(a)
+    now[0] = 11.0
+    cached.build_plan(a)  # expired
+
+    stats = cached.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations) == (2, 5, 2, 1)
+
+
+def test_disk_cache_is_shared_versioned_and_warm_starts(tmp_path):
+    inputs = [PlanningInput.model_validate(r) for r in corpus(6, seed = 4)]
+    keys = [canonical_digest(d) for d in inputs]
+    expected = [Planner().build_plan(d) for d in inputs]
+
+    writer = DiskPlanCache(str(tmp_path), max_entries = 4, evict_every = 1)
+    cached = CachingPlanner(disk = writer)
+    assert cached.build_plans(inputs) == expected
+
+    # a second connection (as another process would open) sees the same plans
+    reader = DiskPlanCache(str(tmp_path), max_entries = 4)
+    assert len(reader) == 4
+    assert reader.get(keys[-1]) == expected[-1]
+    assert reader.get(keys[0]) is None  # least recently used, evicted
+    assert DiskPlanCache(str(tmp_path), version = "other").get(keys[-1]) is None
+
+    # hits on recently used entries do not write; stale ones refresh last_used
+    def last_used(key):
+        with closing(sqlite3.connect(reader.path)) as db:
+            return db.execute("SELECT last_used FROM plans WHERE digest = ?", (key,)).fetchone()[0]
+    before = last_used(keys[-1])
+    reader.get(keys[-1])
+    assert last_used(keys[-1]) == before
+    DiskPlanCache(str(tmp_path), touch_interval = 0).get(keys[-1])
+    assert last_used(keys[-1]) > before
+
+    restarted = CachingPlanner(disk = reader)
+    assert restarted.warm_start() == 4
+    assert restarted.build_plan(inputs[-1]) == expected[-1]
+    assert restarted.stats.hits == 1
+
+    # only plain Money PlanResults can round-trip through the disk cache
+    for planner in (Planner(compact = True), Planner(indexed = True), Planner(money = FastMoney)):
+        with pytest.raises(ValueError):
+            CachingPlanner(planner, disk = reader)
+    assert CachingPlanner(Planner(compact = True)).build_plan(inputs[0]).to_model() == expected[0]
+
+
+def test_compact_records_match_pydantic_models():
+    inputs = [PlanningInput.model_validate(r) for r in corpus(100, seed = 8)]
+    records = [PlanningInputRecord.from_model(d) for d in inputs]
+    assert [r.to_model() for r in records] == inputs
+
+    expected = Planner().build_plans(inputs)
+    compact = Planner(compact = True).build_plans(records)
+    assert all(type(r) is PlanResultRecord for r in compact)
+    assert [r.to_model() for r in compact] == expected
+    assert [PlanResultRecord.from_model(r) for r in expected] == compact
+    assert Planner(compact = True).build_plans(records, engine = "numpy") == compact
+
+
+def test_indexed_result_merges_items_per_category():
+    data = PlanningInput.model_validate({
+        "incomes": [{"name": "Job", "amount": "3000"}],
+        "fixed": [{"name": "Rent", "amount": "1000"}],
+        "variables": [
+            {"name": "Food", "min_amount": "200", "max_amount": "500", "priority": 10},
+            {"name": "Fun", "max_amount": "300", "priority": 20},
+        ],
+        "preferences": {"savings_rate_min": 0.1, "round_to": "1.00"},
+    })
+    result = Planner(breakdown = True).build_plan(data)
+    plain = Planner().build_plan(data)
+    assert result.items == plain.items and result.summary == plain.summary
+
+    food = result.categories["Food"]
+    assert (food.allocated, food.floor, food.top_up) == (Money("500"), Money("200"), Money("300"))
+    assert result.categories["Rent"].floor is None
+    assert list(result.categories) == ["Rent", "Savings", "Food", "Fun"]
+    assert result.totals == {"fixed": Money("1000"), "savings": Money("300"), "variable": Money("800")}
+
+    raw = corpus(300, seed = 12)
+    expected = Planner(indexed = True).build_plans(raw)
+    assert [r.items for r in expected] == [r.items for r in Planner().build_plans(raw)]
+    assert Planner(indexed = True).build_plans(raw, engine = "numpy") == expected
+
+    # negative fixed amounts (refunds) are not allocations, in either engine
+    refund = data.model_copy(update = {"fixed": data.fixed + [FixedExpense(name = "Refund", amount = Money("-200"))]})
+    indexed = Planner(indexed = True)
+    assert indexed.build_plan(refund).totals["fixed"] == Money("1000")
+    assert indexed.build_plan(refund, engine = "numpy") == indexed.build_plan(refund)
+
+
+def test_variable_index_keeps_planner_order_across_edits():
+    key = lambda v: (v.priority, v.name.lower())
+    planner = Planner()
+    for raw in corpus(50, seed = 14):
+        data = PlanningInput.model_validate(raw)
+        assert planner.build_plan(data, index = VariableIndex(data.variables)) == planner.build_plan(data)
+
+    rng = random.Random(2)
+    variables, index = [], VariableIndex()
+    for _ in range(500):
+        if variables and rng.random() < 0.3:
+            name = rng.choice(variables).name
+            variables = [v for v in variables if v.name != name]
+            index.remove(name)
+        else:
+            v = VariableExpense(name = rng.choice("abcAB") + rng.choice("xyzX"), priority = rng.choice([1, 5, 9]))
+            variables.append(v)
+            index.insert(v)
+        assert index.ordered() == sorted(variables, key = key)
+    assert len(index) == len(variables)
+    assert [p for p, _ in index.buckets()] == sorted({v.priority for v in variables})
+
+
+def test_scenario_sweep_matches_one_plan_per_grid_point():
+    grid = {"savings_rate_min": [0, 0.1, 0.25], "round_to": ["0.01", "5"], "emergency_fund_months": [3, 6]}
+    sweep = ScenarioSweep(grid)
+    inputs = [PlanningInput.model_validate(r) for r in corpus(20, seed = 21)]
+    planner = Planner()
+    tables = [sweep.run(d) for d in inputs]
+    for data, table in zip(inputs, tables):
+        assert len(table) == sweep.size == 12
+        for row in table.as_dicts():
+            prefs = Preferences(savings_rate_min = row["savings_rate_min"], round_to = row["round_to"])
+            summary = planner.build_plan(data.model_copy(update = {"preferences": prefs})).summary
+            assert (row["total_income"], row["total_expenses"], row["savings"], row["remaining"]) == (
+                summary.total_income, summary.total_expenses, summary.savings, summary.remaining)
+            essential = sum((f.amount for f in data.fixed if f.essential), Money("0"))
+            assert row["emergency_fund_target"] == (essential * row["emergency_fund_months"]).round2()
+            assert row["housing_ok"] is None
+
+    housing = ScenarioSweep({"max_housing_ratio": [0.2, 0.5]}, housing = {"Rent"})
+    data = PlanningInput.model_validate({
+        "incomes": [{"name": "Job", "amount": "3000"}],
+        "fixed": [{"name": "Rent", "amount": "1000"}, {"name": "Bill 0", "amount": "500"}],
+        "variables": [],
+    })
+    assert housing.run(data).column("housing_ok") == [False, True]
+
+    assert [t for _, t in sweep.run_many(inputs, workers = 2, chunk_size = 3)] == tables
+    assert [t for _, t in housing.run_many([data], workers = 2)] == [housing.run(data)]
+    assert [ScenarioSweep(grid, engine = "numpy").run(d) for d in inputs[:5]] == tables[:5]
+    with pytest.raises(ValueError):
+        ScenarioSweep({"savings_rate": [0.1]})
+    with pytest.raises(ValueError):
+        planner.checkpoint(data, "summary")
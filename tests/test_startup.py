@@ -0,0 +1,64 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from src.budget_app.ui.startup import StartupProfile, startup_budget_ms
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(*args, timeout = 60):
+    return subprocess.run([sys.executable, *args], cwd = ROOT, capture_output = True, text = True, timeout = timeout)
+
+
+def test_heavy_optional_modules_load_on_first_use():
+    code = (
+        "import sys\n"
+        "from src.budget_app.ui.startup import PROFILE\n"
+        "PROFILE.enable()\n"
+        "import src.budget_app.ui.export_dialog, src.budget_app.ui.bridge, src.budget_app.ui.icons\n"
+        "PROFILE.disable()\n"
+        "print(sorted(m for m in ('reportlab', 'pyarrow', 'pandas', 'cairosvg', 'numpy') if m in sys.modules))\n"
+        "print(PROFILE.report())\n"
+        # helpers import what they need: no _require_* call has to come first
+        "from src.budget_app.utils import export\n"
+        "if export._HAS_PYARROW: export._item_schema()\n"
+        "if export._HAS_REPORTLAB: export._pdf_section(('1', [('Rent', 'fixed', '10.00')], ['0'] * 4), 'Plan')\n"
+    )
+    proc = _run("-c", code)
+    assert proc.returncode == 0, proc.stderr
+    lines = proc.stdout.splitlines()
+    assert lines[0] == "[]"
+    assert any(line.endswith("src.budget_app.utils.export") for line in lines)
+
+
+def test_disabled_profile_sections_are_shared_no_ops():
+    profile = StartupProfile()
+    assert profile.section("a") is profile.section("b")
+    with profile.section("a"):
+        pass
+    assert profile.sections == []
+
+
+def _has_display():
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        return False
+    try:
+        import tkinter
+        tkinter.Tk().destroy()
+    except Exception:
+        return False
+    return True
+
+
+@pytest.mark.skipif(not _has_display(), reason = "needs a display (run under xvfb-run in CI)")
+def test_startup_budget():
+    pytest.importorskip("ttkbootstrap")
+    _run("-m", "src.budget_app.app", "--startup-time")  # warm the icon cache and the OS file cache
+    proc = _run("-m", "src.budget_app.app", "--startup-time")
+    match = re.search(r"first frame after (\d+) ms", proc.stderr)
+    assert match, proc.stderr
+    assert int(match.group(1)) <= startup_budget_ms()
@@ -0,0 +1,81 @@
+from src.budget_app.ui.table_sync import TreeSync, VirtualRows
+
+COLUMNS = ("category", "amount", "percent")
+
+
+class FakeTree:
+    """The part of the ttk.Treeview API the helpers use, with a call log."""
+
+    def __init__(self):
+        self.children = []
+        self.values = {}
+        self.calls = []
+        self._next = 0
+
+    def insert(self, parent, index, values):
+        self._next += 1
+        iid = f"I{self._next}"
+        self.children.append(iid)
+        self.values[iid] = values
+        self.calls.append("insert")
+        return iid
+
+    def item(self, iid, values):
+        self.values[iid] = values
+        self.calls.append("item")
+
+    def move(self, iid, parent, index):
+        self.children.remove(iid)
+        self.children.insert(index, iid)
+        self.calls.append("move")
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.children.remove(iid)
+            del self.values[iid]
+        self.calls.append("delete")
+
+    def shown(self):
+        return [self.values[iid] for iid in self.children]
+
+
+def rows(*pairs):
+    return [{"category": c, "amount": a, "percent": "1.0%"} for c, a in pairs]
+
+
+def test_tree_sync_touches_only_changed_rows():
+    tree = FakeTree()
+    sync = TreeSync(tree, COLUMNS)
+    assert sync.update(rows(("Rent", "1500"), ("Food", "300"), ("Fun", "50"))) == (3, 0, 0, 0)
+
+    tree.calls.clear()
+    assert sync.update(rows(("Rent", "1500"), ("Food", "320"), ("Fun", "50"))) == (0, 1, 0, 0)
+    assert tree.calls == ["item"]
+
+    new = rows(("Savings", "400"), ("Rent", "1500"), ("Fun", "50"), ("Fun", "25"))
+    assert sync.update(new) == (2, 0, 1, 1)
+    assert tree.shown() == [tuple(r[c] for c in COLUMNS) for r in new]
+
+    tree.calls.clear()
+    assert sync.update(new) == (0, 0, 0, 0) and tree.calls == []
+
+
+def test_virtual_rows_materialize_only_the_visible_window():
+    tree = FakeTree()
+    virtual = VirtualRows(tree, COLUMNS, height = 10)
+    data = rows(*((f"M{m} cat", str(m)) for m in range(50_000)))
+    virtual.set_rows(data)
+    assert len(tree.children) == 10 and tree.shown()[0][0] == "M0 cat"
+
+    tree.calls.clear()
+    virtual.yview("moveto", "0.5")
+    assert virtual.offset == 25_000 and tree.shown()[0][0] == "M25000 cat"
+    assert tree.calls == ["item"] * 10
+
+    virtual.yview("scroll", "1", "pages")
+    assert tree.shown()[0][0] == "M25010 cat"
+    virtual.scroll(10 ** 6)
+    assert tree.shown()[-1][0] == "M49999 cat" and virtual.first_last() == (0.9998, 1.0)
+
+    virtual.clear()
+    assert tree.children == []
@@ -0,0 +1,122 @@
+import threading
+import time
+
+from src.budget_app.core.planner import Planner
+from src.budget_app.ui.bridge import build_plan_rows, form_to_input
+from src.budget_app.ui.tasks import BackgroundRunner, Debouncer
+from src.budget_app.utils.money import Money
+
+
+class FakeTk:
+    """Stands in for a Tk widget: after() callbacks run when pump() is called."""
+
+    def __init__(self):
+        self.calls = []
+
+    def after(self, ms, fn):
+        self.calls.append(fn)
+        return fn
+
+    def after_cancel(self, after_id):
+        self.calls.remove(after_id)
+
+    def pump(self, timeout = 5.0):
+        deadline = time.monotonic() + timeout
+        while self.calls and time.monotonic() < deadline:
+            self.calls.pop(0)()
+            time.sleep(0.001)
+
+
+def test_runner_drops_superseded_requests_and_reports_progress():
+    tk = FakeTk()
+    runner = BackgroundRunner(tk, poll_ms = 1)
+    started, release = threading.Event(), threading.Event()
+    seen_cancel = []
+
+    def slow(job, value):
+        started.set()
+        release.wait(5)
+        seen_cancel.append(job.cancelled)
+        return value
+
+    def fast(job, value):
+        job.report(1, 1)
+        return value
+
+    done, progress = [], []
+    runner.submit("plan", slow, "old", on_done = done.append)
+    started.wait(5)
+    runner.submit("plan", fast, "queued", on_done = done.append)   # superseded before it starts
+    runner.submit("plan", fast, "new", on_done = done.append, on_progress = lambda d, t: progress.append((d, t)))
+    release.set()
+    tk.pump()
+
+    assert done == ["new"] and progress == [(1, 1)]
+    assert seen_cancel == [True] and not runner.busy()
+    runner.shutdown()
+
+
+
+def test_runner_keeps_requests_under_different_keys():
+    tk = FakeTk()
+    runner = BackgroundRunner(tk, poll_ms = 1)
+    release = threading.Event()
+
+    def write(job, path):
+        release.wait(5)
+        return path
+
+    done = []
+    runner.submit("export-1", write, "a.csv", on_done = done.append)
+    runner.submit("export-2", write, "b.csv", on_done = done.append)
+    release.set()
+    tk.pump()
+
+    assert done == ["a.csv", "b.csv"] and not runner.busy()
+    runner.shutdown()
+
+def test_plan_job_turns_form_data_into_view_rows():
+    data = {
+        "income": [{"name": "Job", "period": "Month", "amount": 4000.0}, {"name": "Tips", "period": "Week", "amount": 60.0}],
+        "fixed": {"Rent": 1500.0, "Utilities": 0},
+        "prefs": {"Dining": 30, "Shopping": 20, "Transport": 30, "Savings": 20},
+        "constraints": {"Dining": {"min": 10, "max": 25}, "Shopping": {"min": 0, "max": 100}},
+    }
+    plan_input = form_to_input(data)
+    assert plan_input.incomes[1].amount == Money("260.00")
+    assert [f.name for f in plan_input.fixed] == ["Rent"]
+    dining = plan_input.variables[0]
+    assert (dining.min_amount, dining.max_amount) == (Money("276.00"), Money("690.00"))
+
+    class Job:
+        cancelled = False
+        def report(self, done, total = None):
+            pass
+
+    rows, notes = build_plan_rows(Job(), Planner(), data)
+    by_category = {r["category"]: r for r in rows}
+    assert by_category["Rent"]["amount"] == "1500.00"
+    assert by_category["Dining"]["amount"] == "690.00"
+    assert by_category["Savings"]["amount"] == "552.00"
+    assert by_category["Savings"]["percent"] == "13.0%"
+    assert build_plan_rows(Job(), Planner(indexed = True), data) == (rows, notes)
+
+
+def test_debouncer_coalesces_keystrokes_into_one_call():
+    tk = FakeTk()
+    fired = []
+    debounce = Debouncer(tk, 300, lambda: fired.append(len(fired)))
+
+    start = time.perf_counter()
+    for _ in range(200):
+        debounce.trigger()
+    per_keystroke = (time.perf_counter() - start) / 200
+    assert debounce.pending and len(tk.calls) == 1
+    assert per_keystroke < 0.016
+
+    tk.pump()
+    assert fired == [0] and not debounce.pending
+    debounce.trigger()
+    debounce.cancel()
+    tk.pump()
+    assert fired == [0]